@@ -5,6 +5,7 @@ import "../Utils/Owned.sol";
 import "../Utils/CloneFactory.sol";
 import "../interfaces/IERC20.sol";
 import "../interfaces/IPointList.sol";
+import "../interfaces/IMerkleList.sol";
 import "../Utils/SafeTransfer.sol";
 import "./MISOAccessControls.sol";
 
@@ -72,6 +73,9 @@ contract ListFactory is CloneFactory, SafeTransfer {
     /// @notice Any MISO dividends collected are sent here.
     address payable public misoDiv;
 
+    /// @notice Address of the Merkle list template.
+    address public merkleListTemplate;
+
     /// @notice Event emitted when point list is deployed.
     event PointListDeployed(address indexed operator, address indexed addr, address pointList, address owner);
 
@@ -81,6 +85,9 @@ contract ListFactory is CloneFactory, SafeTransfer {
     /// @notice Event emitted when minimum fee is updated.
     event MinimumFeeUpdated(uint oldFee, uint newFee);
 
+    /// @notice Event emitted when Merkle list template is updated.
+    event MerkleListTemplateUpdated(address oldTemplate, address newTemplate);
+
     /// @notice Event emitted when point list factory is initialised.
     event MisoInitListFactory();
 
@@ -137,6 +144,16 @@ contract ListFactory is CloneFactory, SafeTransfer {
         misoDiv = _divaddr;
     }
 
+    /**
+     * @notice Sets the Merkle list template.
+     * @param _merkleListTemplate Merkle list template address.
+     */
+    function setMerkleListTemplate(address _merkleListTemplate) external {
+        require(accessControls.hasAdminRole(msg.sender), "ListFactory: Sender must be admin");
+        emit MerkleListTemplateUpdated(merkleListTemplate, _merkleListTemplate);
+        merkleListTemplate = _merkleListTemplate;
+    }
+
     /**
      * @notice Deploys new point list.
      * @param _listOwner List owner address.
@@ -169,6 +186,30 @@ contract ListFactory is CloneFactory, SafeTransfer {
         }
     }
 
+    /**
+     * @notice Deploys new Merkle list, only the root of the (account, points) tree is stored.
+     * @param _listOwner List owner address.
+     * @param _merkleRoot Root of the (account, points) tree.
+     * @return merkleList Merkle list address.
+     */
+    function deployMerkleList(
+        address _listOwner,
+        bytes32 _merkleRoot
+    )
+        external payable returns (address merkleList)
+    {
+        require(msg.value >= minimumFee);
+        require(merkleListTemplate != address(0), "ListFactory: Merkle list template not set");
+        merkleList = createClone(merkleListTemplate);
+        IMerkleList(merkleList).initMerkleList(_listOwner, _merkleRoot);
+        isChild[address(merkleList)] = true;
+        lists.push(address(merkleList));
+        emit PointListDeployed(msg.sender, address(merkleList), merkleListTemplate, _listOwner);
+        if (msg.value > 0) {
+            misoDiv.transfer(msg.value);
+        }
+    }
+
     /**
      * @notice Funtion for transfering any ERC20 token.
      * @param _tokenAddress Address to send from.
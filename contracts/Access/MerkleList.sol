@@ -0,0 +1,126 @@
+pragma solidity 0.6.12;
+
+/**
+ * @dev GP Same as the PointList, but only the Merkle root of the (account, points) list is stored
+ * @dev Anyone can prove the points of an account, which are then kept in points[account]
+ * @dev Only accounts that take part pay for a storage slot, on their first proof
+ * @dev An operator can update the root, or set points directly like the PointList
+ * @dev A proof can only raise the points of an account, so points an operator set higher are kept
+ * @dev Lowering points, also after a new root, is left to the operator with setPoints
+ */
+
+import "../OpenZeppelin/math/SafeMath.sol";
+import "../OpenZeppelin/cryptography/MerkleProof.sol";
+import "./MISOAccessControls.sol";
+import "../interfaces/IMerkleList.sol";
+
+
+contract MerkleList is IMerkleList, MISOAccessControls {
+    using SafeMath for uint;
+
+    /// @notice Root of the tree of keccak256(abi.encodePacked(account, points)) leaves.
+    bytes32 public override merkleRoot;
+
+    /// @notice Maping an address to its proven or set number of points.
+    mapping(address => uint256) public points;
+
+    /// @notice Number of total proven or set points.
+    uint256 public totalPoints;
+
+    /// @notice Event emitted when points are updated.
+    event PointsUpdated(address indexed account, uint256 oldPoints, uint256 newPoints);
+
+    /// @notice Event emitted when the Merkle root is updated.
+    event MerkleRootUpdated(bytes32 oldMerkleRoot, bytes32 newMerkleRoot);
+
+
+    constructor() public {
+    }
+
+    /**
+     * @notice Initializes an empty list with admin address.
+     * @param _admin Admins address.
+     */
+    function initPointList(address _admin) public override {
+        initAccessControls(_admin);
+    }
+
+    /**
+     * @notice Initializes the list with admin address and Merkle root.
+     * @param _admin Admins address.
+     * @param _merkleRoot Root of the (account, points) tree.
+     */
+    function initMerkleList(address _admin, bytes32 _merkleRoot) public override {
+        initAccessControls(_admin);
+        emit MerkleRootUpdated(merkleRoot, _merkleRoot);
+        merkleRoot = _merkleRoot;
+    }
+
+    /**
+     * @notice Checks if account address is in the list (has any proven points).
+     * @param _account Account address.
+     * @return bool True or False.
+     */
+    function isInList(address _account) public view override returns (bool) {
+        return points[_account] > 0 ;
+    }
+
+    /**
+     * @notice Checks if account has more or equal proven points as the number given.
+     * @param _account Account address.
+     * @param _amount Desired amount of points.
+     * @return bool True or False.
+     */
+    function hasPoints(address _account, uint256 _amount) public view override returns (bool) {
+        return points[_account] >= _amount ;
+    }
+
+    /**
+     * @notice Updates the Merkle root, accounts can then prove their points in the new tree.
+     * @param _merkleRoot Root of the (account, points) tree.
+     */
+    function setMerkleRoot(bytes32 _merkleRoot) external {
+        require(hasAdminRole(msg.sender) || hasOperatorRole(msg.sender), "MerkleList.setMerkleRoot: Sender must be operator");
+        emit MerkleRootUpdated(merkleRoot, _merkleRoot);
+        merkleRoot = _merkleRoot;
+    }
+
+    /**
+     * @notice Proves the points of an account against the Merkle root and keeps them.
+     * @dev Does nothing if the account already has at least these points.
+     * @param _account Account address.
+     * @param _points Points of the account in the tree.
+     * @param _proof Sibling hashes from the leaf to the root.
+     */
+    function provePoints(address _account, uint256 _points, bytes32[] calldata _proof) external override {
+        if (points[_account] >= _points) {
+            return;
+        }
+        bytes32 leaf = keccak256(abi.encodePacked(_account, _points));
+        require(MerkleProof.verify(_proof, merkleRoot, leaf), "MerkleList.provePoints: Invalid proof");
+        _setPoints(_account, _points);
+    }
+
+    /**
+     * @notice Sets points to accounts in one batch.
+     * @param _accounts An array of accounts.
+     * @param _amounts An array of corresponding amounts.
+     */
+    function setPoints(address[] memory _accounts, uint256[] memory _amounts) external override {
+        require(hasAdminRole(msg.sender) || hasOperatorRole(msg.sender), "MerkleList.setPoints: Sender must be operator");
+        require(_accounts.length != 0);
+        require(_accounts.length == _amounts.length);
+        for (uint i = 0; i < _accounts.length; i++) {
+            if (_amounts[i] != points[_accounts[i]]) {
+                _setPoints(_accounts[i], _amounts[i]);
+            }
+        }
+    }
+
+    function _setPoints(address _account, uint256 _amount) private {
+        uint256 previousPoints = points[_account];
+        points[_account] = _amount;
+        totalPoints = totalPoints.sub(previousPoints).add(_amount);
+        emit PointsUpdated(_account, previousPoints, _amount);
+    }
+}
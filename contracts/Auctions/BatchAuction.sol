@@ -44,6 +44,7 @@ import "../Utils/BoringMath.sol";
 import "../Utils/BoringERC20.sol";
 import "../Utils/Documents.sol";
 import "../interfaces/IPointList.sol";
+import "../interfaces/IMerkleList.sol";
 import "../interfaces/IMisoMarket.sol";
 
 /// @notice Attribution to delta.financial
@@ -204,6 +205,48 @@ contract BatchAuction is  IMisoMarket, MISOAccessControls, SafeTransfer, Documen
         commitTokensFrom(msg.sender, _amount, readAndAgreedToMarketParticipationAgreement);
     }
 
+    /**
+     * @notice Proves the points of the beneficiary in a Merkle list, then commits ETH.
+     * @dev The proof is only checked once, the list keeps the proven points.
+     * @param _beneficiary Auction participant ETH address.
+     * @param _points Points of the beneficiary in the list.
+     * @param _proof Merkle proof of the points.
+     */
+    function commitEthWithProof(
+        address payable _beneficiary,
+        uint256 _points,
+        bytes32[] calldata _proof,
+        bool readAndAgreedToMarketParticipationAgreement
+    )
+        external payable
+    {
+        _provePoints(_beneficiary, _points, _proof);
+        commitEth(_beneficiary, readAndAgreedToMarketParticipationAgreement);
+    }
+
+    /**
+     * @notice Proves the points of the sender in a Merkle list, then commits approved ERC20 tokens.
+     * @param _amount Amount of tokens to commit.
+     * @param _points Points of the sender in the list.
+     * @param _proof Merkle proof of the points.
+     */
+    function commitTokensWithProof(
+        uint256 _amount,
+        uint256 _points,
+        bytes32[] calldata _proof,
+        bool readAndAgreedToMarketParticipationAgreement
+    )
+        external
+    {
+        _provePoints(msg.sender, _points, _proof);
+        commitTokensFrom(msg.sender, _amount, readAndAgreedToMarketParticipationAgreement);
+    }
+
+    function _provePoints(address _account, uint256 _points, bytes32[] calldata _proof) private {
+        require(marketStatus.usePointList, "BatchAuction: no point list");
+        IMerkleList(pointList).provePoints(_account, _points, _proof);
+    }
+
     /**
      * @notice Checks if amout not 0 and makes the transfer and adds commitment.
      * @dev Users must approve contract prior to committing tokens to auction.
@@ -48,6 +48,7 @@ import "../Utils/BoringMath.sol";
 import "../Utils/BoringERC20.sol";
 import "../Utils/Documents.sol";
 import "../interfaces/IPointList.sol";
+import "../interfaces/IMerkleList.sol";
 import "../interfaces/IMisoMarket.sol";
 
 /// @notice Attribution to delta.financial
@@ -85,9 +86,12 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
         uint128 commitmentsTotal;
         bool finalized;
         bool usePointList;
+        /// @dev Price drop per second, kept in sync with marketInfo and marketPrice.
+        uint112 priceDrop;
     }
 
-    MarketStatus public marketStatus;
+    /// @dev Read through marketStatus() and priceDrop(), so the public getter keeps its three values.
+    MarketStatus private packedStatus;
 
     /// @notice The token being sold.
     address public auctionToken; 
@@ -165,6 +169,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
 
         marketPrice.startPrice = BoringMath.to128(_startPrice);
         marketPrice.minimumPrice = BoringMath.to128(_minimumPrice);
+        _setPriceDrop();
 
         auctionToken = _token;
         paymentCurrency = _paymentCurrency;
@@ -199,8 +204,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
      * @return Average token price.
      */
     function tokenPrice() public view returns (uint256) {
-        return uint256(marketStatus.commitmentsTotal)
-            .mul(1e18).div(uint256(marketInfo.totalTokens));
+        return _tokenPrice(marketInfo, packedStatus);
     }
 
     /**
@@ -208,15 +212,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
      * @return Fixed start price or minimum price if outside of auction time, otherwise calculated current price.
      */
     function priceFunction() public view returns (uint256) {
-        /// @dev Return Auction Price
-        if (block.timestamp <= uint256(marketInfo.startTime)) {
-            return uint256(marketPrice.startPrice);
-        }
-        if (block.timestamp >= uint256(marketInfo.endTime)) {
-            return uint256(marketPrice.minimumPrice);
-        }
-
-        return _currentPrice();
+        return _priceFunction(marketInfo, marketPrice, packedStatus);
     }
 
     /**
@@ -224,11 +220,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
      * @return The bigger from tokenPrice and priceFunction.
      */
     function clearingPrice() public view returns (uint256) {
-        /// @dev If auction successful, return tokenPrice
-        if (tokenPrice() > priceFunction()) {
-            return tokenPrice();
-        }
-        return priceFunction();
+        return _clearingPrice(marketInfo, marketPrice, packedStatus);
     }
 
 
@@ -267,13 +259,16 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
         if(readAndAgreedToMarketParticipationAgreement == false) {
             revertBecauseUserDidNotProvideAgreement();
         }
+        /// @dev The market structs are read once for the whole commit.
+        MarketInfo memory _marketInfo = marketInfo;
+        MarketStatus memory _marketStatus = packedStatus;
         // Get ETH able to be committed
-        uint256 ethToTransfer = calculateCommitment(msg.value);
+        uint256 ethToTransfer = _calculateCommitment(msg.value, _marketInfo, marketPrice, _marketStatus);
 
         /// @notice Accept ETH Payments.
         uint256 ethToRefund = msg.value.sub(ethToTransfer);
         if (ethToTransfer > 0) {
-            _addCommitment(_beneficiary, ethToTransfer);
+            _addCommitment(_beneficiary, ethToTransfer, _marketInfo, _marketStatus);
         }
         /// @notice Return any ETH to be refunded.
         if (ethToRefund > 0) {
@@ -289,6 +284,48 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
         commitTokensFrom(msg.sender, _amount, readAndAgreedToMarketParticipationAgreement);
     }
 
+    /**
+     * @notice Proves the points of the beneficiary in a Merkle list, then commits ETH.
+     * @dev The proof is only checked once, the list keeps the proven points.
+     * @param _beneficiary Auction participant ETH address.
+     * @param _points Points of the beneficiary in the list.
+     * @param _proof Merkle proof of the points.
+     */
+    function commitEthWithProof(
+        address payable _beneficiary,
+        uint256 _points,
+        bytes32[] calldata _proof,
+        bool readAndAgreedToMarketParticipationAgreement
+    )
+        external payable
+    {
+        _provePoints(_beneficiary, _points, _proof);
+        commitEth(_beneficiary, readAndAgreedToMarketParticipationAgreement);
+    }
+
+    /**
+     * @notice Proves the points of the sender in a Merkle list, then commits approved ERC20 tokens.
+     * @param _amount Amount of tokens to commit.
+     * @param _points Points of the sender in the list.
+     * @param _proof Merkle proof of the points.
+     */
+    function commitTokensWithProof(
+        uint256 _amount,
+        uint256 _points,
+        bytes32[] calldata _proof,
+        bool readAndAgreedToMarketParticipationAgreement
+    )
+        external
+    {
+        _provePoints(msg.sender, _points, _proof);
+        commitTokensFrom(msg.sender, _amount, readAndAgreedToMarketParticipationAgreement);
+    }
+
+    function _provePoints(address _account, uint256 _points, bytes32[] calldata _proof) private {
+        require(packedStatus.usePointList, "DutchAuction: no point list");
+        IMerkleList(pointList).provePoints(_account, _points, _proof);
+    }
+
 
     /**
      * @notice Checks how much is user able to commit and processes that commitment.
@@ -307,24 +344,48 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
         if(readAndAgreedToMarketParticipationAgreement == false) {
             revertBecauseUserDidNotProvideAgreement();
         }
-        uint256 tokensToTransfer = calculateCommitment(_amount);
+        /// @dev The market structs are read once for the whole commit.
+        MarketInfo memory _marketInfo = marketInfo;
+        MarketStatus memory _marketStatus = packedStatus;
+        uint256 tokensToTransfer = _calculateCommitment(_amount, _marketInfo, marketPrice, _marketStatus);
         if (tokensToTransfer > 0) {
             _safeTransferFrom(paymentCurrency, msg.sender, tokensToTransfer);
-            _addCommitment(_from, tokensToTransfer);
+            _addCommitment(_from, tokensToTransfer, _marketInfo, _marketStatus);
         }
     }
 
     /**
-     * @notice Calculates the pricedrop factor.
+     * @notice Market dynamic variables.
+     * @return commitmentsTotal Total amount committed.
+     * @return finalized Whether the auction is finalized.
+     * @return usePointList Whether the point list is used.
+     */
+    function marketStatus() public view returns (uint128 commitmentsTotal, bool finalized, bool usePointList) {
+        MarketStatus memory _marketStatus = packedStatus;
+        return (_marketStatus.commitmentsTotal, _marketStatus.finalized, _marketStatus.usePointList);
+    }
+
+    /**
+     * @notice The pricedrop factor.
      * @return Value calculated from auction start and end price difference divided the auction duration.
      */
     function priceDrop() public view returns (uint256) {
+        return uint256(packedStatus.priceDrop);
+    }
+
+    /**
+     * @notice Stores the pricedrop factor, called whenever the auction times or prices change.
+     */
+    function _setPriceDrop() private {
         MarketInfo memory _marketInfo = marketInfo;
         MarketPrice memory _marketPrice = marketPrice;
 
         uint256 numerator = uint256(_marketPrice.startPrice.sub(_marketPrice.minimumPrice));
         uint256 denominator = uint256(_marketInfo.endTime.sub(_marketInfo.startTime));
-        return numerator / denominator;
+        uint256 _priceDrop = numerator / denominator;
+        /// @dev Packed next to commitmentsTotal, only a drop above 2^112 wei per second does not fit.
+        require(_priceDrop <= uint256(uint112(-1)), "DutchAuction: price drop too large");
+        packedStatus.priceDrop = uint112(_priceDrop);
     }
 
 
@@ -337,7 +398,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
         if (commitments[_user] == 0) return 0;
         uint256 unclaimedTokens = IERC20(auctionToken).balanceOf(address(this));
 
-        claimerCommitment = commitments[_user].mul(uint256(marketInfo.totalTokens)).div(uint256(marketStatus.commitmentsTotal));
+        claimerCommitment = commitments[_user].mul(uint256(marketInfo.totalTokens)).div(uint256(packedStatus.commitmentsTotal));
         claimerCommitment = claimerCommitment.sub(claimed[_user]);
 
         if(claimerCommitment > unclaimedTokens){
@@ -350,7 +411,9 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
      * @return Number of tokens commited.
      */
     function totalTokensCommitted() public view returns (uint256) {
-        return uint256(marketStatus.commitmentsTotal).mul(1e18).div(clearingPrice());
+        MarketStatus memory _marketStatus = packedStatus;
+        return uint256(_marketStatus.commitmentsTotal).mul(1e18)
+            .div(_clearingPrice(marketInfo, marketPrice, _marketStatus));
     }
 
     /**
@@ -359,11 +422,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
      * @return committed Amount allowed to commit.
      */
     function calculateCommitment(uint256 _commitment) public view returns (uint256 committed) {
-        uint256 maxCommitment = uint256(marketInfo.totalTokens).mul(clearingPrice()).div(1e18);
-        if (uint256(marketStatus.commitmentsTotal).add(_commitment) > maxCommitment) {
-            return maxCommitment.sub(uint256(marketStatus.commitmentsTotal));
-        }
-        return _commitment;
+        return _calculateCommitment(_commitment, marketInfo, marketPrice, packedStatus);
     }
 
     /**
@@ -379,7 +438,9 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
      * @return True if tokenPrice is bigger or equal clearingPrice.
      */
     function auctionSuccessful() public view returns (bool) {
-        return tokenPrice() >= clearingPrice();
+        MarketInfo memory _marketInfo = marketInfo;
+        MarketStatus memory _marketStatus = packedStatus;
+        return _tokenPrice(_marketInfo, _marketStatus) >= _clearingPrice(_marketInfo, marketPrice, _marketStatus);
     }
 
     /**
@@ -394,7 +455,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
      * @return Returns true if market has been finalized
      */
     function finalized() public view returns (bool) {
-        return marketStatus.finalized;
+        return packedStatus.finalized;
     }
 
     /**
@@ -404,31 +465,107 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
         return uint256(marketInfo.endTime) + 7 days < block.timestamp;
     }
 
+    /**
+     * @dev The price getters below work on copies of the market structs, so a caller
+     *      that already read them passes them on instead of reading storage again.
+     */
+    function _tokenPrice(
+        MarketInfo memory _marketInfo,
+        MarketStatus memory _marketStatus
+    )
+        private pure returns (uint256)
+    {
+        return uint256(_marketStatus.commitmentsTotal)
+            .mul(1e18).div(uint256(_marketInfo.totalTokens));
+    }
+
+    function _priceFunction(
+        MarketInfo memory _marketInfo,
+        MarketPrice memory _marketPrice,
+        MarketStatus memory _marketStatus
+    )
+        private view returns (uint256)
+    {
+        /// @dev Return Auction Price
+        if (block.timestamp <= uint256(_marketInfo.startTime)) {
+            return uint256(_marketPrice.startPrice);
+        }
+        if (block.timestamp >= uint256(_marketInfo.endTime)) {
+            return uint256(_marketPrice.minimumPrice);
+        }
+
+        return _currentPrice(_marketInfo, _marketPrice, _marketStatus);
+    }
+
+    function _clearingPrice(
+        MarketInfo memory _marketInfo,
+        MarketPrice memory _marketPrice,
+        MarketStatus memory _marketStatus
+    )
+        private view returns (uint256)
+    {
+        /// @dev If auction successful, return tokenPrice
+        uint256 averagePrice = _tokenPrice(_marketInfo, _marketStatus);
+        uint256 currentPrice = _priceFunction(_marketInfo, _marketPrice, _marketStatus);
+        return averagePrice > currentPrice ? averagePrice : currentPrice;
+    }
+
+    function _calculateCommitment(
+        uint256 _commitment,
+        MarketInfo memory _marketInfo,
+        MarketPrice memory _marketPrice,
+        MarketStatus memory _marketStatus
+    )
+        private view returns (uint256 committed)
+    {
+        uint256 maxCommitment = uint256(_marketInfo.totalTokens)
+            .mul(_clearingPrice(_marketInfo, _marketPrice, _marketStatus)).div(1e18);
+        if (uint256(_marketStatus.commitmentsTotal).add(_commitment) > maxCommitment) {
+            return maxCommitment.sub(uint256(_marketStatus.commitmentsTotal));
+        }
+        return _commitment;
+    }
+
     /**
      * @notice Calculates price during the auction.
      * @return Current auction price.
      */
-    function _currentPrice() private view returns (uint256) {
-        uint256 priceDiff = block.timestamp.sub(uint256(marketInfo.startTime)).mul(priceDrop());
-        return uint256(marketPrice.startPrice).sub(priceDiff);
+    function _currentPrice(
+        MarketInfo memory _marketInfo,
+        MarketPrice memory _marketPrice,
+        MarketStatus memory _marketStatus
+    )
+        private view returns (uint256)
+    {
+        uint256 priceDiff = block.timestamp.sub(uint256(_marketInfo.startTime))
+            .mul(uint256(_marketStatus.priceDrop));
+        return uint256(_marketPrice.startPrice).sub(priceDiff);
     }
 
     /**
      * @notice Updates commitment for this address and total commitment of the auction.
      * @param _addr Bidders address.
      * @param _commitment The amount to commit.
+     * @param _marketInfo Market info as read at the start of the commit.
+     * @param _marketStatus Market status as read at the start of the commit.
      */
-    function _addCommitment(address _addr, uint256 _commitment) internal {
-        require(block.timestamp >= uint256(marketInfo.startTime) && block.timestamp <= uint256(marketInfo.endTime), "DutchAuction: outside auction hours");
-        MarketStatus storage status = marketStatus;
-        
+    function _addCommitment(
+        address _addr,
+        uint256 _commitment,
+        MarketInfo memory _marketInfo,
+        MarketStatus memory _marketStatus
+    )
+        internal
+    {
+        require(block.timestamp >= uint256(_marketInfo.startTime) && block.timestamp <= uint256(_marketInfo.endTime), "DutchAuction: outside auction hours");
+
         uint256 newCommitment = commitments[_addr].add(_commitment);
-        if (status.usePointList) {
+        if (_marketStatus.usePointList) {
             require(IPointList(pointList).hasPoints(_addr, newCommitment));
         }
-        
+
         commitments[_addr] = newCommitment;
-        status.commitmentsTotal = BoringMath.to128(uint256(status.commitmentsTotal).add(_commitment));
+        packedStatus.commitmentsTotal = BoringMath.to128(uint256(_marketStatus.commitmentsTotal).add(_commitment));
         emit AddedCommitment(_addr, _commitment);
     }
 
@@ -445,7 +582,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
     function cancelAuction() public   nonReentrant  
     {
         require(hasAdminRole(msg.sender));
-        MarketStatus storage status = marketStatus;
+        MarketStatus storage status = packedStatus;
         require(!status.finalized, "DutchAuction: auction already finalized");
         require( uint256(status.commitmentsTotal) == 0, "DutchAuction: auction already committed" );
         _safeTokenPayment(auctionToken, wallet, uint256(marketInfo.totalTokens));
@@ -464,7 +601,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
                 || hasSmartContractRole(msg.sender) 
                 || wallet == msg.sender
                 || finalizeTimeExpired(), "DutchAuction: sender must be an admin");
-        MarketStatus storage status = marketStatus;
+        MarketStatus storage status = packedStatus;
 
         require(!status.finalized, "DutchAuction: auction already finalized");
         if (auctionSuccessful()) {
@@ -494,7 +631,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
      */
     function withdrawTokens(address payable beneficiary) public   nonReentrant  {
         if (auctionSuccessful()) {
-            require(marketStatus.finalized, "DutchAuction: not finalized");
+            require(packedStatus.finalized, "DutchAuction: not finalized");
             /// @dev Successful auction! Transfer claimed tokens.
             uint256 tokensToClaim = tokensClaimable(beneficiary);
             require(tokensToClaim > 0, "DutchAuction: No tokens to claim"); 
@@ -546,13 +683,13 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
 
     function enableList(bool _status) external {
         require(hasAdminRole(msg.sender));
-        marketStatus.usePointList = _status;
+        packedStatus.usePointList = _status;
     }
 
     function _setList(address _pointList) private {
         if (_pointList != address(0)) {
             pointList = _pointList;
-            marketStatus.usePointList = true;
+            packedStatus.usePointList = true;
         }
     }
 
@@ -571,11 +708,12 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
         require(_endTime < 10000000000, "DutchAuction: enter an unix timestamp in seconds, not miliseconds");
         require(_startTime >= block.timestamp, "DutchAuction: start time is before current time");
         require(_endTime > _startTime, "DutchAuction: end time must be older than start time");
-        require(marketStatus.commitmentsTotal == 0, "DutchAuction: auction cannot have already started");
+        require(packedStatus.commitmentsTotal == 0, "DutchAuction: auction cannot have already started");
 
         marketInfo.startTime = BoringMath.to64(_startTime);
         marketInfo.endTime = BoringMath.to64(_endTime);
-        
+        _setPriceDrop();
+
         emit AuctionTimeUpdated(_startTime,_endTime);
     }
 
@@ -588,10 +726,11 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
         require(hasAdminRole(msg.sender));
         require(_startPrice > _minimumPrice, "DutchAuction: start price must be higher than minimum price");
         require(_minimumPrice > 0, "DutchAuction: minimum price must be greater than 0"); 
-        require(marketStatus.commitmentsTotal == 0, "DutchAuction: auction cannot have already started");
+        require(packedStatus.commitmentsTotal == 0, "DutchAuction: auction cannot have already started");
 
         marketPrice.startPrice = BoringMath.to128(_startPrice);
         marketPrice.minimumPrice = BoringMath.to128(_minimumPrice);
+        _setPriceDrop();
 
         emit AuctionPriceUpdated(_startPrice,_minimumPrice);
     }
@@ -707,7 +846,7 @@ contract DutchAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Document
         uint64,
         bool 
     ) {
-        return (auctionToken, marketInfo.startTime, marketInfo.endTime, marketStatus.finalized);
+        return (auctionToken, marketInfo.startTime, marketInfo.endTime, packedStatus.finalized);
     }
 
     function getTotalTokens() external view returns(uint256) {
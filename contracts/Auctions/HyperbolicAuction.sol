@@ -175,12 +175,7 @@ contract HyperbolicAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Doc
         initAccessControls(_admin);
         
         _setList(_pointList);
-
-         // factor = exponent which can later be used to alter the curve
-        uint256 _duration = _endTime - _startTime;
-        uint256 _alpha = _duration.mul(_minimumPrice);
-        require (_alpha > 0);
-        marketPrice.alpha = BoringMath.to128(_alpha);
+        _setAlpha();
 
         _safeTransferFrom(_token, _funder, _totalTokens);
     }
@@ -223,6 +218,19 @@ contract HyperbolicAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Doc
         return priceFunction();
     }
 
+    /**
+     * @notice Stores alpha, the duration times the minimum price, so the price at any time
+     *         is alpha divided by the time elapsed. Called whenever the auction times or
+     *         minimum price change.
+     */
+    function _setAlpha() private {
+        MarketInfo memory _marketInfo = marketInfo;
+        uint256 _duration = uint256(_marketInfo.endTime - _marketInfo.startTime);
+        uint256 _alpha = _duration.mul(uint256(marketPrice.minimumPrice));
+        require (_alpha > 0);
+        marketPrice.alpha = BoringMath.to128(_alpha);
+    }
+
     /**
      * @notice Calculates price during the auction.
      * @return Current auction price.
@@ -546,7 +554,8 @@ contract HyperbolicAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Doc
 
         marketInfo.startTime = BoringMath.to64(_startTime);
         marketInfo.endTime = BoringMath.to64(_endTime);
-        
+        _setAlpha();
+
         emit AuctionTimeUpdated(_startTime,_endTime);
     }
 
@@ -560,6 +569,7 @@ contract HyperbolicAuction is IMisoMarket, MISOAccessControls, SafeTransfer, Doc
         require(marketStatus.commitmentsTotal == 0, "HyperbolicAuction: auction cannot have already started");
 
         marketPrice.minimumPrice = BoringMath.to128(_minimumPrice);
+        _setAlpha();
 
         emit AuctionPriceUpdated(_minimumPrice);
     }
@@ -0,0 +1,150 @@
+pragma solidity 0.6.12;
+pragma experimental ABIEncoderV2;
+
+
+//----------------------------------------------------------------------------------
+//    I n s t a n t
+//
+//        .:mmm.         .:mmm:.       .ii.  .:SSSSSSSSSSSSS.     .oOOOOOOOOOOOo.  
+//      .mMM'':Mm.     .:MM'':Mm:.     .II:  :SSs..........     .oOO'''''''''''OOo.
+//    .:Mm'   ':Mm.   .:Mm'   'MM:.    .II:  'sSSSSSSSSSSSSS:.  :OO.           .OO:
+//  .'mMm'     ':MM:.:MMm'     ':MM:.  .II:  .:...........:SS.  'OOo:.........:oOO'
+//  'mMm'        ':MMmm'         'mMm:  II:  'sSSSSSSSSSSSSS'     'oOOOOOOOOOOOO'  
+//
+//----------------------------------------------------------------------------------
+
+
+import "./MISOMasterChef.sol";
+
+
+// MISOMasterChef with lazy rewards, pools settle from a global rewards per alloc point.
+//
+// Deposits, withdrawals, tips and access controls are MISOMasterChef's, only the
+// reward accounting is overridden here.
+//
+// Rewards are accumulated once for the whole farm, per allocation point:
+//
+//   pool rewards = pool.allocPoint * (accRewardsPerAllocPoint - lastAccRewardsPerAllocPoint[pid])
+//
+// A pool only settles its share into `accRewardsPerShare` when it is touched, so
+// adding pools and changing allocations never loops over the other pools.
+
+contract MISOLazyMasterChef is MISOMasterChef {
+    using SafeMath for uint256;
+
+    // Accumulated tokens per allocation point over all pools, times 1e12.
+    uint256 public accRewardsPerAllocPoint;
+    // Last block number accRewardsPerAllocPoint was updated.
+    uint256 public lastRewardBlock;
+    // accRewardsPerAllocPoint when each pool was last settled.
+    mapping (uint256 => uint256) public lastAccRewardsPerAllocPoint;
+
+    // MISOFarmFactory template id
+    function farmTemplate() external view override returns (uint256) {
+        return 2;
+    }
+
+    function initFarm(
+        address _rewards,
+        uint256 _rewardsPerBlock,
+        uint256 _startBlock,
+        address _devaddr,
+        address _admin
+    ) public override {
+        super.initFarm(_rewards, _rewardsPerBlock, _startBlock, _devaddr, _admin);
+        lastRewardBlock = _startBlock;
+    }
+
+    function setBonus(
+        uint256 _bonusEndBlock,
+        uint256 _bonusMultiplier
+    ) public override {
+        // Blocks so far are accumulated with the old bonus
+        updateRewards();
+        super.setBonus(_bonusEndBlock, _bonusMultiplier);
+    }
+
+    // Add a new lp to the pool. Can only be called by the owner.
+    // The other pools never need an update, _withUpdate still settles all of them.
+    function addToken(uint256 _allocPoint, IERC20 _lpToken, bool _withUpdate) public override {
+        updateRewards();
+        super.addToken(_allocPoint, _lpToken, _withUpdate);
+        lastAccRewardsPerAllocPoint[poolInfo.length - 1] = accRewardsPerAllocPoint;
+    }
+
+    // Update the given pools token allocation point. Can only be called by the operator.
+    // Only this pool needs an update, _withUpdate still settles all of them.
+    function set(uint256 _pid, uint256 _allocPoint, bool _withUpdate) public override {
+        updatePool(_pid);
+        super.set(_pid, _allocPoint, _withUpdate);
+    }
+
+    // View function to see pending tokens on frontend.
+    function pendingRewards(uint256 _pid, address _user) external view override returns (uint256) {
+        PoolInfo storage pool = poolInfo[_pid];
+        UserInfo storage user = userInfo[_pid][_user];
+        uint256 accRewardsPerShare = pool.accRewardsPerShare;
+        uint256 lpSupply = pool.lpToken.balanceOf(address(this));
+        if (lpSupply != 0) {
+            uint256 rewardsAccum = _poolRewards(_pid, _currentAccRewardsPerAllocPoint());
+            accRewardsPerShare = accRewardsPerShare.add(rewardsAccum.mul(1e12).div(lpSupply));
+        }
+        return user.amount.mul(accRewardsPerShare).div(1e12).sub(user.rewardDebt);
+    }
+
+    // Update the rewards per allocation point of the whole farm.
+    // The rewards of every pool are owed from here, settled or not, so blocksRemaining never over-emits.
+    function updateRewards() public {
+        if (block.number <= lastRewardBlock) {
+            return;
+        }
+        if (totalAllocPoint > 0) {
+            uint256 farmRewards = getMultiplier(lastRewardBlock, block.number).mul(rewardsPerBlock);
+            if (devPercentage > 0) {
+                tips = tips.add(farmRewards.mul(devPercentage).div(1000));
+            }
+            totalRewardDebt = totalRewardDebt.add(farmRewards);
+            accRewardsPerAllocPoint = accRewardsPerAllocPoint.add(farmRewards.mul(1e12).div(totalAllocPoint));
+        }
+        lastRewardBlock = block.number;
+    }
+
+    // Update reward variables of the given pool to be up-to-date.
+    function updatePool(uint256 _pid) public override {
+        updateRewards();
+        _settlePool(_pid);
+    }
+
+    function _currentAccRewardsPerAllocPoint() internal view returns (uint256) {
+        if (block.number <= lastRewardBlock || totalAllocPoint == 0) {
+            return accRewardsPerAllocPoint;
+        }
+        uint256 multiplier = getMultiplier(lastRewardBlock, block.number);
+        return accRewardsPerAllocPoint.add(multiplier.mul(rewardsPerBlock).mul(1e12).div(totalAllocPoint));
+    }
+
+    // Rewards of the pool since it was last settled.
+    function _poolRewards(uint256 _pid, uint256 _accRewardsPerAllocPoint) internal view returns (uint256) {
+        return _accRewardsPerAllocPoint.sub(lastAccRewardsPerAllocPoint[_pid]).mul(poolInfo[_pid].allocPoint).div(1e12);
+    }
+
+    // Moves the pool share of the farm rewards into its accRewardsPerShare.
+    function _settlePool(uint256 _pid) internal {
+        if (lastAccRewardsPerAllocPoint[_pid] == accRewardsPerAllocPoint) {
+            return;
+        }
+        PoolInfo storage pool = poolInfo[_pid];
+        uint256 rewardsAccum = _poolRewards(_pid, accRewardsPerAllocPoint);
+        lastAccRewardsPerAllocPoint[_pid] = accRewardsPerAllocPoint;
+        pool.lastRewardBlock = block.number;
+        uint256 lpSupply = pool.lpToken.balanceOf(address(this));
+        if (lpSupply == 0) {
+            /// @dev No one was staked to earn them, they go back to the farm with their tips, as on MISOMasterChef.
+            totalRewardDebt = totalRewardDebt.sub(rewardsAccum);
+            uint256 returnedTips = rewardsAccum.mul(devPercentage).div(1000);
+            tips = returnedTips < tips ? tips.sub(returnedTips) : 0;
+            return;
+        }
+        pool.accRewardsPerShare = pool.accRewardsPerShare.add(rewardsAccum.mul(1e12).div(lpSupply));
+    }
+}
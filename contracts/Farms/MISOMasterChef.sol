@@ -1,4 +1,5 @@
 pragma solidity 0.6.12;
+pragma experimental ABIEncoderV2;
 
 
 //----------------------------------------------------------------------------------
@@ -21,7 +22,9 @@ import "../OpenZeppelin/access/Ownable.sol";
 
 import "../Access/MISOAccessControls.sol";
 import "../interfaces/IMisoFarm.sol";
+import "../interfaces/IMisoFarmFactory.sol";
 import "../Utils/SafeTransfer.sol";
+import "../Utils/BoringBatchable.sol";
 
 
 // MasterChef is the master of Rewards. He can make Rewards and he is a fair guy.
@@ -37,10 +40,12 @@ import "../Utils/SafeTransfer.sol";
 // MISO Update - Dev tips parameterised
 // MISO Update - Replaced owner with access controls
 // MISO Update - Added SafeTransfer
+// MISO Update - Multi pool deposit, withdraw and harvest, BoringBatchable
 
-contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
+contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer, BoringBatchable {
     using SafeMath for uint256;
     using SafeERC20 for IERC20;
+    using EnumerableSet for EnumerableSet.UintSet;
 
 
     // Info of each user.
@@ -87,8 +92,6 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
     // Total rewards debt.
     uint256 public totalRewardDebt;
 
-    // MISOFarmFactory template id
-    uint256 public constant override farmTemplate = 1;
     // For initial setup
     bool private initialised;
 
@@ -100,18 +103,42 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
     uint256 public totalAllocPoint;
     // The block number when rewards mining starts.
     uint256 public startBlock;
+    // MISOFarmFactory that deployed the farm, told when users join or leave the farm.
+    address public farmFactory;
+    // Set on contracts deployed directly rather than cloned, they never take a farm factory.
+    bool private farmFactoryLocked;
+    // Pools each user has LP tokens staked in.
+    mapping (address => EnumerableSet.UintSet) private userPools;
 
     event Deposit(address indexed user, uint256 indexed pid, uint256 amount);
     event Withdraw(address indexed user, uint256 indexed pid, uint256 amount);
     event EmergencyWithdraw(address indexed user, uint256 indexed pid, uint256 amount);
 
+    // MISOFarmFactory template id
+    function farmTemplate() external view virtual override returns (uint256) {
+        return 1;
+    }
+
+    /// @dev Clones do not run the constructor, so only the templates and farms deployed directly are locked.
+    constructor() public {
+        farmFactoryLocked = true;
+    }
+
+    // Called by MISOFarmFactory in the same transaction it clones the farm,
+    // so no one else can get to a factory deployed farm first.
+    function initFarmFactory() external override {
+        require(!farmFactoryLocked, "MasterChef.initFarmFactory: Farm was not cloned by a factory");
+        require(!initialised && farmFactory == address(0), "MasterChef.initFarmFactory: Already initialised");
+        farmFactory = msg.sender;
+    }
+
     function initFarm(
         address _rewards,
         uint256 _rewardsPerBlock,
         uint256 _startBlock,
         address _devaddr,
         address _admin
-    ) public {
+    ) public virtual {
         require(!initialised);
         rewards = IERC20(_rewards);
         totalAllocPoint = 0;
@@ -160,7 +187,7 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
     function setBonus(
         uint256 _bonusEndBlock,
         uint256 _bonusMultiplier
-    ) public {
+    ) public virtual {
         require(
             hasAdminRole(msg.sender),
             "MasterChef.setBonus: Sender must be admin"
@@ -176,7 +203,7 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
 
     // Add a new lp to the pool. Can only be called by the owner.
     // XXX DO NOT add the same LP token more than once. Rewards will be messed up if you do.
-    function addToken(uint256 _allocPoint, IERC20 _lpToken, bool _withUpdate) public  {
+    function addToken(uint256 _allocPoint, IERC20 _lpToken, bool _withUpdate) public virtual {
         require(
             hasAdminRole(msg.sender),
             "MasterChef.addToken: Sender must be admin"
@@ -195,7 +222,7 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
     }
 
     // Update the given pools token allocation point. Can only be called by the operator.
-    function set(uint256 _pid, uint256 _allocPoint, bool _withUpdate) public  {
+    function set(uint256 _pid, uint256 _allocPoint, bool _withUpdate) public virtual {
         require(
             hasOperatorRole(msg.sender) ,
             "MasterChef.set: Sender must be admin"
@@ -232,7 +259,7 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
     }
 
     // View function to see pending tokens on frontend.
-    function pendingRewards(uint256 _pid, address _user) external view returns (uint256) {
+    function pendingRewards(uint256 _pid, address _user) external view virtual returns (uint256) {
         PoolInfo storage pool = poolInfo[_pid];
         UserInfo storage user = userInfo[_pid][_user];
         uint256 accRewardsPerShare = pool.accRewardsPerShare;
@@ -254,7 +281,7 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
     }
 
     // Update reward variables of the given pool to be up-to-date.
-    function updatePool(uint256 _pid) public {
+    function updatePool(uint256 _pid) public virtual {
         PoolInfo storage pool = poolInfo[_pid];
         if (block.number <= pool.lastRewardBlock) {
             return;
@@ -276,17 +303,55 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
 
     // Deposit LP tokens to MasterChef for rewards allocation.
     function deposit(uint256 _pid, uint256 _amount) public {
+        _payRewards(_deposit(_pid, _amount));
+    }
+
+    // Withdraw LP tokens from MasterChef.
+    function withdraw(uint256 _pid, uint256 _amount) public {
+        _payRewards(_withdraw(_pid, _amount));
+    }
+
+    // Deposit LP tokens to several pools, rewards of all of them are paid in one transfer.
+    function depositMany(uint256[] calldata _pids, uint256[] calldata _amounts) external {
+        require(_pids.length == _amounts.length, "MasterChef.depositMany: Array lengths must match");
+        uint256 pending = 0;
+        for (uint256 i = 0; i < _pids.length; i++) {
+            pending = pending.add(_deposit(_pids[i], _amounts[i]));
+        }
+        _payRewards(pending);
+    }
+
+    // Withdraw LP tokens from several pools, rewards of all of them are paid in one transfer.
+    function withdrawMany(uint256[] calldata _pids, uint256[] calldata _amounts) external {
+        require(_pids.length == _amounts.length, "MasterChef.withdrawMany: Array lengths must match");
+        uint256 pending = 0;
+        for (uint256 i = 0; i < _pids.length; i++) {
+            pending = pending.add(_withdraw(_pids[i], _amounts[i]));
+        }
+        _payRewards(pending);
+    }
+
+    // Claim the rewards of several pools in one transfer, same as deposit(pid, 0) for each.
+    function harvestMany(uint256[] calldata _pids) external {
+        uint256 pending = 0;
+        for (uint256 i = 0; i < _pids.length; i++) {
+            pending = pending.add(_deposit(_pids[i], 0));
+        }
+        _payRewards(pending);
+    }
+
+    // Returns the rewards owed to the sender, the caller pays them.
+    function _deposit(uint256 _pid, uint256 _amount) internal returns (uint256 pending) {
         PoolInfo storage pool = poolInfo[_pid];
         UserInfo storage user = userInfo[_pid][msg.sender];
         updatePool(_pid);
         if (user.amount > 0) {
-            uint256 pending = user.amount.mul(pool.accRewardsPerShare).div(1e12).sub(user.rewardDebt);
-            if(pending > 0) {
-                totalRewardDebt = totalRewardDebt.sub(pending);
-                safeRewardsTransfer(msg.sender, pending);
-            }
+            pending = user.amount.mul(pool.accRewardsPerShare).div(1e12).sub(user.rewardDebt);
         }
         if(_amount > 0) {
+            if (user.amount == 0) {
+                _updateUserPools(_pid, msg.sender, _amount);
+            }
             pool.lpToken.safeTransferFrom(address(msg.sender), address(this), _amount);
             user.amount = user.amount.add(_amount);
         }
@@ -294,25 +359,31 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
         emit Deposit(msg.sender, _pid, _amount);
     }
 
-    // Withdraw LP tokens from MasterChef.
-    function withdraw(uint256 _pid, uint256 _amount) public {
+    // Returns the rewards owed to the sender, the caller pays them.
+    function _withdraw(uint256 _pid, uint256 _amount) internal returns (uint256 pending) {
         PoolInfo storage pool = poolInfo[_pid];
         UserInfo storage user = userInfo[_pid][msg.sender];
         require(user.amount >= _amount, "withdraw: not good");
         updatePool(_pid);
-        uint256 pending = user.amount.mul(pool.accRewardsPerShare).div(1e12).sub(user.rewardDebt);
-        if(pending > 0) {
-            totalRewardDebt = totalRewardDebt.sub(pending);
-            safeRewardsTransfer(msg.sender, pending);
-        }
+        pending = user.amount.mul(pool.accRewardsPerShare).div(1e12).sub(user.rewardDebt);
         if(_amount > 0) {
             user.amount = user.amount.sub(_amount);
+            if (user.amount == 0) {
+                _updateUserPools(_pid, msg.sender, 0);
+            }
             pool.lpToken.safeTransfer(address(msg.sender), _amount);
         }
         user.rewardDebt = user.amount.mul(pool.accRewardsPerShare).div(1e12);
         emit Withdraw(msg.sender, _pid, _amount);
     }
 
+    function _payRewards(uint256 _pending) internal {
+        if(_pending > 0) {
+            totalRewardDebt = totalRewardDebt.sub(_pending);
+            safeRewardsTransfer(msg.sender, _pending);
+        }
+    }
+
     // Withdraw without caring about rewards. EMERGENCY ONLY.
     function emergencyWithdraw(uint256 _pid) public {
         PoolInfo storage pool = poolInfo[_pid];
@@ -320,10 +391,34 @@ contract MISOMasterChef is IMisoFarm, MISOAccessControls, SafeTransfer {
         uint256 amount = user.amount;
         user.amount = 0;
         user.rewardDebt = 0;
+        _updateUserPools(_pid, msg.sender, 0);
         pool.lpToken.safeTransfer(address(msg.sender), amount);
         emit EmergencyWithdraw(msg.sender, _pid, amount);
     }
 
+    // Pools the user has LP tokens staked in.
+    function getUserPids(address _user) external view returns (uint256[] memory pids) {
+        EnumerableSet.UintSet storage pools = userPools[_user];
+        pids = new uint256[](pools.length());
+        for (uint256 i = 0; i < pids.length; i++) {
+            pids[i] = pools.at(i);
+        }
+    }
+
+    // Keeps the user pools in sync with the staked amount, the farm factory
+    // is told about the first pool a user stakes in and the last one left.
+    // The index is best effort, a failing factory never blocks deposits or withdrawals.
+    function _updateUserPools(uint256 _pid, address _user, uint256 _amount) internal {
+        EnumerableSet.UintSet storage pools = userPools[_user];
+        if (_amount > 0) {
+            if (pools.add(_pid) && pools.length() == 1 && farmFactory != address(0)) {
+                try IMisoFarmFactory(farmFactory).addUserFarm(_user) {} catch {}
+            }
+        } else if (pools.remove(_pid) && pools.length() == 0 && farmFactory != address(0)) {
+            try IMisoFarmFactory(farmFactory).removeUserFarm(_user) {} catch {}
+        }
+    }
+
     // Safe rewards transfer function, just in case if rounding error causes pool to not have enough tokens.
     function safeRewardsTransfer(address _to, uint256 _amount) internal {
         uint256 rewardsBal = rewards.balanceOf(address(this));
@@ -161,6 +161,9 @@ interface IMisoFarmFactory {
     function getTemplateId(address _farm) external view returns(uint256);
     function numberOfFarms() external view returns(uint256);
     function farms(uint256 _farmId) external view returns(address);
+    function numberOfTemplateFarms(uint256 _templateId) external view returns(uint256);
+    function templateFarms(uint256 _templateId, uint256 _farmId) external view returns(address);
+    function getUserFarms(address _user) external view returns(address[] memory);
 }
 
 interface IFarm {
@@ -176,6 +179,8 @@ interface IFarm {
     function bonusMultiplier() external view returns (uint256);
     function userInfo(uint256 pid, address _user) external view returns (uint256, uint256);
     function pendingRewards(uint256 _pid, address _user) external view returns (uint256);
+    function getUserPids(address _user) external view returns (uint256[] memory);
+    function farmFactory() external view returns (address);
 }
 
 contract FarmHelper is BaseHelper, TokenHelper {
@@ -281,6 +286,34 @@ contract FarmHelper is BaseHelper, TokenHelper {
         return getFarms(pageSize, pageNbr, 0);
     }
 
+    function getFarmsByTemplate(
+        uint256 _templateId,
+        uint256 pageSize,
+        uint256 pageNbr,
+        uint256 offset
+    ) public view returns(FarmInfo[] memory) {
+        uint256 numberOfFarms = farmFactory.numberOfTemplateFarms(_templateId);
+        uint256 startIdx = (pageNbr * pageSize) + offset;
+        uint256 endIdx = startIdx + pageSize;
+
+        FarmInfo[] memory infos;
+
+        if (endIdx > numberOfFarms) {
+            endIdx = numberOfFarms;
+        }
+        if(endIdx < startIdx) {
+            return infos;
+        }
+        infos = new FarmInfo[](endIdx - startIdx);
+
+        for (uint256 farmIdx = 0; farmIdx + startIdx < endIdx; farmIdx++) {
+            address farmAddr = farmFactory.templateFarms(_templateId, farmIdx + startIdx);
+            infos[farmIdx] = _farmInfo(farmAddr);
+        }
+
+        return infos;
+    }
+
     function _farmInfo(address _farmAddr) private view returns(FarmInfo memory farmInfo) {
             IFarm farm = IFarm(_farmAddr);
 
@@ -324,32 +357,66 @@ contract FarmHelper is BaseHelper, TokenHelper {
         return (farmInfo, userInfos);
     }
 
+    /// @notice Pools the user has LP tokens staked in. Farms that do not report their users
+    ///         to the farm factory, such as farms deployed before the index, list all their pools.
     function getUserPoolsInfos(address _user) public view returns(UserPoolsInfo[] memory) {
-        uint256 numberOfFarms = farmFactory.numberOfFarms();
-
-        UserPoolsInfo[] memory infos = new UserPoolsInfo[](numberOfFarms);
+        address[] memory userFarms;
+        try farmFactory.getUserFarms(_user) returns (address[] memory _userFarms) {
+            userFarms = _userFarms;
+        } catch {
+            userFarms = new address[](0);
+        }
 
+        uint256 numberOfFarms = farmFactory.numberOfFarms();
+        address[] memory unindexedFarms = new address[](numberOfFarms);
+        uint256 numberOfUnindexed = 0;
         for (uint256 i = 0; i < numberOfFarms; i++) {
             address farmAddr = farmFactory.farms(i);
-            IFarm farm = IFarm(farmAddr);
-            uint256 poolLength = farm.poolLength();
-            uint256[] memory totalStaked = new uint256[](poolLength);
-            uint256[] memory pendingRewards = new uint256[](poolLength);
-            uint256[] memory pids = new uint256[](poolLength);
+            if (!_reportsUsers(farmAddr)) {
+                unindexedFarms[numberOfUnindexed] = farmAddr;
+                numberOfUnindexed++;
+            }
+        }
+
+        UserPoolsInfo[] memory infos = new UserPoolsInfo[](userFarms.length + numberOfUnindexed);
 
+        for (uint256 i = 0; i < userFarms.length; i++) {
+            infos[i] = _getUserPoolsInfo(userFarms[i], IFarm(userFarms[i]).getUserPids(_user), _user);
+        }
+        for (uint256 i = 0; i < numberOfUnindexed; i++) {
+            uint256 poolLength = IFarm(unindexedFarms[i]).poolLength();
+            uint256[] memory pids = new uint256[](poolLength);
             for(uint256 j = 0; j < poolLength; j++) {
-                (address stakingToken,,,) = farm.poolInfo(j);
-                (totalStaked[j],) = farm.userInfo(j, _user);
-                pendingRewards[j] = farm.pendingRewards(j, _user);
                 pids[j] = j;
             }
-            infos[i].totalStaked = totalStaked;
-            infos[i].pendingRewards = pendingRewards;
-            infos[i].pids = pids;
-            infos[i].farm = farmAddr;
+            infos[userFarms.length + i] = _getUserPoolsInfo(unindexedFarms[i], pids, _user);
         }
         return infos;
     }
+
+    function _getUserPoolsInfo(address _farm, uint256[] memory _pids, address _user) internal view returns(UserPoolsInfo memory info) {
+        IFarm farm = IFarm(_farm);
+        uint256[] memory totalStaked = new uint256[](_pids.length);
+        uint256[] memory pendingRewards = new uint256[](_pids.length);
+
+        for(uint256 j = 0; j < _pids.length; j++) {
+            (totalStaked[j],) = farm.userInfo(_pids[j], _user);
+            pendingRewards[j] = farm.pendingRewards(_pids[j], _user);
+        }
+        info.totalStaked = totalStaked;
+        info.pendingRewards = pendingRewards;
+        info.pids = _pids;
+        info.farm = _farm;
+    }
+
+    /// @dev True when the farm tells this farm factory about its users, set by initFarmFactory.
+    function _reportsUsers(address _farm) internal view returns(bool) {
+        try IFarm(_farm).farmFactory() returns (address _farmFactory) {
+            return _farmFactory == address(farmFactory);
+        } catch {
+            return false;
+        }
+    }
 }
 
 //==================
@@ -370,9 +437,12 @@ interface IMisoMarketFactory {
     function getMarkets() external view returns(address[] memory);
     function numberOfAuctions() external view returns(uint256);
     function auctions(uint256) external view returns(address);
+    function numberOfTemplateAuctions(uint256 _templateId) external view returns(uint256);
+    function templateAuctions(uint256 _templateId, uint256) external view returns(address);
 }
 
 interface IMisoMarket {
+    function marketTemplate() external view returns (uint256);
     function paymentCurrency() external view returns (address) ;
     function auctionToken() external view returns (address) ;
     function marketPrice() external view returns (uint128, uint128);
@@ -430,6 +500,12 @@ contract MarketHelper is BaseHelper, TokenHelper, DocumentHepler {
 
     address constant ETH_ADDRESS = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE;
 
+    /// @dev marketTemplate() of each auction type.
+    uint256 constant CROWDSALE = 1;
+    uint256 constant DUTCH_AUCTION = 2;
+    uint256 constant BATCH_AUCTION = 3;
+    uint256 constant HYPERBOLIC_AUCTION = 4;
+
     struct CrowdsaleInfo {
         address addr;
         address paymentCurrency;
@@ -521,6 +597,9 @@ contract MarketHelper is BaseHelper, TokenHelper, DocumentHepler {
         uint256 launched;
     }
 
+    /// @notice Lifecycle of a market, derived from its times at the current block.
+    enum MarketLifecycle { Upcoming, Live, Ended, Finalized }
+
     struct UserMarketInfo {
         uint256 commitments;
         uint256 tokensClaimable;
@@ -572,6 +651,86 @@ contract MarketHelper is BaseHelper, TokenHelper, DocumentHepler {
         return infos;
     }
 
+    function getMarketsByTemplate(
+        uint256 _templateId,
+        uint256 pageSize,
+        uint256 pageNbr,
+        uint256 offset
+    ) public view returns (MarketBaseInfo[] memory) {
+        uint256 marketsLength = market.numberOfTemplateAuctions(_templateId);
+        uint256 startIdx = (pageNbr * pageSize) + offset;
+        uint256 endIdx = startIdx + pageSize;
+        MarketBaseInfo[] memory infos;
+        if (endIdx > marketsLength) {
+            endIdx = marketsLength;
+        }
+        if(endIdx < startIdx) {
+            return infos;
+        }
+        infos = new MarketBaseInfo[](endIdx - startIdx);
+
+        for (uint256 marketIdx = 0; marketIdx + startIdx < endIdx; marketIdx++) {
+            address marketAddress = market.templateAuctions(_templateId, marketIdx + startIdx);
+            infos[marketIdx] = _getMarketInfo(marketAddress);
+        }
+
+        return infos;
+    }
+
+    /**
+     * @notice Pages over the markets of a template that are in a lifecycle state.
+     * @dev The lifecycle moves with the block time, so it is checked while scanning
+     *      instead of being indexed. Only matching markets are read in full.
+     * @param _templateId Auction template ID, or 0 for markets of every template.
+     * @param _lifecycle Lifecycle state to list.
+     * @param cursor Index to start scanning from, 0 for the first page.
+     * @param pageSize Maximum number of markets to return.
+     * @return infos Matching markets.
+     * @return nextCursor Cursor for the next page, the number of markets once all are scanned.
+     */
+    function getMarketsByLifecycle(
+        uint256 _templateId,
+        MarketLifecycle _lifecycle,
+        uint256 cursor,
+        uint256 pageSize
+    ) public view returns (MarketBaseInfo[] memory infos, uint256 nextCursor) {
+        uint256 marketsLength = _templateId == 0
+            ? market.numberOfAuctions()
+            : market.numberOfTemplateAuctions(_templateId);
+        infos = new MarketBaseInfo[](pageSize);
+        uint256 count;
+
+        for (nextCursor = cursor; nextCursor < marketsLength && count < pageSize; nextCursor++) {
+            address marketAddress = _templateId == 0
+                ? market.auctions(nextCursor)
+                : market.templateAuctions(_templateId, nextCursor);
+            (, uint64 startTime, uint64 endTime, bool finalized) = IBaseAuction(marketAddress)
+                .getBaseInformation();
+            if (_marketLifecycle(startTime, endTime, finalized) == _lifecycle) {
+                infos[count] = _getMarketInfo(marketAddress);
+                count++;
+            }
+        }
+
+        /// @dev Trim the unused entries of the last page.
+        assembly {
+            mstore(infos, count)
+        }
+    }
+
+    function _marketLifecycle(uint64 _startTime, uint64 _endTime, bool _finalized) private view returns (MarketLifecycle) {
+        if (_finalized) {
+            return MarketLifecycle.Finalized;
+        }
+        if (block.timestamp < _startTime) {
+            return MarketLifecycle.Upcoming;
+        }
+        if (block.timestamp <= _endTime) {
+            return MarketLifecycle.Live;
+        }
+        return MarketLifecycle.Ended;
+    }
+
     function _getMarketInfo(address _marketAddress) private view returns (MarketBaseInfo memory marketInfo) {
             uint64 templateId = market.getMarketTemplateId(_marketAddress);
             address auctionToken;
@@ -591,6 +750,10 @@ contract MarketHelper is BaseHelper, TokenHelper, DocumentHepler {
     }
 
     function getCrowdsaleInfo(address _crowdsale) public view returns (CrowdsaleInfo memory) {
+        return _getCrowdsaleInfo(_crowdsale, true);
+    }
+
+    function _getCrowdsaleInfo(address _crowdsale, bool _withDocuments) private view returns (CrowdsaleInfo memory) {
         ICrowdsale crowdsale = ICrowdsale(_crowdsale);
         CrowdsaleInfo memory info;
 
@@ -610,12 +773,19 @@ contract MarketHelper is BaseHelper, TokenHelper, DocumentHepler {
         }
         info.paymentCurrencyInfo = paymentCurrencyInfo;
 
-        info.documents = getDocuments(_crowdsale);
+        if (_withDocuments) {
+            info.documents = getDocuments(_crowdsale);
+        }
 
         return info;
     }
 
     function getDutchAuctionInfo(address payable _dutchAuction) public view returns (DutchAuctionInfo memory)
+    {
+        return _getDutchAuctionInfo(_dutchAuction, true);
+    }
+
+    function _getDutchAuctionInfo(address _dutchAuction, bool _withDocuments) private view returns (DutchAuctionInfo memory)
     {
         IDutchAuction dutchAuction = IDutchAuction(_dutchAuction);
         DutchAuctionInfo memory info;
@@ -639,12 +809,19 @@ contract MarketHelper is BaseHelper, TokenHelper, DocumentHepler {
             paymentCurrencyInfo = getTokenInfo(paymentCurrency);
         }
         info.paymentCurrencyInfo = paymentCurrencyInfo;
-        info.documents = getDocuments(_dutchAuction);
+        if (_withDocuments) {
+            info.documents = getDocuments(_dutchAuction);
+        }
 
         return info;
     }
 
     function getBatchAuctionInfo(address payable _batchAuction) public view returns (BatchAuctionInfo memory) 
+    {
+        return _getBatchAuctionInfo(_batchAuction, true);
+    }
+
+    function _getBatchAuctionInfo(address _batchAuction, bool _withDocuments) private view returns (BatchAuctionInfo memory)
     {
         IBatchAuction batchAuction = IBatchAuction(_batchAuction);
         BatchAuctionInfo memory info;
@@ -667,12 +844,19 @@ contract MarketHelper is BaseHelper, TokenHelper, DocumentHepler {
             paymentCurrencyInfo = getTokenInfo(paymentCurrency);
         }
         info.paymentCurrencyInfo = paymentCurrencyInfo;
-        info.documents = getDocuments(_batchAuction);
+        if (_withDocuments) {
+            info.documents = getDocuments(_batchAuction);
+        }
 
         return info;
     }
 
     function getHyperbolicAuctionInfo(address payable _hyperbolicAuction) public view returns (HyperbolicAuctionInfo memory)
+    {
+        return _getHyperbolicAuctionInfo(_hyperbolicAuction, true);
+    }
+
+    function _getHyperbolicAuctionInfo(address _hyperbolicAuction, bool _withDocuments) private view returns (HyperbolicAuctionInfo memory)
     {
         IHyperbolicAuction hyperbolicAuction = IHyperbolicAuction(_hyperbolicAuction);
         HyperbolicAuctionInfo memory info;
@@ -696,11 +880,62 @@ contract MarketHelper is BaseHelper, TokenHelper, DocumentHepler {
             paymentCurrencyInfo = getTokenInfo(paymentCurrency);
         }
         info.paymentCurrencyInfo = paymentCurrencyInfo;
-        info.documents = getDocuments(_hyperbolicAuction);
+        if (_withDocuments) {
+            info.documents = getDocuments(_hyperbolicAuction);
+        }
 
         return info;
     }
 
+    /**
+     * @notice Reads the details of many markets of any type in one call.
+     * @dev Each market is dispatched on its marketTemplate() type. The infos of each
+     *      type keep the order of `_markets`, `marketTemplates` gives the type at
+     *      every position so the caller can interleave them again.
+     * @param _markets Market addresses.
+     * @param _withDocuments Whether to include each market's documents.
+     */
+    function getMarketInfos(address[] memory _markets, bool _withDocuments)
+        public
+        view
+        returns (
+            uint256[] memory marketTemplates,
+            CrowdsaleInfo[] memory crowdsales,
+            DutchAuctionInfo[] memory dutchAuctions,
+            BatchAuctionInfo[] memory batchAuctions,
+            HyperbolicAuctionInfo[] memory hyperbolicAuctions
+        )
+    {
+        /// @dev Number of markets of each type, indexed by marketTemplate().
+        uint256[5] memory counts;
+        marketTemplates = new uint256[](_markets.length);
+        for (uint256 i = 0; i < _markets.length; i++) {
+            marketTemplates[i] = IMisoMarket(_markets[i]).marketTemplate();
+            require(marketTemplates[i] >= CROWDSALE && marketTemplates[i] <= HYPERBOLIC_AUCTION, "MISOHelper: Unknown market template");
+            counts[marketTemplates[i]]++;
+        }
+
+        crowdsales = new CrowdsaleInfo[](counts[CROWDSALE]);
+        dutchAuctions = new DutchAuctionInfo[](counts[DUTCH_AUCTION]);
+        batchAuctions = new BatchAuctionInfo[](counts[BATCH_AUCTION]);
+        hyperbolicAuctions = new HyperbolicAuctionInfo[](counts[HYPERBOLIC_AUCTION]);
+
+        uint256[5] memory filled;
+        for (uint256 i = 0; i < _markets.length; i++) {
+            uint256 marketTemplate = marketTemplates[i];
+            if (marketTemplate == CROWDSALE) {
+                crowdsales[filled[marketTemplate]] = _getCrowdsaleInfo(_markets[i], _withDocuments);
+            } else if (marketTemplate == DUTCH_AUCTION) {
+                dutchAuctions[filled[marketTemplate]] = _getDutchAuctionInfo(_markets[i], _withDocuments);
+            } else if (marketTemplate == BATCH_AUCTION) {
+                batchAuctions[filled[marketTemplate]] = _getBatchAuctionInfo(_markets[i], _withDocuments);
+            } else {
+                hyperbolicAuctions[filled[marketTemplate]] = _getHyperbolicAuctionInfo(_markets[i], _withDocuments);
+            }
+            filled[marketTemplate]++;
+        }
+    }
+
     function getUserMarketInfo(address _action, address _user) public view returns(UserMarketInfo memory userInfo) {
         IMisoMarket market = IMisoMarket(_action);
         userInfo.commitments = market.commitments(_user);
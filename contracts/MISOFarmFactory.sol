@@ -43,8 +43,10 @@ pragma solidity 0.6.12;
 import "./Utils/CloneFactory.sol";
 import "./interfaces/IMisoFarm.sol";
 import "./Access/MISOAccessControls.sol";
+import "./OpenZeppelin/utils/EnumerableSet.sol";
 
 contract MISOFarmFactory is CloneFactory {
+    using EnumerableSet for EnumerableSet.AddressSet;
 
     /// @notice Responsible for access rights to the contract.
     MISOAccessControls public accessControls;
@@ -87,6 +89,12 @@ contract MISOFarmFactory is CloneFactory {
     /// @notice Any MISO dividends collected are sent here.
     address payable public misoDiv;
 
+    /// @notice Farms created using the factory, by template id.
+    mapping(uint256 => address[]) public templateFarms;
+
+    /// @notice Farms each user has LP tokens staked in, as reported by the farms.
+    mapping(address => EnumerableSet.AddressSet) private userFarms;
+
     /// @notice Event emitted when first initializing the Miso Farm Factory.
     event MisoInitFarmFactory(address sender);
 
@@ -218,6 +226,35 @@ contract MISOFarmFactory is CloneFactory {
         address payable _integratorFeeAccount
     )
         public payable returns (address farm)
+    {
+        farm = _deployFarm(_templateId, _integratorFeeAccount, false, bytes32(0));
+    }
+
+    /**
+     * @notice Deploys a farm corresponding to the _templateId at an address known in advance.
+     * @dev The address only depends on the factory, the template, the sender and the salt.
+     * @param _templateId Template id of the farm to create.
+     * @param _integratorFeeAccount Address to pay the fee to.
+     * @param _salt Salt chosen by the sender, can only be used once per sender.
+     * @return farm address.
+     */
+    function deployFarmWithSalt(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bytes32 _salt
+    )
+        public payable returns (address farm)
+    {
+        farm = _deployFarm(_templateId, _integratorFeeAccount, true, _salt);
+    }
+
+    function _deployFarm(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bool _useSalt,
+        bytes32 _salt
+    )
+        internal returns (address farm)
     {
         /// @dev If the contract is locked, only admin and minters can deploy. 
         if (locked) {
@@ -236,9 +273,17 @@ contract MISOFarmFactory is CloneFactory {
             integratorFee = misoFee * integratorFeePct / 1000;
             misoFee = misoFee - integratorFee;
         }
-        farm = createClone(farmTemplates[_templateId]);
+        if (_useSalt) {
+            /// @dev The sender is part of the salt, so no one else can take the address.
+            farm = createClone2(farmTemplates[_templateId], keccak256(abi.encodePacked(msg.sender, _salt)));
+        } else {
+            farm = createClone(farmTemplates[_templateId]);
+        }
+        /// @dev Farms that do not report their users do not implement this.
+        try IMisoFarm(farm).initFarmFactory() {} catch {}
         farmInfo[address(farm)] = Farm(true, _templateId, farms.length);
         farms.push(address(farm));
+        templateFarms[_templateId].push(address(farm));
         emit FarmCreated(msg.sender, address(farm), farmTemplates[_templateId]);
         if (misoFee > 0) {
             misoDiv.transfer(misoFee);
@@ -267,6 +312,45 @@ contract MISOFarmFactory is CloneFactory {
         IMisoFarm(farm).initFarm(_data);
     }
 
+    /**
+     * @notice Creates a farm corresponding to the _templateId at an address known in advance.
+     * @dev Initializes farm with the parameters passed.
+     * @param _templateId Template id of the farm to create.
+     * @param _integratorFeeAccount Address to pay the fee to.
+     * @param _data Data to be passed to the farm contract for init.
+     * @param _salt Salt chosen by the sender, can only be used once per sender.
+     * @return farm address.
+     */
+    function createFarmWithSalt(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bytes calldata _data,
+        bytes32 _salt
+    )
+        external payable returns (address farm)
+    {
+        farm = deployFarmWithSalt(_templateId, _integratorFeeAccount, _salt);
+        IMisoFarm(farm).initFarm(_data);
+    }
+
+    /**
+     * @notice Called by a farm when a user stakes in it for the first time.
+     * @param _user User address.
+     */
+    function addUserFarm(address _user) external {
+        require(farmInfo[msg.sender].exists, "MISOFarmFactory: Sender must be a farm");
+        userFarms[_user].add(msg.sender);
+    }
+
+    /**
+     * @notice Called by a farm when a user has nothing staked in it anymore.
+     * @param _user User address.
+     */
+    function removeUserFarm(address _user) external {
+        require(farmInfo[msg.sender].exists, "MISOFarmFactory: Sender must be a farm");
+        userFarms[_user].remove(msg.sender);
+    }
+
     /**
      * @notice Function to add a farm template to create through factory.
      * @dev Should have operator access.
@@ -333,6 +417,30 @@ contract MISOFarmFactory is CloneFactory {
         return farms.length;
     }
 
+    /**
+     * @notice Get the number of farms created from a template.
+     * @param _templateId Farm template ID.
+     * @return Farms count.
+     */
+    function numberOfTemplateFarms(uint256 _templateId) external view returns (uint256) {
+        return templateFarms[_templateId].length;
+    }
+
+    /**
+     * @notice Get the farms a user has LP tokens staked in.
+     * @dev Only farms that report their users are included.
+     * @param _user User address.
+     * @return Farm addresses.
+     */
+    function getUserFarms(address _user) external view returns (address[] memory) {
+        EnumerableSet.AddressSet storage set = userFarms[_user];
+        address[] memory userFarmList = new address[](set.length());
+        for (uint256 i = 0; i < userFarmList.length; i++) {
+            userFarmList[i] = set.at(i);
+        }
+        return userFarmList;
+    }
+
     /**
      * @notice Get all farm created in the factory.
      * @return created farms.
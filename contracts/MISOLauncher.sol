@@ -45,9 +45,10 @@ import "./Access/MISOAccessControls.sol";
 import "./interfaces/IERC20.sol";
 import "./interfaces/IMisoLiquidity.sol";
 import "./interfaces/IBentoBoxFactory.sol";
+import "./Utils/CloneFactory.sol";
 
 
-contract MISOLauncher is SafeTransfer {
+contract MISOLauncher is CloneFactory, SafeTransfer {
 
     using BoringMath for uint256;
     using BoringMath128 for uint128;
@@ -222,6 +223,35 @@ contract MISOLauncher is SafeTransfer {
         address payable _integratorFeeAccount
     )
         public payable returns (address launcher)
+    {
+        launcher = _deployLauncher(_templateId, _integratorFeeAccount, false, bytes32(0));
+    }
+
+    /**
+     * @notice Creates a new launcher from template _templateId at an address known in advance.
+     * @dev The address only depends on this contract, the template, the sender and the salt.
+     * @param _templateId Id of the template to create.
+     * @param _integratorFeeAccount Address to pay the fee to.
+     * @param _salt Salt chosen by the sender, can only be used once per sender.
+     * @return launcher Launcher address.
+     */
+    function deployLauncherWithSalt(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bytes32 _salt
+    )
+        public payable returns (address launcher)
+    {
+        launcher = _deployLauncher(_templateId, _integratorFeeAccount, true, _salt);
+    }
+
+    function _deployLauncher(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bool _useSalt,
+        bytes32 _salt
+    )
+        internal returns (address launcher)
     {
         /// @dev If the contract is locked, only admin and minters can deploy. 
         if (locked) {
@@ -242,8 +272,13 @@ contract MISOLauncher is SafeTransfer {
             integratorFee = misoFee * uint256(_launcherFees.integratorFeePct) / 1000;
             misoFee = misoFee - integratorFee;
         }
-        /// @dev Deploy using the BentoBox factory. 
-        launcher = bentoBox.deploy(launcherTemplate, "", false);
+        if (_useSalt) {
+            /// @dev The sender is part of the salt, so no one else can take the address.
+            launcher = createClone2(launcherTemplate, keccak256(abi.encodePacked(msg.sender, _salt)));
+        } else {
+            /// @dev Deploy using the BentoBox factory. 
+            launcher = bentoBox.deploy(launcherTemplate, "", false);
+        }
         launcherInfo[address(launcher)] = Launcher(true, BoringMath.to64(_templateId), BoringMath.to128(launchers.length));
         launchers.push(address(launcher));
         emit LauncherCreated(msg.sender, address(launcher), launcherTemplates[_templateId]);
@@ -277,11 +312,40 @@ contract MISOLauncher is SafeTransfer {
     {
 
         newLauncher = deployLauncher(_templateId, _integratorFeeAccount);
+        _initLauncher(newLauncher, _token, _tokenSupply, _data);
+    }
+
+    /**
+     * @notice Creates a new MISOLauncher using _templateId at an address known in advance.
+     * @dev Initializes auction with the parameters passed.
+     * @param _templateId Id of the auction template to create.
+     * @param _token The token address to be sold.
+     * @param _tokenSupply Amount of tokens to be sold at market.
+     * @param _integratorFeeAccount Address to send refferal bonus, if set.
+     * @param _data Data to be sent to template on Init.
+     * @param _salt Salt chosen by the sender, can only be used once per sender.
+     * @return newLauncher Launcher address.
+     */
+    function createLauncherWithSalt(
+        uint256 _templateId,
+        address _token,
+        uint256 _tokenSupply,
+        address payable _integratorFeeAccount,
+        bytes calldata _data,
+        bytes32 _salt
+    )
+        external payable returns (address newLauncher)
+    {
+        newLauncher = deployLauncherWithSalt(_templateId, _integratorFeeAccount, _salt);
+        _initLauncher(newLauncher, _token, _tokenSupply, _data);
+    }
+
+    function _initLauncher(address _launcher, address _token, uint256 _tokenSupply, bytes calldata _data) internal {
         if (_tokenSupply > 0) {
             _safeTransferFrom(_token, msg.sender, _tokenSupply);
-            require(IERC20(_token).approve(newLauncher, _tokenSupply), "1");
+            require(IERC20(_token).approve(_launcher, _tokenSupply), "1");
         }
-        IMisoLiquidity(newLauncher).initLauncher(_data);
+        IMisoLiquidity(_launcher).initLauncher(_data);
 
         if (_tokenSupply > 0) {
             uint256 remainingBalance = IERC20(_token).balanceOf(address(this));
@@ -289,7 +353,6 @@ contract MISOLauncher is SafeTransfer {
                 _safeTransfer(_token, msg.sender, remainingBalance);
             }
         }
-        return newLauncher;
     }
 
 
@@ -45,9 +45,10 @@ import "./Utils/SafeTransfer.sol";
 import "./interfaces/IMisoMarket.sol";
 import "./interfaces/IERC20.sol";
 import "./interfaces/IBentoBoxFactory.sol";
+import "./Utils/CloneFactory.sol";
 
 
-contract MISOMarket is SafeTransfer {
+contract MISOMarket is CloneFactory, SafeTransfer {
 
     using BoringMath for uint256;
     using BoringMath128 for uint128;
@@ -102,6 +103,9 @@ contract MISOMarket is SafeTransfer {
     ///@notice Any donations if set are sent here.
     address payable public misoDiv;
 
+    /// @notice Auctions created using factory, by template id.
+    mapping(uint256 => address[]) public templateAuctions;
+
     ///@notice Event emitted when first initializing the Market factory.
     event MisoInitMarket(address sender);
 
@@ -224,6 +228,35 @@ contract MISOMarket is SafeTransfer {
         address payable _integratorFeeAccount
     )
         public payable returns (address newMarket)
+    {
+        newMarket = _deployMarket(_templateId, _integratorFeeAccount, false, bytes32(0));
+    }
+
+    /**
+     * @notice Creates a new MISOMarket from template _templateId at an address known in advance.
+     * @dev The address only depends on this contract, the template, the sender and the salt.
+     * @param _templateId Id of the template to create.
+     * @param _integratorFeeAccount Address to pay the fee to.
+     * @param _salt Salt chosen by the sender, can only be used once per sender.
+     * @return newMarket Market address.
+     */
+    function deployMarketWithSalt(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bytes32 _salt
+    )
+        public payable returns (address newMarket)
+    {
+        newMarket = _deployMarket(_templateId, _integratorFeeAccount, true, _salt);
+    }
+
+    function _deployMarket(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bool _useSalt,
+        bytes32 _salt
+    )
+        internal returns (address newMarket)
     {
         /// @dev If the contract is locked, only admin and minters can deploy. 
         if (locked) {
@@ -245,10 +278,16 @@ contract MISOMarket is SafeTransfer {
             misoFee = misoFee - integratorFee;
         }
 
-        /// @dev Deploy using the BentoBox factory. 
-        newMarket = bentoBox.deploy(auctionTemplate, "", false);
+        if (_useSalt) {
+            /// @dev The sender is part of the salt, so no one else can take the address.
+            newMarket = createClone2(auctionTemplate, keccak256(abi.encodePacked(msg.sender, _salt)));
+        } else {
+            /// @dev Deploy using the BentoBox factory. 
+            newMarket = bentoBox.deploy(auctionTemplate, "", false);
+        }
         auctionInfo[address(newMarket)] = Auction(true, BoringMath.to64(_templateId), BoringMath.to128(auctions.length));
         auctions.push(address(newMarket));
+        templateAuctions[_templateId].push(address(newMarket));
         emit MarketCreated(msg.sender, address(newMarket), auctionTemplate);
         if (misoFee > 0) {
             misoDiv.transfer(misoFee);
@@ -278,11 +317,40 @@ contract MISOMarket is SafeTransfer {
         external payable returns (address newMarket)
     {
         newMarket = deployMarket(_templateId, _integratorFeeAccount);
+        _initMarket(newMarket, _token, _tokenSupply, _data);
+    }
+
+    /**
+     * @notice Creates a new MISOMarket using _templateId at an address known in advance.
+     * @dev Initializes auction with the parameters passed.
+     * @param _templateId Id of the auction template to create.
+     * @param _token The token address to be sold.
+     * @param _tokenSupply Amount of tokens to be sold at market.
+     * @param _integratorFeeAccount Address to send refferal bonus, if set.
+     * @param _data Data to be sent to template on Init.
+     * @param _salt Salt chosen by the sender, can only be used once per sender.
+     * @return newMarket Market address.
+     */
+    function createMarketWithSalt(
+        uint256 _templateId,
+        address _token,
+        uint256 _tokenSupply,
+        address payable _integratorFeeAccount,
+        bytes calldata _data,
+        bytes32 _salt
+    )
+        external payable returns (address newMarket)
+    {
+        newMarket = deployMarketWithSalt(_templateId, _integratorFeeAccount, _salt);
+        _initMarket(newMarket, _token, _tokenSupply, _data);
+    }
+
+    function _initMarket(address _market, address _token, uint256 _tokenSupply, bytes calldata _data) internal {
         if (_tokenSupply > 0) {
             _safeTransferFrom(_token, msg.sender, _tokenSupply);
-            require(IERC20(_token).approve(newMarket, _tokenSupply), "1");
+            require(IERC20(_token).approve(_market, _tokenSupply), "1");
         }
-        IMisoMarket(newMarket).initMarket(_data);
+        IMisoMarket(_market).initMarket(_data);
 
         if (_tokenSupply > 0) {
             uint256 remainingBalance = IERC20(_token).balanceOf(address(this));
@@ -290,7 +358,6 @@ contract MISOMarket is SafeTransfer {
                 _safeTransfer(_token, msg.sender, remainingBalance);
             }
         }
-        return newMarket;
     }
 
     /**
@@ -370,6 +437,15 @@ contract MISOMarket is SafeTransfer {
         return auctions.length;
     }
 
+    /**
+     * @notice Get the number of auctions created from a template.
+     * @param _templateId Auction template ID.
+     * @return Auction count.
+     */
+    function numberOfTemplateAuctions(uint256 _templateId) external view returns (uint256) {
+        return templateAuctions[_templateId].length;
+    }
+
     function minimumFee() external view returns(uint128) {
         return marketFees.minimumFee;
     }
@@ -214,6 +214,35 @@ contract MISOTokenFactory is CloneFactory, SafeTransfer{
         address payable _integratorFeeAccount
     )
         public payable returns (address token)
+    {
+        token = _deployToken(_templateId, _integratorFeeAccount, false, bytes32(0));
+    }
+
+    /**
+     * @notice Creates a token corresponding to template id at an address known in advance.
+     * @dev The address only depends on the factory, the template, the sender and the salt.
+     * @param _templateId Template id of token to create.
+     * @param _integratorFeeAccount Address to pay the fee to.
+     * @param _salt Salt chosen by the sender, can only be used once per sender.
+     * @return token Token address.
+     */
+    function deployTokenWithSalt(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bytes32 _salt
+    )
+        public payable returns (address token)
+    {
+        token = _deployToken(_templateId, _integratorFeeAccount, true, _salt);
+    }
+
+    function _deployToken(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bool _useSalt,
+        bytes32 _salt
+    )
+        internal returns (address token)
     {
         /// @dev If the contract is locked, only admin and minters can deploy. 
         if (locked) {
@@ -231,7 +260,12 @@ contract MISOTokenFactory is CloneFactory, SafeTransfer{
             integratorFee = misoFee * integratorFeePct / 1000;
             misoFee = misoFee - integratorFee;
         }
-        token = createClone(tokenTemplates[_templateId]);
+        if (_useSalt) {
+            /// @dev The sender is part of the salt, so no one else can take the address.
+            token = createClone2(tokenTemplates[_templateId], keccak256(abi.encodePacked(msg.sender, _salt)));
+        } else {
+            token = createClone(tokenTemplates[_templateId]);
+        }
         /// @dev GP: Triple check the token index is correct.
         tokenInfo[address(token)] = Token(true, _templateId, tokens.length);
         tokens.push(address(token));
@@ -261,10 +295,36 @@ contract MISOTokenFactory is CloneFactory, SafeTransfer{
     {
         emit TokenInitialized(address(token), _templateId, _data);
         token = deployToken(_templateId, _integratorFeeAccount);
-        IMisoToken(token).initToken(_data);
-        uint256 initialTokens = IERC20(token).balanceOf(address(this));
+        _initToken(token, _data);
+    }
+
+    /**
+     * @notice Creates a token corresponding to template id at an address known in advance.
+     * @dev Initializes token with parameters passed.
+     * @param _templateId Template id of token to create.
+     * @param _integratorFeeAccount Address to pay the fee to.
+     * @param _data Data to be passed to the token contract for init.
+     * @param _salt Salt chosen by the sender, can only be used once per sender.
+     * @return token Token address.
+     */
+    function createTokenWithSalt(
+        uint256 _templateId,
+        address payable _integratorFeeAccount,
+        bytes calldata _data,
+        bytes32 _salt
+    )
+        external payable returns (address token)
+    {
+        token = deployTokenWithSalt(_templateId, _integratorFeeAccount, _salt);
+        emit TokenInitialized(address(token), _templateId, _data);
+        _initToken(token, _data);
+    }
+
+    function _initToken(address _token, bytes calldata _data) internal {
+        IMisoToken(_token).initToken(_data);
+        uint256 initialTokens = IERC20(_token).balanceOf(address(this));
         if (initialTokens > 0 ) {
-            _safeTransfer(token, msg.sender, initialTokens);
+            _safeTransfer(_token, msg.sender, initialTokens);
         }
     }
 
@@ -42,6 +42,20 @@ contract CloneFactory {
     }
   }
 
+  /// @dev Same clone as createClone, deployed with CREATE2 so its address only depends
+  ///      on this contract, the target and the salt. Reverts if the salt was used before.
+  function createClone2(address target, bytes32 salt) internal returns (address result) {
+    bytes20 targetBytes = bytes20(target);
+    assembly {
+      let clone := mload(0x40)
+      mstore(clone, 0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000)
+      mstore(add(clone, 0x14), targetBytes)
+      mstore(add(clone, 0x28), 0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000)
+      result := create2(0, clone, 0x37, salt)
+    }
+    require(result != address(0), "CloneFactory: Salt already used");
+  }
+
   function isClone(address target, address query) internal view returns (bool result) {
     bytes20 targetBytes = bytes20(target);
     assembly {
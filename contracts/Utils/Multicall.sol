@@ -0,0 +1,69 @@
+pragma solidity 0.6.12;
+pragma experimental ABIEncoderV2;
+
+// solhint-disable avoid-low-level-calls
+
+/// @notice Aggregates calls to many contracts into one call, used to batch view calls
+///         into a single eth_call. Same interface as MakerDAO's Multicall2.
+contract Multicall {
+    struct Call {
+        address target;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    /// @notice Calls every target and reverts if any call fails.
+    /// @param calls Targets and calldata of each call.
+    /// @return blockNumber Block the calls were made in.
+    /// @return returnData Returned data of each call, mapped one-to-one to `calls`.
+    function aggregate(Call[] memory calls) public returns (uint256 blockNumber, bytes[] memory returnData) {
+        blockNumber = block.number;
+        returnData = new bytes[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory result) = calls[i].target.call(calls[i].callData);
+            require(success, "Multicall: call failed");
+            returnData[i] = result;
+        }
+    }
+
+    /// @notice Calls every target, a failed call is reported instead of reverting unless `requireSuccess` is set.
+    /// @param requireSuccess If True then reverts after a failed call.
+    /// @param calls Targets and calldata of each call.
+    /// @return returnData Success and returned data of each call, mapped one-to-one to `calls`.
+    function tryAggregate(bool requireSuccess, Call[] memory calls) public returns (Result[] memory returnData) {
+        returnData = new Result[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            (bool success, bytes memory result) = calls[i].target.call(calls[i].callData);
+            if (requireSuccess) {
+                require(success, "Multicall: call failed");
+            }
+            returnData[i] = Result(success, result);
+        }
+    }
+
+    /// @notice Same as tryAggregate, with the block the calls were made in.
+    function tryBlockAndAggregate(bool requireSuccess, Call[] memory calls)
+        public
+        returns (uint256 blockNumber, bytes32 blockHash, Result[] memory returnData)
+    {
+        blockNumber = block.number;
+        blockHash = blockhash(block.number);
+        returnData = tryAggregate(requireSuccess, calls);
+    }
+
+    function getBlockNumber() public view returns (uint256 blockNumber) {
+        blockNumber = block.number;
+    }
+
+    function getCurrentBlockTimestamp() public view returns (uint256 timestamp) {
+        timestamp = block.timestamp;
+    }
+
+    function getEthBalance(address addr) public view returns (uint256 balance) {
+        balance = addr.balance;
+    }
+}
@@ -0,0 +1,13 @@
+pragma solidity 0.6.12;
+
+import "./IPointList.sol";
+
+// ----------------------------------------------------------------------------
+// Merkle White List interface
+// ----------------------------------------------------------------------------
+
+interface IMerkleList is IPointList {
+    function merkleRoot() external view returns (bytes32);
+    function initMerkleList(address admin, bytes32 merkleRoot) external;
+    function provePoints(address account, uint256 points, bytes32[] calldata proof) external;
+}
@@ -6,5 +6,6 @@ interface IMisoFarm {
         bytes calldata data
     ) external;
     function farmTemplate() external view returns (uint256);
+    function initFarmFactory() external;
 
 }
\ No newline at end of file
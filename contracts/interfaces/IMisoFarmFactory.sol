@@ -0,0 +1,7 @@
+pragma solidity 0.6.12;
+
+interface IMisoFarmFactory {
+    function addUserFarm(address _user) external;
+    function removeUserFarm(address _user) external;
+    function getUserFarms(address _user) external view returns (address[] memory);
+}
@@ -0,0 +1,259 @@
+import numpy as np
+
+# Off-chain models of the auction price curves, for sweeping launch
+# parameters without a chain. Every argument can be a scalar or an array and
+# they are broadcast against each other, so one call evaluates a whole grid
+# of timestamps, commitment totals and auction parameters.
+#
+# All maths runs on object arrays of python ints, which matches the
+# contracts' uint256 arithmetic exactly, including the truncation of every
+# division. Where SafeMath would revert on an underflow, an overflow or a
+# division by zero, only that element is set to REVERTED and it stays
+# REVERTED through the rest of the maths, like a NaN, so one reverting
+# scenario does not stop the sweep. `reverted(values)` gives the mask of them.
+
+UINT256_MAX = 2 ** 256 - 1
+# DutchAuction stores its price drop per second in 112 bits
+UINT112_MAX = 2 ** 112 - 1
+TENPOW18 = 10 ** 18
+
+
+class _Reverted:
+    # Absorbs arithmetic and compares false, like a NaN without the numpy
+    # floating point warnings
+    def __repr__(self):
+        return "REVERTED"
+
+    def _absorb(self, other):
+        return self
+
+    def _false(self, other):
+        return False
+
+    __add__ = __radd__ = __sub__ = __rsub__ = __mul__ = __rmul__ = _absorb
+    __floordiv__ = __rfloordiv__ = __pow__ = __rpow__ = _absorb
+    __lt__ = __le__ = __gt__ = __ge__ = _false
+
+
+REVERTED = _Reverted()
+
+# NaN given as input is a revert too
+_to_int = np.frompyfunc(lambda value: REVERTED if value is REVERTED or value != value else int(value), 1, 1)
+_is_reverted = np.frompyfunc(lambda value: value is REVERTED, 1, 1)
+
+
+def uint_array(values):
+    # Converts numpy ints and floats to python ints, so nothing can overflow
+    return np.asarray(_to_int(np.asarray(values, dtype=object)), dtype=object)
+
+
+def reverted(values):
+    # Mask of the elements where the contract call would revert
+    return np.asarray(_is_reverted(np.asarray(values, dtype=object)), dtype=bool)
+
+
+def _revert_where(mask, values):
+    return np.where(mask, np.asarray(REVERTED, dtype=object), np.asarray(values, dtype=object))
+
+
+def _keep_reverted(values, *inputs):
+    # Comparisons with a REVERTED input pick either side, the result reverts
+    mask = np.zeros(np.shape(values), dtype=bool)
+    for value in inputs:
+        mask = np.logical_or(mask, reverted(value))
+    return _revert_where(mask, values)
+
+
+def _mul(a, b):
+    result = np.asarray(a * b, dtype=object)
+    return _revert_where(result > UINT256_MAX, result)
+
+
+def _sub(a, b, where=True):
+    # SafeMath sub, only checked where the contract would evaluate it
+    result = np.asarray(a - b, dtype=object)
+    return _revert_where(np.logical_and(where, result < 0), result)
+
+
+def _div(a, b, where=True):
+    # Division by zero reverts, only checked where the contract would evaluate it
+    b = np.asarray(b, dtype=object)
+    zero = b == 0
+    result = np.asarray(a // np.where(zero, 1, b), dtype=object)
+    return _revert_where(np.logical_and(where, zero), result)
+
+
+#####################################
+# Shared by all auction types
+######################################
+
+def token_price(commitments_total, total_tokens):
+    commitments_total, total_tokens = uint_array(commitments_total), uint_array(total_tokens)
+    return _div(_mul(commitments_total, TENPOW18), total_tokens)
+
+
+def clearing_price(price, commitments_total, total_tokens):
+    # `price` is the auction's priceFunction() at the same point in time
+    price = uint_array(price)
+    current_token_price = token_price(commitments_total, total_tokens)
+    return _keep_reverted(np.where(current_token_price > price, current_token_price, price),
+                          current_token_price, price)
+
+
+def auction_successful(price, commitments_total, total_tokens):
+    current_token_price = token_price(commitments_total, total_tokens)
+    current_clearing_price = clearing_price(price, commitments_total, total_tokens)
+    return _keep_reverted(current_token_price >= current_clearing_price, current_token_price, current_clearing_price)
+
+
+def calculate_commitment(commitment, price, commitments_total, total_tokens):
+    commitment, commitments_total = uint_array(commitment), uint_array(commitments_total)
+    max_commitment = _mul(uint_array(total_tokens), clearing_price(price, commitments_total, total_tokens)) // TENPOW18
+    capped = commitments_total + commitment > max_commitment
+    accepted = np.where(capped, _sub(max_commitment, commitments_total, where=capped), commitment)
+    return _keep_reverted(accepted, commitment, commitments_total, max_commitment)
+
+
+def _cap(claimable, unclaimed_tokens):
+    # Claims are capped by the auction token balance of the auction
+    return _keep_reverted(np.where(claimable > unclaimed_tokens, unclaimed_tokens, claimable),
+                          claimable, unclaimed_tokens)
+
+
+def replay_commitments(commitments, prices, total_tokens, commitments_total=0):
+    # Replays a stream of commits, the last axis being the order they are
+    # mined in. `prices` holds priceFunction() at the time of each commit.
+    # Returns the amount each commit was accepted for after the cap, or
+    # REVERTED, and the commitments total after each commit.
+    commitments, prices = uint_array(commitments), uint_array(prices)
+    commitments, prices = np.broadcast_arrays(commitments, prices)
+    commitments_total = uint_array(commitments_total)
+    accepted = np.empty(commitments.shape, dtype=object)
+    totals = np.empty(commitments.shape, dtype=object)
+    for i in range(commitments.shape[-1]):
+        accepted[..., i] = calculate_commitment(commitments[..., i], prices[..., i], commitments_total, total_tokens)
+        # A reverted commit leaves the total as it was
+        commitments_total = commitments_total + np.where(reverted(accepted[..., i]), 0, accepted[..., i])
+        totals[..., i] = commitments_total
+    return accepted, totals
+
+
+def tokens_claimable(commitments, commitments_total, total_tokens, claimed=0, unclaimed_tokens=None):
+    # `unclaimed_tokens` is the auction token balance of the auction contract,
+    # when it is not given the claim is not capped by it
+    commitments, commitments_total = uint_array(commitments), uint_array(commitments_total)
+    has_commitment = commitments != 0
+    claimable = _div(_mul(commitments, uint_array(total_tokens)), commitments_total, where=has_commitment)
+    claimable = _sub(claimable, uint_array(claimed), where=has_commitment)
+    if unclaimed_tokens is not None:
+        claimable = _cap(claimable, uint_array(unclaimed_tokens))
+    return np.where(has_commitment, claimable, 0)
+
+
+#####################################
+# Crowdsale
+######################################
+
+def crowdsale_tokens_claimable(commitments, rate, decimals, claimed=0, unclaimed_tokens=None):
+    # A fixed rate, so claims do not depend on the commitments total
+    commitments = uint_array(commitments)
+    claimable = _mul(commitments, 10 ** uint_array(decimals))
+    claimable = _div(claimable, uint_array(rate))
+    claimable = _sub(claimable, uint_array(claimed))
+    if unclaimed_tokens is not None:
+        claimable = _cap(claimable, uint_array(unclaimed_tokens))
+    return claimable
+
+
+#####################################
+# BatchAuction
+######################################
+
+def batch_tokens_claimable(commitments, commitments_total, total_tokens, claimed=0, unclaimed_tokens=None):
+    # Tokens are bought at the token price, which rounds differently from the
+    # share of the total used by the other auctions
+    commitments, commitments_total = uint_array(commitments), uint_array(commitments_total)
+    has_commitment = np.logical_and(commitments != 0, commitments_total != 0)
+    price = token_price(commitments_total, total_tokens)
+    claimable = _div(_mul(commitments, TENPOW18), price, where=has_commitment)
+    claimable = _sub(claimable, uint_array(claimed), where=has_commitment)
+    if unclaimed_tokens is not None:
+        claimable = _cap(claimable, uint_array(unclaimed_tokens))
+    return np.where(has_commitment, claimable, 0)
+
+
+#####################################
+# DutchAuction
+######################################
+
+def dutch_price_drop(start_time, end_time, start_price, minimum_price):
+    start_time, end_time = uint_array(start_time), uint_array(end_time)
+    price_drop = _div(_sub(uint_array(start_price), uint_array(minimum_price)), _sub(end_time, start_time))
+    return _revert_where(price_drop > UINT112_MAX, price_drop)
+
+
+def dutch_price_function(timestamps, start_time, end_time, start_price, minimum_price):
+    timestamps, start_time, end_time = uint_array(timestamps), uint_array(start_time), uint_array(end_time)
+    start_price, minimum_price = uint_array(start_price), uint_array(minimum_price)
+    price_drop = dutch_price_drop(start_time, end_time, start_price, minimum_price)
+
+    elapsed = np.where(timestamps > start_time, timestamps - start_time, 0)
+    current_price = start_price - elapsed * price_drop
+    price = np.where(timestamps >= end_time, minimum_price, current_price)
+    # initAuction stores the price drop, an auction it reverts for never exists
+    return _keep_reverted(np.where(timestamps <= start_time, start_price, price), price_drop)
+
+
+def simulate_dutch_auction(timestamps, commitments_total, start_time, end_time, total_tokens,
+                           start_price, minimum_price, commitments=None, claimed=0):
+    # Evaluates the DutchAuction view functions at every point of the grid.
+    # Per-bidder claims are only included when `commitments` are given.
+    price = dutch_price_function(timestamps, start_time, end_time, start_price, minimum_price)
+    result = {
+        "price": price,
+        "token_price": token_price(commitments_total, total_tokens),
+        "clearing_price": clearing_price(price, commitments_total, total_tokens),
+        "successful": auction_successful(price, commitments_total, total_tokens),
+    }
+    if commitments is not None:
+        result["tokens_claimable"] = tokens_claimable(commitments, commitments_total, total_tokens, claimed)
+    return result
+
+
+#####################################
+# HyperbolicAuction
+######################################
+
+def hyperbolic_alpha(start_time, end_time, minimum_price):
+    # The contract ignores its `_factor` init argument, the curve only
+    # depends on the duration and the minimum price
+    return _sub(uint_array(end_time), uint_array(start_time)) * uint_array(minimum_price)
+
+
+def hyperbolic_price_function(timestamps, start_time, end_time, minimum_price, alpha=None):
+    # `alpha` defaults to the value set by initAuction
+    timestamps, start_time, end_time = uint_array(timestamps), uint_array(start_time), uint_array(end_time)
+    minimum_price = uint_array(minimum_price)
+    if alpha is None:
+        alpha = hyperbolic_alpha(start_time, end_time, minimum_price)
+
+    elapsed = np.where(timestamps > start_time, timestamps - start_time, 1)
+    current_price = uint_array(alpha) // elapsed
+    price = np.where(timestamps >= end_time, minimum_price, current_price)
+    return np.where(timestamps <= start_time, UINT256_MAX, price)
+
+
+def simulate_hyperbolic_auction(timestamps, commitments_total, start_time, end_time, total_tokens,
+                                minimum_price, alpha=None, commitments=None, claimed=0):
+    # Evaluates the HyperbolicAuction view functions at every point of the grid.
+    # Per-bidder claims are only included when `commitments` are given.
+    price = hyperbolic_price_function(timestamps, start_time, end_time, minimum_price, alpha)
+    result = {
+        "price": price,
+        "token_price": token_price(commitments_total, total_tokens),
+        "clearing_price": clearing_price(price, commitments_total, total_tokens),
+        "successful": auction_successful(price, commitments_total, total_tokens),
+    }
+    if commitments is not None:
+        result["tokens_claimable"] = tokens_claimable(commitments, commitments_total, total_tokens, claimed)
+    return result
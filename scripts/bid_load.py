@@ -0,0 +1,232 @@
+from brownie import *
+from concurrent.futures import ThreadPoolExecutor
+from web3.exceptions import TransactionNotFound
+from .settings import ETH_ADDRESS
+import asyncio
+import bisect
+import random
+import time
+
+# Load generator for a launch: many bidders committing to a DutchAuction or
+# BatchAuction at once, on a local dev chain.
+#
+# Bids arrive following an arrival-rate model and are sent as plain
+# eth_sendTransaction requests with nonces tracked per bidder, so several
+# bids of one bidder can be pending together. At most `max_in_flight` bids
+# are between submission and inclusion at any time, later arrivals wait for
+# a slot. The time from submission to inclusion of every bid is recorded.
+#
+#   brownie run scripts/bid_load.py main <auction> 1000 50 --network development
+
+# Gas limit of a commit, set up front so bids are not estimated one by one
+COMMIT_GAS_LIMIT = 500000
+# Bids pending at once
+MAX_IN_FLIGHT = 64
+# Seconds between receipt polls of a pending bid
+RECEIPT_POLL_INTERVAL = 0.05
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+# Bids sent together by burst arrivals
+BURST_SIZE = 10
+
+
+def poisson_arrivals(rate):
+    # Seconds until each next bid, `rate` bids per second on average
+    while True:
+        yield random.expovariate(rate)
+
+
+def constant_arrivals(rate):
+    while True:
+        yield 1 / rate
+
+
+def burst_arrivals(rate, burst_size=BURST_SIZE):
+    # `burst_size` bids at once, with bursts `rate` bids per second apart
+    while True:
+        for _ in range(burst_size - 1):
+            yield 0
+        yield burst_size / rate
+
+
+# Arrival models by name, any other generator of delays can be passed as is
+ARRIVALS = {
+    "poisson": poisson_arrivals,
+    "constant": constant_arrivals,
+    "burst": burst_arrivals,
+}
+
+
+class LatencyHistogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = list(buckets)
+        # The last count is for latencies above every bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.latencies = []
+
+    def __len__(self):
+        return len(self.latencies)
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.latencies.append(seconds)
+
+    def percentile(self, p):
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(int(len(latencies) * p / 100), len(latencies) - 1)]
+
+    def report(self):
+        lines = []
+        for bound, count in zip(self.buckets + [float("inf")], self.counts):
+            lines.append("<= {:>6}s {:>8}".format(bound, count))
+        for p in (50, 90, 99):
+            lines.append("p{} {:.3f}s".format(p, self.percentile(p) or 0))
+        return "\n".join(lines)
+
+
+class NonceManager:
+    # Hands out nonces per account without asking the node each time. The
+    # lock of an account is held from taking a nonce until the transaction
+    # is accepted, so the node sees them in order.
+    def __init__(self):
+        self._next = {}
+        self._locks = {}
+
+    def lock(self, addr):
+        if addr not in self._locks:
+            self._locks[addr] = asyncio.Lock()
+        return self._locks[addr]
+
+    def take(self, addr):
+        if addr not in self._next:
+            self._next[addr] = web3.eth.get_transaction_count(addr, "pending")
+        nonce = self._next[addr]
+        self._next[addr] += 1
+        return nonce
+
+    def reset(self, addr):
+        # After a rejected transaction the node's count is the truth again
+        self._next.pop(addr, None)
+
+
+def approve_bidders(auction, bidders, amount):
+    # Token auctions pull the commitment, every bidder approves it once
+    token = Contract.from_abi("ERC20", auction.paymentCurrency(), FixedToken.abi)
+    for bidder in bidders:
+        token.approve(auction, amount, {"from": bidder})
+
+
+class BidLoadGenerator:
+    def __init__(self, auction, bidders, commitment, rate, arrivals="poisson",
+                 max_in_flight=MAX_IN_FLIGHT, gas_limit=COMMIT_GAS_LIMIT,
+                 receipt_poll_interval=RECEIPT_POLL_INTERVAL):
+        # `auction` is a DutchAuction or BatchAuction, `commitment` the amount
+        # of every bid in its payment currency and `rate` the bids per second
+        self.auction = auction
+        self.bidders = [str(bidder) for bidder in bidders]
+        self.commitment = commitment
+        self.arrivals = ARRIVALS[arrivals](rate) if isinstance(arrivals, str) else arrivals
+        self.max_in_flight = max_in_flight
+        self.gas_limit = gas_limit
+        self.receipt_poll_interval = receipt_poll_interval
+        self.pay_eth = auction.paymentCurrency() == ETH_ADDRESS
+
+        self.nonces = NonceManager()
+        self.latency = LatencyHistogram()
+        self.included = 0
+        self.reverted = 0
+        self.rejected = 0
+        self.elapsed = 0
+
+    def _transaction(self, bidder):
+        if self.pay_eth:
+            data = self.auction.commitEth.encode_input(bidder, True)
+            value = self.commitment
+        else:
+            data = self.auction.commitTokens.encode_input(self.commitment, True)
+            value = 0
+        return {
+            "from": bidder,
+            "to": self.auction.address,
+            "data": data,
+            "value": value,
+            "gas": self.gas_limit,
+            "gasPrice": self.gas_price,
+        }
+
+    async def run(self, n_bids):
+        # Sends `n_bids` bids, each from the next bidder in turn, and waits
+        # for all of them. Returns the bids included per second.
+        loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        self._window = asyncio.Semaphore(self.max_in_flight)
+        self.gas_price = web3.eth.gas_price
+        started = time.time()
+        tasks = []
+        try:
+            for i in range(n_bids):
+                if i:
+                    await asyncio.sleep(next(self.arrivals))
+                await self._window.acquire()
+                tasks.append(loop.create_task(self._bid(self.bidders[i % len(self.bidders)])))
+            await asyncio.gather(*tasks)
+        finally:
+            self._executor.shutdown(wait=False)
+        self.elapsed = time.time() - started
+        return self.included / self.elapsed if self.elapsed else 0
+
+    async def _bid(self, bidder):
+        loop = asyncio.get_running_loop()
+        try:
+            async with self.nonces.lock(bidder):
+                tx = dict(self._transaction(bidder), nonce=self.nonces.take(bidder))
+                submitted = time.time()
+                try:
+                    txid = await loop.run_in_executor(self._executor, web3.eth.send_transaction, tx)
+                except ValueError as e:
+                    self.nonces.reset(bidder)
+                    self.rejected += 1
+                    print("Bid from", bidder, "rejected:", e)
+                    return
+            receipt = await self._wait_for_receipt(txid)
+            self.latency.record(time.time() - submitted)
+            if receipt["status"] == 1:
+                self.included += 1
+            else:
+                self.reverted += 1
+        finally:
+            self._window.release()
+
+    async def _wait_for_receipt(self, txid):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                return await loop.run_in_executor(self._executor, web3.eth.get_transaction_receipt, txid)
+            except TransactionNotFound:
+                await asyncio.sleep(self.receipt_poll_interval)
+
+    def report(self):
+        sent = self.included + self.reverted + self.rejected
+        lines = [
+            "{} bids in {:.2f}s, {} included, {} reverted, {} rejected".format(
+                sent, self.elapsed, self.included, self.reverted, self.rejected),
+            "Submit to inclusion latency:",
+            self.latency.report(),
+        ]
+        return "\n".join(lines)
+
+
+def main(auction, n_bids=1000, rate=50, max_in_flight=MAX_IN_FLIGHT, arrivals="poisson"):
+    # brownie run scripts/bid_load.py main <auction> <bids> <bids per second> [<in flight> <arrivals>]
+    auction = Contract.from_abi("MISOAuction", auction, DutchAuction.abi)
+    bidders = accounts[1:]
+    commitment = 10 ** 16
+    if auction.paymentCurrency() != ETH_ADDRESS:
+        approve_bidders(auction, bidders, commitment * int(n_bids))
+    generator = BidLoadGenerator(auction, bidders, commitment, float(rate), arrivals=arrivals,
+                                 max_in_flight=int(max_in_flight))
+    throughput = asyncio.run(generator.run(int(n_bids)))
+    print(generator.report())
+    print("{:.1f} bids included per second".format(throughput))
@@ -0,0 +1,66 @@
+from brownie import *
+from eth_utils import keccak, to_checksum_address
+
+# Address of a clone deployed with a salt, before it is deployed:
+#
+#   token = predict_token_address(token_factory, template_id, deployer, salt)
+#   token_factory.createTokenWithSalt(template_id, ZERO_ADDRESS, data, salt, {"from": deployer})
+#
+# The factories mix the sender into the salt, keccak256(sender ++ salt),
+# so a salt is only ever taken by its own sender. Each clone is deployed
+# by the factory it is created from.
+
+# EIP-1167 minimal proxy creation code around the 20 byte template address
+CLONE_PREFIX = bytes.fromhex("3d602d80600a3d3981f3363d3d373d3d3d363d73")
+CLONE_SUFFIX = bytes.fromhex("5af43d82803e903d91602b57fd5bf3")
+
+
+def _address_bytes(address):
+    return bytes.fromhex(to_checksum_address(str(getattr(address, "address", address)))[2:])
+
+
+def salt_bytes(salt):
+    # A salt given as an int, a hex string or 32 bytes
+    if isinstance(salt, int):
+        return salt.to_bytes(32, "big")
+    if isinstance(salt, str):
+        salt = bytes.fromhex(salt[2:] if salt.startswith("0x") else salt)
+    salt = bytes(salt)
+    if len(salt) != 32:
+        raise ValueError("Salt must be 32 bytes")
+    return salt
+
+
+def clone_salt(sender, salt):
+    return keccak(_address_bytes(sender) + salt_bytes(salt))
+
+
+def create2_address(deployer, salt, init_code_hash):
+    digest = keccak(b"\xff" + _address_bytes(deployer) + salt + init_code_hash)
+    return to_checksum_address(digest[12:])
+
+
+def clone_address(deployer, template, salt):
+    # Address of the clone of `template` deployed by `deployer` with CREATE2
+    init_code = CLONE_PREFIX + _address_bytes(template) + CLONE_SUFFIX
+    return create2_address(deployer, salt, keccak(init_code))
+
+
+def predict_token_address(token_factory, template_id, sender, salt):
+    template = token_factory.getTokenTemplate(template_id)
+    return clone_address(token_factory, template, clone_salt(sender, salt))
+
+
+def predict_farm_address(farm_factory, template_id, sender, salt):
+    template = farm_factory.getFarmTemplate(template_id)
+    return clone_address(farm_factory, template, clone_salt(sender, salt))
+
+
+def predict_market_address(market, template_id, sender, salt):
+    template = market.getAuctionTemplate(template_id)
+    return clone_address(market, template, clone_salt(sender, salt))
+
+
+def predict_launcher_address(launcher, template_id, sender, salt):
+    template = launcher.getLiquidityLauncherTemplate(template_id)
+    return clone_address(launcher, template, clone_salt(sender, salt))
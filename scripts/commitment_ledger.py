@@ -0,0 +1,168 @@
+from brownie import *
+from .auction_sim import uint_array, tokens_claimable, crowdsale_tokens_claimable, batch_tokens_claimable
+from .confirmations import required_confirmations
+from .event_indexer import CHUNK_SIZE, event_topic, topic_address, data_word
+from .settings import ETH_ADDRESS
+
+# Per-bidder commitments, claims and claimable tokens of one auction, built
+# from its AddedCommitment events instead of one getUserMarketInfo call per
+# bidder.
+#
+# Withdrawals emit no event of their own, but every claim moves auction
+# tokens out of the auction and every refund in a token moves payment
+# tokens out of it. Only the recipients of those transfers have their
+# `claimed` and `commitments` read again. ETH refunds leave no log at all,
+# so after a failed ETH auction call refresh() with the bidders to check.
+# Given a MulticallClient, those reads are batched into a few eth_calls.
+#
+# Only blocks with enough confirmations are read, so there are no reorgs to
+# roll back.
+
+ADDED_COMMITMENT = "AddedCommitment(address,uint256)"
+TRANSFER = "Transfer(address,address,uint256)"
+
+# marketTemplate() of each auction type
+CROWDSALE = 1
+DUTCH_AUCTION = 2
+BATCH_AUCTION = 3
+HYPERBOLIC_AUCTION = 4
+
+
+def _auction_contract(address):
+    # The auctions share the getters used here except marketStatus
+    auction = Contract.from_abi("MISOAuction", address, DutchAuction.abi)
+    template = auction.marketTemplate()
+    container = {
+        CROWDSALE: Crowdsale,
+        DUTCH_AUCTION: DutchAuction,
+        BATCH_AUCTION: BatchAuction,
+        HYPERBOLIC_AUCTION: HyperbolicAuction,
+    }[template]
+    return Contract.from_abi(container._name, address, container.abi), template
+
+
+class CommitmentLedger:
+    def __init__(self, auction, start_block=0, chunk_size=CHUNK_SIZE, client=None):
+        # `start_block` is any block before the first commitment, such as the
+        # block the auction was created in
+        self.auction, self.template = _auction_contract(auction)
+        self.client = client
+        self.auction_token = self.auction.auctionToken()
+        self.payment_currency = self.auction.paymentCurrency()
+        self.chunk_size = chunk_size
+        self.last_block = start_block - 1
+
+        # One column per field, a bidder's row is its index in `bidders`
+        self.bidders = []
+        self.index = {}
+        self.commitments = []
+        self.claimed = []
+        self.commitments_total = 0
+
+        auction_topic = "0x" + bytes(12).hex() + self.auction.address[2:].lower()
+        self.commitment_filter = {"address": self.auction.address, "topics": [event_topic(ADDED_COMMITMENT)]}
+        # Tokens paid out by the auction, claims and token refunds
+        payouts = [self.auction_token]
+        if self.payment_currency != ETH_ADDRESS:
+            payouts.append(self.payment_currency)
+        self.payout_filter = {"address": payouts, "topics": [event_topic(TRANSFER), auction_topic]}
+
+    def __len__(self):
+        return len(self.bidders)
+
+    def sync(self, to_block=None):
+        # Replays the events up to `to_block`, by default the last block with
+        # enough confirmations. Returns the last replayed block.
+        if to_block is None:
+            to_block = web3.eth.block_number - required_confirmations() + 1
+        changed = set()
+        from_block = self.last_block + 1
+        while from_block <= to_block:
+            chunk_end = min(from_block + self.chunk_size - 1, to_block)
+            try:
+                commitment_logs = web3.eth.get_logs(
+                    dict(self.commitment_filter, fromBlock=from_block, toBlock=chunk_end))
+                payout_logs = web3.eth.get_logs(
+                    dict(self.payout_filter, fromBlock=from_block, toBlock=chunk_end))
+            except ValueError as e:
+                if self.chunk_size == 1:
+                    raise
+                # Too many logs in the range, retry with half the blocks
+                self.chunk_size = max(self.chunk_size // 2, 1)
+                print("eth_getLogs failed, chunk size is now", self.chunk_size, ":", e)
+                continue
+            for log in commitment_logs:
+                addr = web3.toChecksumAddress(data_word(log["data"], 0)[-20:])
+                self._add_commitment(addr, int.from_bytes(data_word(log["data"], 1), "big"))
+            for log in payout_logs:
+                # Payouts to anyone but a bidder, like the wallet, change nothing
+                addr = topic_address(log["topics"][2])
+                if addr in self.index:
+                    changed.add(addr)
+            from_block = chunk_end + 1
+        self.last_block = max(self.last_block, to_block)
+        if changed:
+            self.refresh(changed)
+        return self.last_block
+
+    def refresh(self, bidders):
+        # Reads `commitments` and `claimed` of the given bidders at the last
+        # replayed block
+        bidders = list(bidders)
+        if self.client is not None:
+            calls = [(self.auction.commitments, (addr,)) for addr in bidders]
+            calls += [(self.auction.claimed, (addr,)) for addr in bidders]
+            results = self.client.read(calls, block_identifier=self.last_block)
+            commitments, claimed = results[:len(bidders)], results[len(bidders):]
+        else:
+            commitments = [self.auction.commitments(addr, block_identifier=self.last_block) for addr in bidders]
+            claimed = [self.auction.claimed(addr, block_identifier=self.last_block) for addr in bidders]
+        for addr, commitment, claim in zip(bidders, commitments, claimed):
+            i = self.index[addr]
+            self.commitments[i] = commitment
+            self.claimed[i] = claim
+
+    def _add_commitment(self, addr, commitment):
+        i = self.index.get(addr)
+        if i is None:
+            i = self.index[addr] = len(self.bidders)
+            self.bidders.append(addr)
+            self.commitments.append(0)
+            self.claimed.append(0)
+        self.commitments[i] += commitment
+        self.commitments_total += commitment
+
+    def tokens_claimable(self):
+        # tokensClaimable() of every bidder at the last replayed block, with
+        # the template's own formula and rounding
+        block = self.last_block
+        start_time, end_time, total_tokens = self.auction.marketInfo(block_identifier=block)
+        token = Contract.from_abi("ERC20", self.auction_token, FixedToken.abi)
+        unclaimed_tokens = token.balanceOf(self.auction.address, block_identifier=block)
+        commitments, claimed = uint_array(self.commitments), uint_array(self.claimed)
+
+        if self.template == CROWDSALE:
+            rate, goal = self.auction.marketPrice(block_identifier=block)
+            return crowdsale_tokens_claimable(commitments, rate, token.decimals(), claimed, unclaimed_tokens)
+        if self.template == BATCH_AUCTION:
+            return batch_tokens_claimable(commitments, self.commitments_total, total_tokens, claimed, unclaimed_tokens)
+        return tokens_claimable(commitments, self.commitments_total, total_tokens, claimed, unclaimed_tokens)
+
+    def report(self):
+        # Settlement report, one column per field
+        return {
+            "bidders": list(self.bidders),
+            "commitments": uint_array(self.commitments),
+            "claimed": uint_array(self.claimed),
+            "tokens_claimable": self.tokens_claimable(),
+        }
+
+
+def main(auction):
+    # brownie run scripts/commitment_ledger.py main <auction> --network mainnet
+    ledger = CommitmentLedger(auction)
+    block = ledger.sync()
+    report = ledger.report()
+    print(len(ledger), "bidders committed", ledger.commitments_total, "up to block", block)
+    for row in zip(report["bidders"], report["commitments"], report["claimed"], report["tokens_claimable"]):
+        print(*row)
@@ -0,0 +1,85 @@
+from brownie import *
+from web3.exceptions import TransactionNotFound
+import time
+
+# Confirmations required before a transaction is trusted, per network.
+# 1 means the transaction is included in a block, 2 means one block on top.
+CONFIRMATIONS = {
+    "development": 1,
+    "mainnet": 3,
+    "ropsten": 2,
+    "rinkeby": 2,
+    "kovan": 2,
+    "goerli": 2,
+    "bsc-main": 3,
+    "bsc-test": 2,
+    "bsc-fork-testnet": 1,
+}
+# Used for public networks that are not listed above.
+DEFAULT_CONFIRMATIONS = 2
+
+# Polling starts fast and backs off exponentially up to the cap.
+POLL_INTERVAL = 0.1
+MAX_POLL_INTERVAL = 5
+TIMEOUT = 30 * 60
+
+
+def required_confirmations():
+    name = network.show_active()
+    if name in CONFIRMATIONS:
+        return CONFIRMATIONS[name]
+    # Forks mine instantly, there is nothing to wait for beyond inclusion.
+    if "fork" in name:
+        return 1
+    return DEFAULT_CONFIRMATIONS
+
+
+def wait_for_receipt(txid, confirmations=None, timeout=TIMEOUT):
+    # Polls until `txid` is mined and buried under enough blocks.
+    # Returns the receipt and the seconds spent waiting.
+    if confirmations is None:
+        confirmations = required_confirmations()
+    start = time.time()
+    interval = POLL_INTERVAL
+    while True:
+        try:
+            receipt = web3.eth.get_transaction_receipt(txid)
+        except TransactionNotFound:
+            receipt = None
+        # The receipt is fetched again on every poll, so a reorg that drops
+        # the transaction sends us back to waiting for inclusion.
+        if receipt is not None and receipt["blockNumber"] is not None:
+            depth = web3.eth.block_number - receipt["blockNumber"] + 1
+            if depth >= confirmations:
+                return receipt, time.time() - start
+        if time.time() - start > timeout:
+            raise TimeoutError(
+                "Transaction " + str(txid) + " not confirmed after " + str(timeout) + " seconds")
+        time.sleep(interval)
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+
+
+def wait_for_receipts(txs, confirmations=None):
+    # Waits on already broadcast transactions. The slowest one bounds the
+    # total wait, so they are simply awaited in order.
+    start = time.time()
+    receipts = []
+    for tx in txs:
+        receipt, _ = wait_for_receipt(tx.txid, confirmations)
+        if receipt["status"] != 1:
+            raise RuntimeError("Transaction " + tx.txid + " reverted")
+        receipts.append(receipt)
+    waited = time.time() - start
+    if receipts:
+        print("Confirmed", len(receipts), "transaction(s) in", round(waited, 2), "seconds")
+    return receipts
+
+
+def wait_deploy(contract):
+    # Contracts loaded with `.at()` have no deployment transaction to wait for.
+    tx = getattr(contract, "tx", None)
+    if tx is None:
+        return 0
+    _, waited = wait_for_receipt(tx.txid)
+    print("Deployment of", contract.address, "confirmed in", round(waited, 2), "seconds")
+    return waited
@@ -1,7 +1,8 @@
 from brownie import *
 from .settings import *
 from .contract_addresses import *
-import time
+from . import confirmations
+from .deployment_ledger import get_address, record_deployment, step_pending, record_step
 
 
 def load_accounts():
@@ -32,18 +33,23 @@ def publish():
 
 def wait_deploy(contract):
     # GP: Wait for contract to deploy.
-    time.sleep(2)
+    return confirmations.wait_deploy(contract)
 
 
 def deploy_access_control(operator):
-    access_control_address = CONTRACTS[network.show_active()]["access_control"]
+    access_control_address = get_address("access_control")
     if access_control_address == '':
         access_control = MISOAccessControls.deploy(
             {'from': accounts[0]}, publish_source=publish())
-        access_control.initAccessControls(accounts[0], {'from': accounts[0]})
-        access_control.addOperatorRole(operator, {'from': accounts[0]})
+        record_deployment("access_control", access_control)
     else:
         access_control = MISOAccessControls.at(access_control_address)
+    if step_pending("access_control", "initAccessControls"):
+        access_control.initAccessControls(accounts[0], {'from': accounts[0]})
+        record_step("access_control", "initAccessControls")
+    if step_pending("access_control", "addOperatorRole"):
+        access_control.addOperatorRole(operator, {'from': accounts[0]})
+        record_step("access_control", "addOperatorRole")
     return access_control
 
 
@@ -56,45 +62,49 @@ def deploy_user_access_control(operator):
 
 
 def deploy_bento_box():
-    bento_box_address = CONTRACTS[network.show_active()]["bento_box"]
+    bento_box_address = get_address("bento_box")
     if bento_box_address == '':
         bento_box = BoringFactory.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("bento_box", bento_box)
     else:
         bento_box = BoringFactory.at(bento_box_address)
     return bento_box
 
 
 def deploy_weth_token():
-    weth_token_address = CONTRACTS[network.show_active()]["weth_token"]
+    weth_token_address = get_address("weth_token")
     if weth_token_address == '':
         weth_token = WETH9.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("weth_token", weth_token)
     else:
         weth_token = WETH9.at(weth_token_address)
     return weth_token
 
 
 def deploy_miso_token_factory(access_control):
-    miso_token_factory_address = CONTRACTS[network.show_active(
-    )]["miso_token_factory"]
+    miso_token_factory_address = get_address("miso_token_factory")
     if miso_token_factory_address == '':
         miso_token_factory = MISOTokenFactory.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("miso_token_factory", miso_token_factory)
+    else:
+        miso_token_factory = MISOTokenFactory.at(miso_token_factory_address)
+    if step_pending("miso_token_factory", "initMISOTokenFactory"):
         tx = miso_token_factory.initMISOTokenFactory(
             access_control, {"from": accounts[0]})
         assert 'MisoInitTokenFactory' in tx.events
-    else:
-        miso_token_factory = MISOTokenFactory.at(miso_token_factory_address)
+        record_step("miso_token_factory", "initMISOTokenFactory")
     return miso_token_factory
 
 
 def deploy_mintable_token_template():
-    mintable_token_template_address = CONTRACTS[network.show_active(
-    )]["mintable_token_template"]
+    mintable_token_template_address = get_address("mintable_token_template")
     if mintable_token_template_address == '':
         mintable_token_template = MintableToken.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("mintable_token_template", mintable_token_template)
     else:
         mintable_token_template = MintableToken.at(
             mintable_token_template_address)
@@ -102,29 +112,29 @@ def deploy_mintable_token_template():
 
 
 def deploy_fixed_token_template():
-    fixed_token_template_address = CONTRACTS[network.show_active(
-    )]["fixed_token_template"]
+    fixed_token_template_address = get_address("fixed_token_template")
     if fixed_token_template_address == '':
         fixed_token_template = FixedToken.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("fixed_token_template", fixed_token_template)
     else:
         fixed_token_template = FixedToken.at(fixed_token_template_address)
     return fixed_token_template
 
 
 def deploy_sushi_token_template():
-    sushi_token_template_address = CONTRACTS[network.show_active(
-    )]["sushi_token_template"]
+    sushi_token_template_address = get_address("sushi_token_template")
     if sushi_token_template_address == '':
         sushi_token_template = SushiToken.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("sushi_token_template", sushi_token_template)
     else:
         sushi_token_template = SushiToken.at(sushi_token_template_address)
     return sushi_token_template
 
 
 def deploy_mintable_token(miso_token_factory, mintable_token_template):
-    mintable_token_address = CONTRACTS[network.show_active()]["mintable_token"]
+    mintable_token_address = get_address("mintable_token")
     if mintable_token_address == '':
         tx1 = miso_token_factory.addTokenTemplate(
             mintable_token_template, {"from": accounts[0]})
@@ -134,42 +144,56 @@ def deploy_mintable_token(miso_token_factory, mintable_token_template):
             NAME, SYMBOL, template_id, accounts[0], 0, {"from": accounts[0]})
         mintable_token = MintableToken.at(
             web3.toChecksumAddress(tx2.events['TokenCreated']['addr']))
+        record_deployment("mintable_token", mintable_token, tx_hash=tx2.txid)
     else:
         mintable_token = MintableToken.at(mintable_token_address)
     return mintable_token
 
 
 def deploy_pointlist_template():
-    pointlist_template_address = CONTRACTS[network.show_active(
-    )]["pointlist_template"]
+    pointlist_template_address = get_address("pointlist_template")
     if pointlist_template_address == '':
         pointlist_template = PointList.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("pointlist_template", pointlist_template)
     else:
         pointlist_template = PointList.at(pointlist_template_address)
     return pointlist_template
 
 
+def deploy_merkle_list_template():
+    merkle_list_template_address = get_address("merkle_list_template")
+    if merkle_list_template_address == '':
+        merkle_list_template = MerkleList.deploy(
+            {"from": accounts[0]}, publish_source=publish())
+        record_deployment("merkle_list_template", merkle_list_template)
+    else:
+        merkle_list_template = MerkleList.at(merkle_list_template_address)
+    return merkle_list_template
+
+
 def deploy_pointlist_factory(pointlist_template, access_control, pointlist_fee):
-    pointlist_factory_address = CONTRACTS[network.show_active(
-    )]["pointlist_factory"]
+    pointlist_factory_address = get_address("pointlist_factory")
     if pointlist_factory_address == '':
         pointlist_factory = ListFactory.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("pointlist_factory", pointlist_factory)
+    else:
+        pointlist_factory = ListFactory.at(pointlist_factory_address)
+    if step_pending("pointlist_factory", "initListFactory"):
         tx = pointlist_factory.initListFactory(
             access_control, pointlist_template, pointlist_fee,  {"from": accounts[0]})
         assert 'MisoInitListFactory' in tx.events
-    else:
-        pointlist_factory = ListFactory.at(pointlist_factory_address)
+        record_step("pointlist_factory", "initListFactory")
     return pointlist_factory
 
 
 def deploy_dutch_auction_template():
-    dutch_auction_template_address = CONTRACTS[network.show_active(
-    )]["dutch_auction_template"]
+    dutch_auction_template_address = get_address("dutch_auction_template")
     if dutch_auction_template_address == '':
         dutch_auction_template = DutchAuction.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("dutch_auction_template", dutch_auction_template)
     else:
         dutch_auction_template = DutchAuction.at(
             dutch_auction_template_address)
@@ -177,22 +201,22 @@ def deploy_dutch_auction_template():
 
 
 def deploy_crowdsale_template():
-    crowdsale_template_address = CONTRACTS[network.show_active(
-    )]["crowdsale_template"]
+    crowdsale_template_address = get_address("crowdsale_template")
     if crowdsale_template_address == '':
         crowdsale_template = Crowdsale.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("crowdsale_template", crowdsale_template)
     else:
         crowdsale_template = Crowdsale.at(crowdsale_template_address)
     return crowdsale_template
 
 
 def deploy_batch_auction_template():
-    batch_auction_template_address = CONTRACTS[network.show_active(
-    )]["batch_auction_template"]
+    batch_auction_template_address = get_address("batch_auction_template")
     if batch_auction_template_address == '':
         batch_auction_template = BatchAuction.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("batch_auction_template", batch_auction_template)
     else:
         batch_auction_template = BatchAuction.at(
             batch_auction_template_address)
@@ -200,11 +224,11 @@ def deploy_batch_auction_template():
 
 
 def deploy_hyperbolic_auction_template():
-    hyperbolic_auction_template_address = CONTRACTS[network.show_active(
-    )]["hyperbolic_auction_template"]
+    hyperbolic_auction_template_address = get_address("hyperbolic_auction_template")
     if hyperbolic_auction_template_address == '':
         hyperbolic_auction_template = HyperbolicAuction.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("hyperbolic_auction_template", hyperbolic_auction_template)
     else:
         hyperbolic_auction_template = HyperbolicAuction.at(
             hyperbolic_auction_template_address)
@@ -212,38 +236,40 @@ def deploy_hyperbolic_auction_template():
 
 
 def deploy_miso_market(access_control, bento_box, templates):
-    miso_market_address = CONTRACTS[network.show_active()]["miso_market"]
+    miso_market_address = get_address("miso_market")
     if miso_market_address == '':
         # if network.show_active() == "development": publish = False
         # else: publish = True
         miso_market = MISOMarket.deploy(
             {"from": accounts[0]}, publish_source=publish())
         wait_deploy(miso_market)
-        miso_market.initMISOMarket(
-            access_control, bento_box, templates, {"from": accounts[0]})
-
+        record_deployment("miso_market", miso_market)
     else:
         miso_market = MISOMarket.at(miso_market_address)
+    if step_pending("miso_market", "initMISOMarket"):
+        miso_market.initMISOMarket(
+            access_control, bento_box, templates, {"from": accounts[0]})
+        record_step("miso_market", "initMISOMarket")
     return miso_market
 
 
 def deploy_uniswap_factory():
-    uniswap_factory_address = CONTRACTS[network.show_active(
-    )]["uniswap_factory"]
+    uniswap_factory_address = get_address("uniswap_factory")
     if uniswap_factory_address == '':
         uniswap_factory = UniswapV2Factory.deploy(
             accounts[0], {"from": accounts[0]})
+        record_deployment("uniswap_factory", uniswap_factory, [accounts[0]])
     else:
         uniswap_factory = UniswapV2Factory.at(uniswap_factory_address)
     return uniswap_factory
 
 
 def deploy_pool_liquidity_template():
-    pool_liquidity_template_address = CONTRACTS[network.show_active(
-    )]["pool_liquidity_template"]
+    pool_liquidity_template_address = get_address("pool_liquidity_template")
     if pool_liquidity_template_address == '':
         pool_liquidity_template = PoolLiquidity.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("pool_liquidity_template", pool_liquidity_template)
     else:
         pool_liquidity_template = PoolLiquidity.at(
             pool_liquidity_template_address)
@@ -251,63 +277,91 @@ def deploy_pool_liquidity_template():
 
 
 def deploy_post_auction_template(weth_token):
-    post_auction_template_address = CONTRACTS[network.show_active()]["post_auction_template"]
+    post_auction_template_address = get_address("post_auction_template")
     if post_auction_template_address == '':
         post_auction_template = PostAuctionLauncher.deploy(weth_token, {"from":accounts[0]}, publish_source=publish())
+        record_deployment("post_auction_template", post_auction_template, [weth_token])
     else:
         post_auction_template = PostAuctionLauncher.at(post_auction_template_address)
     return post_auction_template
 
 def deploy_miso_launcher(access_control, weth_token, bento_box):
-    miso_launcher_address = CONTRACTS[network.show_active()]["miso_launcher"]
+    miso_launcher_address = get_address("miso_launcher")
     if miso_launcher_address == '':
         miso_launcher = MISOLauncher.deploy(
             {"from": accounts[0]}, publish_source=publish())
-        miso_launcher.initMISOLauncher(
-            access_control, weth_token, bento_box, {"from": accounts[0]})
-
+        record_deployment("miso_launcher", miso_launcher)
     else:
         miso_launcher = MISOLauncher.at(miso_launcher_address)
+    if step_pending("miso_launcher", "initMISOLauncher"):
+        miso_launcher.initMISOLauncher(
+            access_control, weth_token, bento_box, {"from": accounts[0]})
+        record_step("miso_launcher", "initMISOLauncher")
     return miso_launcher
 
 
 def deploy_masterchef_template():
-    masterchef_template_address = CONTRACTS[network.show_active(
-    )]["masterchef_template"]
+    masterchef_template_address = get_address("masterchef_template")
     if masterchef_template_address == '':
         masterchef_template = MISOMasterChef.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("masterchef_template", masterchef_template)
     else:
         masterchef_template = MISOMasterChef.at(masterchef_template_address)
     return masterchef_template
 
 
+def deploy_lazy_masterchef_template():
+    lazy_masterchef_template_address = get_address("lazy_masterchef_template")
+    if lazy_masterchef_template_address == '':
+        lazy_masterchef_template = MISOLazyMasterChef.deploy(
+            {"from": accounts[0]}, publish_source=publish())
+        record_deployment("lazy_masterchef_template", lazy_masterchef_template)
+    else:
+        lazy_masterchef_template = MISOLazyMasterChef.at(lazy_masterchef_template_address)
+    return lazy_masterchef_template
+
+
 def deploy_farm_factory(access_control):
-    farm_factory_address = CONTRACTS[network.show_active()]["farm_factory"]
+    farm_factory_address = get_address("farm_factory")
     if farm_factory_address == '':
         farm_factory = MISOFarmFactory.deploy(
             {"from": accounts[0]}, publish_source=publish())
+        record_deployment("farm_factory", farm_factory)
+    else:
+        farm_factory = MISOFarmFactory.at(farm_factory_address)
+    if step_pending("farm_factory", "initMISOFarmFactory"):
         miso_dev = accounts[0]
         minimum_fee = 0
         token_fee = 0
         farm_factory.initMISOFarmFactory(
             access_control, miso_dev, minimum_fee, token_fee, {"from": accounts[0]})
-
-    else:
-        farm_factory = MISOFarmFactory.at(farm_factory_address)
+        record_step("farm_factory", "initMISOFarmFactory")
     return farm_factory
 
 
 def deploy_miso_helper(access_control, token_factory, market, launcher, farm_factory):
-    miso_helper_address = CONTRACTS[network.show_active()]["miso_helper"]
+    miso_helper_address = get_address("miso_helper")
     if miso_helper_address == '':
         miso_helper = MISOHelper.deploy(access_control, token_factory, market, launcher, farm_factory, {
                                         "from": accounts[0]}, publish_source=publish())
+        record_deployment("miso_helper", miso_helper, [
+                          access_control, token_factory, market, launcher, farm_factory])
     else:
         miso_helper = MISOHelper.at(miso_helper_address)
     return miso_helper
 
 
+def deploy_multicall():
+    multicall_address = get_address("multicall")
+    if multicall_address == '':
+        multicall = Multicall.deploy({"from": accounts[0]}, publish_source=publish())
+        record_deployment("multicall", multicall)
+    else:
+        multicall = Multicall.at(multicall_address)
+    return multicall
+
+
 def deploy_dutch_auction(miso_market,
                          dutch_auction_template,
                          token_address,
@@ -318,7 +372,7 @@ def deploy_dutch_auction(miso_market,
                          auction_start_price,
                          auction_reserve,
                          wallet):
-    dutch_auction_address = CONTRACTS[network.show_active()]["dutch_auction"]
+    dutch_auction_address = get_address("dutch_auction")
     if dutch_auction_address == '':
         tx1 = miso_market.addAuctionTemplate(
             dutch_auction_template, {"from": accounts[0]})
@@ -334,6 +388,7 @@ def deploy_dutch_auction(miso_market,
                                         template_id, {"from": accounts[0]})
         dutch_auction = DutchAuction.at(
             web3.toChecksumAddress(tx2.events['AuctionCreated']['addr']))
+        record_deployment("dutch_auction", dutch_auction, tx_hash=tx2.txid)
     else:
         dutch_auction = DutchAuction.at(dutch_auction_address)
     return dutch_auction
@@ -2,85 +2,156 @@ from brownie import *
 from .settings import *
 from .contracts import *
 from .contract_addresses import *
+from .deploy_planner import DeploymentPlanner
+from .deployment_ledger import step_pending
 import time
 
 
-def main():
-    load_accounts()
-
-    # Initialise Project
-    deployer = accounts[0]
-    admin = accounts[1]
-
-    # When deployed, should the contracts be unlocked?
-    unlock = True  
+def miso_deployment_plan(deployer, unlock):
+    plan = DeploymentPlanner(deployer)
 
     #  miso access control
-    access_control = deploy_access_control(deployer)
-    if access_control.hasAdminRole(admin) == False:
-        access_control.addAdminRole(admin, {'from': accounts[0]})
-
-    if access_control.hasAdminRole(deployer) == False:
-        access_control.addAdminRole(deployer, {'from': admin})
+    plan.deploy("access_control", MISOAccessControls)
+    plan.transact("access_control_init",
+        lambda d, tx: d["access_control"].initAccessControls(deployer, tx)
+            if step_pending("access_control", "initAccessControls") else None,
+        deps=["access_control"],
+        ledger_step=("access_control", "initAccessControls"))
+    plan.transact("access_control_operator",
+        lambda d, tx: d["access_control"].addOperatorRole(deployer, tx)
+            if step_pending("access_control", "addOperatorRole") else None,
+        deps=["access_control_init"],
+        ledger_step=("access_control", "addOperatorRole"))
+
+    # Templates and factories without constructor dependencies
+    plan.deploy("fixed_token_template", FixedToken)
+    plan.deploy("mintable_token_template", MintableToken)
+    plan.deploy("sushi_token_template", SushiToken)
+    plan.deploy("crowdsale_template", Crowdsale)
+    plan.deploy("dutch_auction_template", DutchAuction)
+    plan.deploy("batch_auction_template", BatchAuction)
+    plan.deploy("hyperbolic_auction_template", HyperbolicAuction)
+    plan.deploy("pointlist_template", PointList)
+    plan.deploy("merkle_list_template", MerkleList)
+    plan.deploy("masterchef_template", MISOMasterChef)
+    plan.deploy("lazy_masterchef_template", MISOLazyMasterChef)
+    plan.deploy("bento_box", BoringFactory)
+    plan.deploy("weth_token", WETH9)
+    plan.deploy("miso_token_factory", MISOTokenFactory)
+    plan.deploy("miso_market", MISOMarket)
+    plan.deploy("pointlist_factory", ListFactory)
+    plan.deploy("miso_launcher", MISOLauncher)
+    plan.deploy("farm_factory", MISOFarmFactory)
+    plan.deploy("post_auction_template", PostAuctionLauncher,
+        args=lambda d: [d["weth_token"]], deps=["weth_token"])
 
     # Setup MISOTokenFactory
-    miso_token_factory = deploy_miso_token_factory(access_control)
-    fixed_token_template = deploy_fixed_token_template()
-    mintable_token_template = deploy_mintable_token_template()
-
-    sushi_token_template = deploy_sushi_token_template()
-
-    if miso_token_factory.tokenTemplateId() == 0:
-        miso_token_factory.addTokenTemplate(
-            mintable_token_template, {'from': deployer})
-        miso_token_factory.addTokenTemplate(
-            fixed_token_template, {'from': deployer})
-        miso_token_factory.addTokenTemplate(
-            sushi_token_template, {'from': deployer})
+    plan.transact("miso_token_factory_init",
+        lambda d, tx: d["miso_token_factory"].initMISOTokenFactory(d["access_control"], tx)
+            if step_pending("miso_token_factory", "initMISOTokenFactory") else None,
+        deps=["miso_token_factory", "access_control"],
+        ledger_step=("miso_token_factory", "initMISOTokenFactory"))
+    # Templates are added in this order so their ids match the sequential deploy.
+    for template in ["mintable_token_template", "fixed_token_template", "sushi_token_template"]:
+        plan.transact(template + "_add",
+            lambda d, tx, template=template: d["miso_token_factory"].addTokenTemplate(d[template], tx)
+                if d["miso_token_factory"].getTemplateId(d[template]) == 0 else None,
+            deps=["miso_token_factory_init", "access_control_operator", template])
 
     # Setup MISO Market
-    bento_box = deploy_bento_box()
-    crowdsale_template = deploy_crowdsale_template()
-    dutch_auction_template = deploy_dutch_auction_template()
-    batch_auction_template = deploy_batch_auction_template()
-    hyperbolic_auction_template = deploy_hyperbolic_auction_template()
-
-    miso_market = deploy_miso_market(access_control, bento_box, [
-                                     dutch_auction_template, crowdsale_template, batch_auction_template, hyperbolic_auction_template])
+    auction_templates = ["dutch_auction_template", "crowdsale_template",
+                         "batch_auction_template", "hyperbolic_auction_template"]
+    plan.transact("miso_market_init",
+        lambda d, tx: d["miso_market"].initMISOMarket(
+            d["access_control"], d["bento_box"], [d[t] for t in auction_templates], tx)
+            if step_pending("miso_market", "initMISOMarket") else None,
+        deps=["miso_market", "access_control", "bento_box"] + auction_templates,
+        ledger_step=("miso_market", "initMISOMarket"))
 
     # Setup PointList
-    pointlist_template = deploy_pointlist_template()
-    pointlist_factory = deploy_pointlist_factory(
-        pointlist_template, access_control, 0)
+    plan.transact("pointlist_factory_init",
+        lambda d, tx: d["pointlist_factory"].initListFactory(
+            d["access_control"], d["pointlist_template"], 0, tx)
+            if step_pending("pointlist_factory", "initListFactory") else None,
+        deps=["pointlist_factory", "access_control", "pointlist_template"],
+        ledger_step=("pointlist_factory", "initListFactory"))
+    plan.transact("merkle_list_template_set",
+        lambda d, tx: d["pointlist_factory"].setMerkleListTemplate(d["merkle_list_template"], tx)
+            if d["pointlist_factory"].merkleListTemplate() != d["merkle_list_template"].address else None,
+        deps=["pointlist_factory_init", "merkle_list_template"])
 
     # MISOLauncher
-    weth_token = deploy_weth_token()
-
-    post_auction_template = deploy_post_auction_template(weth_token)    
-    miso_launcher = deploy_miso_launcher(access_control, weth_token, bento_box)
-    if miso_launcher.launcherTemplateId() == 0:
-        miso_launcher.addLiquidityLauncherTemplate(post_auction_template, {"from": accounts[0]} )
+    plan.transact("miso_launcher_init",
+        lambda d, tx: d["miso_launcher"].initMISOLauncher(
+            d["access_control"], d["weth_token"], d["bento_box"], tx)
+            if step_pending("miso_launcher", "initMISOLauncher") else None,
+        deps=["miso_launcher", "access_control", "weth_token", "bento_box"],
+        ledger_step=("miso_launcher", "initMISOLauncher"))
+    plan.transact("post_auction_template_add",
+        lambda d, tx: d["miso_launcher"].addLiquidityLauncherTemplate(d["post_auction_template"], tx)
+            if d["miso_launcher"].launcherTemplateId() == 0 else None,
+        deps=["miso_launcher_init", "access_control_operator", "post_auction_template"])
 
     # MISOFarmFactory
-    masterchef_template = deploy_masterchef_template()
-    farm_factory = deploy_farm_factory(access_control)
-    if farm_factory.farmTemplateId() == 0:
-        farm_factory.addFarmTemplate(
-            masterchef_template, {"from": accounts[0]})
+    plan.transact("farm_factory_init",
+        lambda d, tx: d["farm_factory"].initMISOFarmFactory(d["access_control"], deployer, 0, 0, tx)
+            if step_pending("farm_factory", "initMISOFarmFactory") else None,
+        deps=["farm_factory", "access_control"],
+        ledger_step=("farm_factory", "initMISOFarmFactory"))
+    plan.transact("masterchef_template_add",
+        lambda d, tx: d["farm_factory"].addFarmTemplate(d["masterchef_template"], tx)
+            if d["farm_factory"].farmTemplateId() == 0 else None,
+        deps=["farm_factory_init", "access_control_operator", "masterchef_template"])
+    plan.transact("lazy_masterchef_template_add",
+        lambda d, tx: d["farm_factory"].addFarmTemplate(d["lazy_masterchef_template"], tx)
+            if d["farm_factory"].getTemplateId(d["lazy_masterchef_template"]) == 0 else None,
+        deps=["masterchef_template_add", "lazy_masterchef_template"])
 
     # Helper contract
-    miso_helper = deploy_miso_helper(
-        access_control, miso_token_factory, miso_market, miso_launcher, farm_factory)
+    plan.deploy("miso_helper", MISOHelper,
+        args=lambda d: [d["access_control"], d["miso_token_factory"], d["miso_market"],
+                        d["miso_launcher"], d["farm_factory"]],
+        deps=["access_control", "miso_token_factory", "miso_market", "miso_launcher", "farm_factory"])
+
+    # Batches view calls for the Python read clients
+    plan.deploy("multicall", Multicall)
 
     # Set Factory lock status
-    if unlock and miso_market.locked() == True:
-        miso_market.setLocked(False, {'from': accounts[0]} )
-    if unlock and farm_factory.locked() == True:
-        farm_factory.setLocked(False, {'from': accounts[0]} )
-    if unlock and miso_launcher.locked() == True:
-        miso_launcher.setLocked(False, {'from': accounts[0]} )
-    if unlock and miso_token_factory.locked() == True:
-        miso_token_factory.setLocked(False, {'from': accounts[0]} )
+    factory_ready = {
+        "miso_market": ["miso_market_init"],
+        "farm_factory": ["farm_factory_init", "masterchef_template_add"],
+        "miso_launcher": ["miso_launcher_init", "post_auction_template_add"],
+        "miso_token_factory": ["miso_token_factory_init", "mintable_token_template_add",
+                               "fixed_token_template_add", "sushi_token_template_add"],
+    }
+    for factory, deps in factory_ready.items():
+        plan.transact(factory + "_unlock",
+            lambda d, tx, factory=factory: d[factory].setLocked(False, tx)
+                if unlock and d[factory].locked() == True else None,
+            deps=deps + ["access_control_init"])
+
+    return plan
+
+
+def main():
+    load_accounts()
+
+    # Initialise Project
+    deployer = accounts[0]
+    admin = accounts[1]
+
+    # When deployed, should the contracts be unlocked?
+    unlock = True
+
+    plan = miso_deployment_plan(deployer, unlock)
+    deployed = plan.run()
+
+    access_control = deployed["access_control"]
+    if access_control.hasAdminRole(admin) == False:
+        access_control.addAdminRole(admin, {'from': accounts[0]})
+
+    if access_control.hasAdminRole(deployer) == False:
+        access_control.addAdminRole(deployer, {'from': admin})
 
     # Revoke deployer admin rights
     access_control.removeOperatorRole(deployer, {'from': accounts[0]})
@@ -2,9 +2,22 @@ from brownie import *
 from .settings import *
 from .contracts import *
 from .contract_addresses import *
+from .confirmations import wait_for_receipts
+from .init_data import encode_abi, get_crowdsale_data, get_dutch_auction_data, get_token_data
 import time
 import random
 
+# Bulk seeding sends this many transactions with consecutive nonces before
+# waiting on their receipts.
+SEED_BATCH_SIZE = 200
+# Gas limits are fixed for seeding, createMarket can't be estimated while the
+# token approval in front of it is still pending.
+CREATE_TOKEN_GAS = 1000000
+APPROVE_GAS = 100000
+CREATE_MARKET_GAS = 1500000
+# Auctions must not start before their createMarket transaction is mined.
+SEED_START_DELAY = 15 * 60
+
 
 
 
@@ -16,6 +29,14 @@ def main():
     deploy_n_number_fixed_token_crowdsale(access_control, bento_box, number_of_auction_1)
     deploy_n_number_fixed_token_dutch_auction(access_control, bento_box, number_of_auction_2)
 
+def seed():
+    # Bulk mode, eg. for seeding a fork before load testing:
+    # brownie run deploy_large_number_auctions seed --network mainnet-fork
+    access_control = deploy_access_control(accounts[0])
+    bento_box = deploy_bento_box()
+    number_of_auctions = 1000
+    seed_fixed_token_dutch_auctions(access_control, bento_box, number_of_auctions)
+
 def deploy_n_number_fixed_token_crowdsale(access_control, bento_box, number_of_auction):
     
     ## To get miso market. not to deploy
@@ -29,9 +50,9 @@ def deploy_n_number_fixed_token_crowdsale(access_control, bento_box, number_of_a
 
 
 def deploy_n_number_fixed_token_dutch_auction(access_control, bento_box, number_of_auction):
+    miso_market = deploy_miso_market(access_control, bento_box, [])
     for i in range(number_of_auction):
         print("deploying dutch auction ----------- No.", i+1)
-        miso_market = deploy_miso_market(access_control, bento_box, [])
         initial_supply, token = deploy_fixed_token(access_control)
         token = FixedToken.at(token)
         token.approve(miso_market, initial_supply, {"from": accounts[0]})
@@ -39,11 +60,94 @@ def deploy_n_number_fixed_token_dutch_auction(access_control, bento_box, number_
 
 
 
+################################################
+# Bulk seeding
+###############################################
+def seed_fixed_token_dutch_auctions(access_control, bento_box, number_of_auctions):
+    ## Factories, templates and fees are resolved once for the whole run
+    miso_market = deploy_miso_market(access_control, bento_box, [])
+    token_factory = deploy_miso_token_factory(access_control)
+    fixed_token_template_id = token_factory.getTemplateId(get_address("fixed_token_template"))
+    dutch_auction_template_id = miso_market.getTemplateId(get_address("dutch_auction_template"))
+    token_fee = token_factory.minimumFee()
+    market_fee = miso_market.minimumFee()
+
+    for batch_start in range(0, number_of_auctions, SEED_BATCH_SIZE):
+        batch_size = min(SEED_BATCH_SIZE, number_of_auctions - batch_start)
+        print("seeding dutch auctions ----------- No.", batch_start + 1, "to", batch_start + batch_size)
+        initial_supplies = [get_initial_supply() for i in range(batch_size)]
+        tokens = seed_fixed_tokens(token_factory, fixed_token_template_id, token_fee, initial_supplies)
+        seed_dutch_auctions(miso_market, dutch_auction_template_id, market_fee, tokens, initial_supplies)
+
+
+def seed_fixed_tokens(token_factory, template_id, fee, initial_supplies):
+    owner = accounts[0]
+    nonce = owner.nonce
+    txs = []
+    for initial_supply in initial_supplies:
+        token_name, token_symbol = get_token_name_symbol()
+        _data = get_token_data(token_name, token_symbol, owner, initial_supply)
+        txs.append(token_factory.createToken(template_id, owner, _data, seed_tx_params(nonce, CREATE_TOKEN_GAS, fee)))
+        nonce += 1
+
+    receipts = wait_for_receipts(txs)
+    return [get_created_token(token_factory, receipt) for receipt in receipts]
+
+
+def seed_dutch_auctions(miso_market, template_id, fee, tokens, initial_supplies):
+    owner = accounts[0]
+    nonce = owner.nonce
+    txs = []
+    for token, initial_supply in zip(tokens, initial_supplies):
+        token_supply_for_factory = initial_supply - 100 * TENPOW18
+        _startTime, _endTime = get_auction_start_end()
+        _startPrice, _minimumPrice = get_start_minimum_price()
+        _data = get_dutch_auction_data(
+                           miso_market,
+                           token,
+                           initial_supply - 500 * TENPOW18,
+                           _startTime + SEED_START_DELAY,
+                           _endTime + SEED_START_DELAY,
+                           ETH_ADDRESS,
+                           _startPrice,
+                           _minimumPrice,
+                           owner,
+                           ZERO_ADDRESS,
+                           accounts[1]
+        )
+        # The approval is a plain transfer with encoded calldata, which saves
+        # looking up each token contract before sending.
+        txs.append(owner.transfer(token, 0, data=encode_approve_data(miso_market, token_supply_for_factory),
+                                  gas_limit=APPROVE_GAS, nonce=nonce, required_confs=0))
+        txs.append(miso_market.createMarket(template_id, token, token_supply_for_factory, owner, _data,
+                                            seed_tx_params(nonce + 1, CREATE_MARKET_GAS, fee)))
+        nonce += 2
+
+    wait_for_receipts(txs)
+
+
+def seed_tx_params(nonce, gas_limit, value=0):
+    return {"from": accounts[0], "nonce": nonce, "gas_limit": gas_limit, "value": value, "required_confs": 0}
+
+
+def get_created_token(token_factory, receipt):
+    topic = web3.keccak(text="TokenCreated(address,address,address)")
+    for log in receipt["logs"]:
+        if log["address"] == token_factory.address and log["topics"][0] == topic:
+            return web3.toChecksumAddress(bytes(log["topics"][2])[-20:])
+    raise ValueError("No TokenCreated event in " + receipt["transactionHash"].hex())
+
+
+def encode_approve_data(spender, amount):
+    selector = web3.keccak(text="approve(address,uint256)")[:4]
+    return "0x" + (bytes(selector) + encode_abi(["address", "uint256"], [str(spender), int(amount)])).hex()
+
+
 ################################################
 # DutchAuction
 ###############################################
 def deploy_dutch_auction(miso_market, access_control, token, initial_supply, payment_currency):
-    dutch_auction_template_address = CONTRACTS[network.show_active()]["dutch_auction_template"]
+    dutch_auction_template_address = get_address("dutch_auction_template")
     dutch_auction_template_id = miso_market.getTemplateId(dutch_auction_template_address)
 
     token_supply_for_factory = initial_supply - 100 * TENPOW18
@@ -87,9 +191,7 @@ def get_data_dutch_auction(_funder,
                            _point_list,
                            _wallet): 
 
-    dutch_auction_template = deploy_dutch_auction_template()
-
-    _data = dutch_auction_template.getAuctionInitData(
+    _data = get_dutch_auction_data(
                            _funder,
                            _token,
                            _totalTokens,
@@ -111,7 +213,7 @@ def get_data_dutch_auction(_funder,
 
 def deploy_crowdsale(miso_market, access_control, bento_box, token, initial_supply, payment_currency):
     ## This does not deploy only gets the address--
-    crowdsale_template_address = CONTRACTS[network.show_active()]["crowdsale_template"]
+    crowdsale_template_address = get_address("crowdsale_template")
     crowdsale_template_id = miso_market.getTemplateId(crowdsale_template_address)
     token_supply_for_factory = initial_supply - 100 * TENPOW18
     owner = accounts[0]
@@ -155,8 +257,7 @@ def get_data_crowdsale(_funder,
                        _point_list,
                        _wallet):
 
-    crowdsale_template = deploy_crowdsale_template()
-    _data = crowdsale_template.getCrowdsaleInitData(
+    _data = get_crowdsale_data(
                        _funder,
                        _token,
                        _paymentCurrency,
@@ -178,7 +279,7 @@ def get_data_crowdsale(_funder,
 
 def deploy_fixed_token(access_control):
     token_factory = deploy_miso_token_factory(access_control)
-    fixed_token_template_address = CONTRACTS[network.show_active()]["fixed_token_template"]
+    fixed_token_template_address = get_address("fixed_token_template")
     fixed_token_template_id = token_factory.getTemplateId(fixed_token_template_address)
     token_name, token_symbol = get_token_name_symbol()
     initial_supply = get_initial_supply()
@@ -202,9 +303,8 @@ def get_data_fixed_token(token_name,
                          token_symbol,
                          initial_supply):
 
-    fixed_token_template = deploy_fixed_token_template()
     owner = accounts[0]
-    _data = fixed_token_template.getInitData(
+    _data = get_token_data(
         token_name,
         token_symbol,
         owner,
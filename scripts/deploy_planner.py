@@ -0,0 +1,88 @@
+from brownie import *
+from brownie.network.transaction import TransactionReceipt
+from .contracts import publish
+from .deployment_ledger import get_address, record_deployment, record_step
+from .confirmations import wait_for_receipts
+
+
+class DeploymentPlanner:
+    # Builds a dependency graph of deployment steps and sends them in waves.
+    # Every step in a wave only depends on steps from earlier waves, so the
+    # whole wave is broadcast with pre-assigned nonces and the receipts are
+    # awaited in bulk before the next wave starts.
+
+    def __init__(self, deployer):
+        self.deployer = deployer
+        self.steps = {}
+        self.deployed = {}
+
+    def deploy(self, name, container, args=None, deps=()):
+        # Deploys `container` unless the deployment ledger or CONTRACTS
+        # already has an address for `name` on the active network.
+        def action(tx_params):
+            address = get_address(name)
+            if address != '':
+                return container.at(address)
+            self.steps[name]["args"] = args(self.deployed) if args else []
+            return container.deploy(*self.steps[name]["args"], tx_params)
+
+        self._add_step(name, action, deps, container)
+
+    def transact(self, name, action, deps=(), ledger_step=None):
+        # `action(deployed, tx_params)` sends a single transaction and returns
+        # its receipt, or returns None if there is nothing to do.
+        # `ledger_step` is a (contract, step) pair recorded once confirmed.
+        self._add_step(name, lambda tx_params: action(self.deployed, tx_params), deps, None)
+        self.steps[name]["ledger_step"] = ledger_step
+
+    def waves(self):
+        remaining = dict(self.steps)
+        done = set()
+        waves = []
+        while remaining:
+            wave = [name for name, step in remaining.items() if set(step["deps"]) <= done]
+            if not wave:
+                raise ValueError("DeploymentPlanner: dependency cycle in " + ", ".join(remaining))
+            for name in wave:
+                del remaining[name]
+            done.update(wave)
+            waves.append(wave)
+        return waves
+
+    def run(self):
+        for wave in self.waves():
+            nonce = self.deployer.nonce
+            pending = {}
+            for name in wave:
+                tx_params = {"from": self.deployer, "nonce": nonce, "required_confs": 0}
+                result = self.steps[name]["action"](tx_params)
+                if isinstance(result, TransactionReceipt):
+                    pending[name] = result
+                    nonce += 1
+                else:
+                    self.deployed[name] = result
+            receipts = wait_for_receipts(pending.values())
+            for (name, tx), receipt in zip(pending.items(), receipts):
+                self.deployed[name] = self._resolve(name, tx, receipt)
+        return self.deployed
+
+    def _add_step(self, name, action, deps, container):
+        if name in self.steps:
+            raise ValueError("DeploymentPlanner: duplicate step " + name)
+        for dep in deps:
+            if dep not in self.steps:
+                raise ValueError("DeploymentPlanner: " + name + " depends on unknown step " + dep)
+        self.steps[name] = {"action": action, "deps": list(deps), "container": container, "args": []}
+
+    def _resolve(self, name, tx, receipt):
+        step = self.steps[name]
+        if step["container"] is None:
+            if step["ledger_step"] is not None:
+                record_step(*step["ledger_step"])
+            return tx
+        contract = step["container"].at(receipt["contractAddress"])
+        record_deployment(name, contract, step["args"], tx_hash=tx.txid)
+        if publish():
+            step["container"].publish_source(contract)
+        return contract
+
@@ -0,0 +1,94 @@
+from brownie import *
+from .contract_addresses import *
+import json
+import os
+import tempfile
+
+# One JSON ledger per network, e.g. deployments/mainnet.json
+LEDGER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "deployments")
+
+
+def ledger_path():
+    return os.path.join(LEDGER_DIR, network.show_active() + ".json")
+
+
+def load_ledger():
+    path = ledger_path()
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_ledger(ledger):
+    # Write to a temporary file next to the ledger and rename it over the
+    # old one, so an interrupted run never leaves a half written ledger.
+    os.makedirs(LEDGER_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=LEDGER_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(ledger, f, indent=4, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, ledger_path())
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _update_ledger(key, update):
+    ledger = load_ledger()
+    entry = ledger.get(key, {})
+    update(entry)
+    ledger[key] = entry
+    _write_ledger(ledger)
+
+
+def bytecode_hash(address):
+    return web3.keccak(web3.eth.get_code(address)).hex()
+
+
+def _is_live(entry):
+    # A ledger entry is only trusted if the same code is still at the address.
+    # This catches chain resets on development networks and stale entries.
+    code = web3.eth.get_code(entry["address"])
+    return len(code) > 0 and web3.keccak(code).hex() == entry["bytecode_hash"]
+
+
+def get_address(key):
+    # Addresses deployed by these scripts come from the ledger, anything
+    # deployed by third parties comes from the static CONTRACTS dict.
+    entry = load_ledger().get(key)
+    if entry is not None and _is_live(entry):
+        return entry["address"]
+    return CONTRACTS[network.show_active()].get(key, '')
+
+
+def record_deployment(key, contract, constructor_args=(), tx_hash=None):
+    if tx_hash is None:
+        tx = getattr(contract, "tx", None)
+        tx_hash = tx.txid if tx is not None else ''
+
+    def update(entry):
+        entry.clear()
+        entry["address"] = contract.address
+        entry["tx_hash"] = tx_hash
+        entry["bytecode_hash"] = bytecode_hash(contract.address)
+        entry["constructor_args"] = [str(arg) for arg in constructor_args]
+        entry["steps"] = []
+
+    _update_ledger(key, update)
+
+
+def step_pending(key, step):
+    # Follow up transactions (init, template registration, ...) are only
+    # tracked for contracts this ledger deployed. Pre-configured addresses
+    # are assumed to be fully set up already.
+    entry = load_ledger().get(key)
+    if entry is None or entry["address"] != get_address(key):
+        return False
+    return step not in entry["steps"]
+
+
+def record_step(key, step):
+    _update_ledger(key, lambda entry: entry["steps"].append(step))
@@ -0,0 +1,425 @@
+from brownie import *
+from brownie.exceptions import VirtualMachineError
+from web3.exceptions import BlockNotFound
+from .settings import ZERO_ADDRESS
+from .deployment_ledger import get_address, load_ledger
+import os
+import sqlite3
+import time
+
+# Indexes the markets, tokens, farms and launchers created by the MISO
+# factories into a local SQLite database, so listing them is a query instead
+# of one eth_call per item through MISOHelper.
+#
+# The factories are backfilled in chunks of blocks from their deployment and
+# then tailed. Market state that can change later (start and end time,
+# finalized) follows the AuctionTimeUpdated, AuctionFinalized and
+# AuctionCancelled events. The hash of every indexed block with logs and of
+# every checkpoint is stored, and the index is rolled back to the last
+# common block when the chain reorganises.
+#
+#   brownie run scripts/event_indexer.py --network mainnet
+
+# One database per network, e.g. indexes/mainnet.sqlite
+INDEX_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "indexes")
+
+# Blocks per eth_getLogs request. Halved when a provider rejects a range for
+# returning too many logs.
+CHUNK_SIZE = 2000
+# Block hashes are kept this far behind the checkpoint, a deeper reorg stops
+# the indexer.
+REORG_DEPTH = 128
+POLL_INTERVAL = 15
+
+# Factory ledger key, kind of created contract, creation event and the event
+# that assigns template ids. All creation events share the same layout.
+FACTORIES = [
+    ("miso_market", "market", "MarketCreated(address,address,address)",
+        "AuctionTemplateAdded(address,uint256)"),
+    ("miso_token_factory", "token", "TokenCreated(address,address,address)",
+        "TokenTemplateAdded(address,uint256)"),
+    ("farm_factory", "farm", "FarmCreated(address,address,address)",
+        "FarmTemplateAdded(address,uint256)"),
+    ("miso_launcher", "launcher", "LauncherCreated(address,address,address)",
+        "LauncherTemplateAdded(address,uint256)"),
+]
+
+AUCTION_TIME_UPDATED = "AuctionTimeUpdated(uint256,uint256)"
+AUCTION_FINALIZED = "AuctionFinalized()"
+AUCTION_CANCELLED = "AuctionCancelled()"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    block_number INTEGER NOT NULL,
+    block_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    block_number INTEGER PRIMARY KEY,
+    block_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS templates (
+    kind TEXT NOT NULL,
+    template TEXT NOT NULL,
+    template_id INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE TABLE IF NOT EXISTS created (
+    addr TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    template TEXT NOT NULL,
+    template_id INTEGER NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS created_order ON created (kind, block_number, log_index);
+CREATE TABLE IF NOT EXISTS markets (
+    addr TEXT PRIMARY KEY,
+    auction_token TEXT,
+    start_time INTEGER,
+    end_time INTEGER,
+    finalized INTEGER,
+    state_block INTEGER
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    addr TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    decimals INTEGER NOT NULL
+);
+"""
+
+
+def index_path():
+    return os.path.join(INDEX_DIR, network.show_active() + ".sqlite")
+
+
+def event_topic(signature):
+    return web3.keccak(text=signature).hex()
+
+
+def topic_address(topic):
+    return web3.toChecksumAddress(bytes(topic)[-20:])
+
+
+def data_word(data, index):
+    data = bytes.fromhex(data[2:]) if isinstance(data, str) else bytes(data)
+    return data[32 * index:32 * (index + 1)]
+
+
+def _deployment_block(key):
+    tx_hash = load_ledger().get(key, {}).get("tx_hash")
+    if not tx_hash:
+        return None
+    return web3.eth.get_transaction_receipt(tx_hash)["blockNumber"]
+
+
+class EventIndexer:
+    def __init__(self, path=None, factories=None, start_block=None, chunk_size=CHUNK_SIZE):
+        # `factories` maps the FACTORIES ledger keys to addresses, by default
+        # they are looked up in the deployment ledger
+        if factories is None:
+            factories = {key: get_address(key) for key, _, _, _ in FACTORIES}
+        self.factories = {}
+        self.topics = {}
+        for key, kind, created, template_added in FACTORIES:
+            if not factories.get(key):
+                continue
+            self.factories[web3.toChecksumAddress(factories[key])] = kind
+            self.topics[event_topic(created)] = "created"
+            self.topics[event_topic(template_added)] = "template"
+        self.market_topics = {
+            event_topic(AUCTION_TIME_UPDATED): "time",
+            event_topic(AUCTION_FINALIZED): "finalized",
+            event_topic(AUCTION_CANCELLED): "finalized",
+        }
+        if start_block is None:
+            blocks = [_deployment_block(key) for key, _, _, _ in FACTORIES if factories.get(key)]
+            blocks = [block for block in blocks if block is not None]
+            start_block = min(blocks) if blocks else 0
+        self.start_block = start_block
+        self.chunk_size = chunk_size
+
+        if path is None:
+            path = index_path()
+            os.makedirs(INDEX_DIR, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    #####################################
+    # Syncing
+    #####################################
+
+    def checkpoint(self):
+        return self.db.execute("SELECT block_number, block_hash FROM checkpoint").fetchone()
+
+    def sync(self, to_block=None):
+        # Indexes up to `to_block`, the latest block by default. Returns the
+        # number of the last indexed block.
+        if to_block is None:
+            to_block = web3.eth.block_number
+        self._handle_reorg()
+        checkpoint = self.checkpoint()
+        from_block = checkpoint[0] + 1 if checkpoint is not None else self.start_block
+        while from_block <= to_block:
+            chunk_end = min(from_block + self.chunk_size - 1, to_block)
+            try:
+                logs, block_hash = self._get_logs(from_block, chunk_end)
+            except ValueError as e:
+                if self.chunk_size == 1:
+                    raise
+                # Too many logs in the range, retry with half the blocks
+                self.chunk_size = max(self.chunk_size // 2, 1)
+                print("eth_getLogs failed, chunk size is now", self.chunk_size, ":", e)
+                continue
+            if block_hash is None:
+                # The chain changed under the request, check it again
+                self._handle_reorg()
+                checkpoint = self.checkpoint()
+                from_block = checkpoint[0] + 1 if checkpoint is not None else self.start_block
+                continue
+            with self.db:
+                self._index_logs(logs)
+                self._refresh_markets()
+                self._set_checkpoint(chunk_end, block_hash)
+            from_block = chunk_end + 1
+        return to_block
+
+    def tail(self, poll_interval=POLL_INTERVAL):
+        while True:
+            self.sync()
+            time.sleep(poll_interval)
+
+    def _get_logs(self, from_block, to_block):
+        # Returns the logs with the hash of `to_block`, or None as the hash
+        # when `to_block` was replaced while the logs were fetched
+        block_hash = web3.eth.get_block(to_block)["hash"].hex()
+        logs = web3.eth.get_logs({
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "address": list(self.factories),
+            "topics": [list(self.topics)],
+        })
+        # Auctions are not known up front, their events are matched by topic
+        # and filtered locally
+        market_logs = web3.eth.get_logs({
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [list(self.market_topics)],
+        })
+        if web3.eth.get_block(to_block)["hash"].hex() != block_hash:
+            return [], None
+        logs = list(logs) + list(market_logs)
+        logs.sort(key=lambda log: (log["blockNumber"], log["logIndex"]))
+        return logs, block_hash
+
+    def _set_checkpoint(self, block_number, block_hash):
+        self.db.execute("INSERT OR REPLACE INTO checkpoint VALUES (0, ?, ?)", (block_number, block_hash))
+        self.db.execute("INSERT OR REPLACE INTO blocks VALUES (?, ?)", (block_number, block_hash))
+        self.db.execute("DELETE FROM blocks WHERE block_number < ?", (block_number - REORG_DEPTH,))
+
+    #####################################
+    # Reorgs
+    #####################################
+
+    def _handle_reorg(self):
+        checkpoint = self.checkpoint()
+        if checkpoint is None or self._is_canonical(*checkpoint):
+            return
+        stored = self.db.execute("SELECT block_number, block_hash FROM blocks ORDER BY block_number DESC").fetchall()
+        for block_number, block_hash in stored:
+            if self._is_canonical(block_number, block_hash):
+                print("Reorg detected, rolling back the index to block", block_number)
+                with self.db:
+                    self._rollback(block_number)
+                    self._set_checkpoint(block_number, block_hash)
+                return
+        raise RuntimeError("Reorg deeper than " + str(REORG_DEPTH) + " blocks, rebuild the index")
+
+    def _is_canonical(self, block_number, block_hash):
+        try:
+            return web3.eth.get_block(block_number)["hash"].hex() == block_hash
+        except BlockNotFound:
+            # The chain is shorter than the index
+            return False
+
+    def _rollback(self, block_number):
+        self.db.execute("DELETE FROM markets WHERE addr IN (SELECT addr FROM created WHERE block_number > ?)",
+                        (block_number,))
+        for table in ["created", "templates", "blocks"]:
+            self.db.execute("DELETE FROM " + table + " WHERE block_number > ?", (block_number,))
+        # Market state read or updated after the common block may come from the
+        # dropped blocks, it is read again at the new head
+        self.db.execute("UPDATE markets SET state_block = NULL WHERE state_block > ?", (block_number,))
+
+    #####################################
+    # Indexing
+    #####################################
+
+    def _index_logs(self, logs):
+        for log in logs:
+            topic = log["topics"][0].hex()
+            address = web3.toChecksumAddress(log["address"])
+            if topic in self.market_topics:
+                self._index_market_event(self.market_topics[topic], address, log)
+                continue
+            kind = self.factories.get(address)
+            if kind is None:
+                continue
+            self.db.execute("INSERT OR REPLACE INTO blocks VALUES (?, ?)",
+                            (log["blockNumber"], log["blockHash"].hex()))
+            if self.topics[topic] == "template":
+                template = web3.toChecksumAddress(data_word(log["data"], 0)[-20:])
+                template_id = int.from_bytes(data_word(log["data"], 1), "big")
+                self.db.execute("INSERT OR REPLACE INTO templates VALUES (?, ?, ?, ?, ?)",
+                                (kind, template, template_id, log["blockNumber"], log["logIndex"]))
+            else:
+                self._index_created(kind, address, log)
+
+    def _index_created(self, kind, factory, log):
+        addr = topic_address(log["topics"][2])
+        template = web3.toChecksumAddress(data_word(log["data"], 0)[-20:])
+        row = self.db.execute(
+            "SELECT template_id FROM templates WHERE kind = ? AND template = ?"
+            " ORDER BY block_number DESC, log_index DESC LIMIT 1", (kind, template)).fetchone()
+        if row is not None:
+            template_id = row[0]
+        else:
+            # The template was added before the start block
+            template_id = self._template_id(kind, factory, addr, template)
+        self.db.execute("INSERT OR REPLACE INTO created VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (
+            addr, kind, topic_address(log["topics"][1]), template, template_id,
+            log["blockNumber"], log["logIndex"], log["transactionHash"].hex()))
+        if kind == "market":
+            self.db.execute("INSERT OR REPLACE INTO markets (addr) VALUES (?)", (addr,))
+        elif kind == "token":
+            self._index_token(addr)
+
+    def _index_market_event(self, event, addr, log):
+        row = self.db.execute("SELECT state_block FROM markets WHERE addr = ?", (addr,)).fetchone()
+        # Events at or before the block the state was read at are already in it
+        if row is None or row[0] is None or log["blockNumber"] <= row[0]:
+            return
+        self.db.execute("INSERT OR REPLACE INTO blocks VALUES (?, ?)",
+                        (log["blockNumber"], log["blockHash"].hex()))
+        if event == "time":
+            start_time = int.from_bytes(data_word(log["data"], 0), "big")
+            end_time = int.from_bytes(data_word(log["data"], 1), "big")
+            self.db.execute("UPDATE markets SET start_time = ?, end_time = ?, state_block = ? WHERE addr = ?",
+                            (start_time, end_time, log["blockNumber"], addr))
+        else:
+            self.db.execute("UPDATE markets SET finalized = 1, state_block = ? WHERE addr = ?",
+                            (log["blockNumber"], addr))
+
+    def _refresh_markets(self):
+        # Reads the state of new markets, and of markets whose state was
+        # invalidated by a reorg, at one block. Markets deployed without init
+        # data are read again until they are initialised.
+        stale = [row[0] for row in self.db.execute(
+            "SELECT addr FROM markets WHERE state_block IS NULL OR auction_token = ?", (ZERO_ADDRESS,))]
+        if not stale:
+            return
+        block_number = web3.eth.block_number
+        for addr in stale:
+            auction = Contract.from_abi("MISOAuction", addr, DutchAuction.abi)
+            auction_token, start_time, end_time, finalized = auction.getBaseInformation(
+                block_identifier=block_number)
+            self.db.execute(
+                "UPDATE markets SET auction_token = ?, start_time = ?, end_time = ?, finalized = ?,"
+                " state_block = ? WHERE addr = ?",
+                (auction_token, start_time, end_time, int(finalized), block_number, addr))
+            self._index_token(auction_token)
+
+    def _index_token(self, addr):
+        # Name, symbol and decimals never change, they are read once
+        if addr == ZERO_ADDRESS:
+            return
+        if self.db.execute("SELECT 1 FROM tokens WHERE addr = ?", (addr,)).fetchone() is not None:
+            return
+        token = Contract.from_abi("ERC20", addr, FixedToken.abi)
+        try:
+            name, symbol, decimals = token.name(), token.symbol(), token.decimals()
+        except (ValueError, VirtualMachineError):
+            # Not every auction token implements the optional metadata
+            name, symbol, decimals = "", "", 0
+        self.db.execute("INSERT INTO tokens VALUES (?, ?, ?, ?)", (addr, name, symbol, decimals))
+
+    def _template_id(self, kind, factory, addr, template):
+        if kind == "market":
+            return MISOMarket.at(factory).getMarketTemplateId(addr)
+        if kind == "token":
+            return MISOTokenFactory.at(factory).tokenInfo(addr)[1]
+        if kind == "farm":
+            return MISOFarmFactory.at(factory).getTemplateId(template)
+        return MISOLauncher.at(factory).getTemplateId(template)
+
+    #####################################
+    # Queries, in the shapes MISOHelper returns
+    #####################################
+
+    def _page(self, query, args, page_size, page_nbr, offset):
+        # Same paging as MISOHelper, without a page size everything is returned
+        if page_size is None:
+            return self.db.execute(query, args).fetchall()
+        return self.db.execute(query + " LIMIT ? OFFSET ?",
+                               args + (page_size, page_nbr * page_size + offset)).fetchall()
+
+    def _token_info(self, addr):
+        row = self.db.execute("SELECT addr, decimals, name, symbol FROM tokens WHERE addr = ?", (addr,)).fetchone()
+        if row is None:
+            row = (addr, 0, "", "")
+        return {"addr": row[0], "decimals": row[1], "name": row[2], "symbol": row[3]}
+
+    def get_markets(self, page_size=None, page_nbr=0, offset=0):
+        rows = self._page(
+            "SELECT created.addr, template_id, start_time, end_time, finalized, auction_token"
+            " FROM created JOIN markets ON created.addr = markets.addr"
+            " ORDER BY block_number, log_index", (), page_size, page_nbr, offset)
+        return [{
+            "addr": addr,
+            "templateId": template_id,
+            "startTime": start_time,
+            "endTime": end_time,
+            "finalized": bool(finalized),
+            "tokenInfo": self._token_info(auction_token),
+        } for addr, template_id, start_time, end_time, finalized, auction_token in rows]
+
+    def get_tokens(self, page_size=None, page_nbr=0, offset=0):
+        rows = self._page("SELECT addr FROM created WHERE kind = 'token' ORDER BY block_number, log_index",
+                          (), page_size, page_nbr, offset)
+        return [self._token_info(row[0]) for row in rows]
+
+    def _get_created(self, kind, page_size, page_nbr, offset):
+        # Farm pools and launcher state change without events, only the
+        # contracts and their templates are indexed
+        rows = self._page(
+            "SELECT addr, template_id, owner FROM created WHERE kind = ? ORDER BY block_number, log_index",
+            (kind,), page_size, page_nbr, offset)
+        return [{"addr": addr, "templateId": template_id, "owner": owner} for addr, template_id, owner in rows]
+
+    def get_farms(self, page_size=None, page_nbr=0, offset=0):
+        return self._get_created("farm", page_size, page_nbr, offset)
+
+    def get_launchers(self, page_size=None, page_nbr=0, offset=0):
+        return self._get_created("launcher", page_size, page_nbr, offset)
+
+    def number_of_auctions(self):
+        return self.db.execute("SELECT COUNT(*) FROM created WHERE kind = 'market'").fetchone()[0]
+
+    def number_of_tokens(self):
+        return self.db.execute("SELECT COUNT(*) FROM created WHERE kind = 'token'").fetchone()[0]
+
+
+def main():
+    indexer = EventIndexer()
+    last_block = indexer.sync()
+    print("Indexed", indexer.number_of_auctions(), "markets and", indexer.number_of_tokens(),
+          "tokens up to block", last_block)
+    indexer.tail()
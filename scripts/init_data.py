@@ -0,0 +1,149 @@
+from brownie.convert import Wei, to_address
+
+try:
+    from eth_abi import encode as encode_abi
+except ImportError:
+    from eth_abi import encode_abi
+
+# Local versions of the get*InitData helpers on the MISO templates.
+# Each template encodes its init arguments with abi.encode, so the same
+# bytes can be built here without a call to a deployed template.
+
+DUTCH_AUCTION_TYPES = [
+    "address",  # funder
+    "address",  # token
+    "uint256",  # totalTokens
+    "uint256",  # startTime
+    "uint256",  # endTime
+    "address",  # paymentCurrency
+    "uint256",  # startPrice
+    "uint256",  # minimumPrice
+    "address",  # admin
+    "address",  # pointList
+    "address",  # wallet
+]
+
+HYPERBOLIC_AUCTION_TYPES = [
+    "address",  # funder
+    "address",  # token
+    "uint256",  # totalTokens
+    "uint256",  # startTime
+    "uint256",  # endTime
+    "address",  # paymentCurrency
+    "uint256",  # factor
+    "uint256",  # minimumPrice
+    "address",  # admin
+    "address",  # pointList
+    "address",  # wallet
+]
+
+CROWDSALE_TYPES = [
+    "address",  # funder
+    "address",  # token
+    "address",  # paymentCurrency
+    "uint256",  # totalTokens
+    "uint256",  # startTime
+    "uint256",  # endTime
+    "uint256",  # rate
+    "uint256",  # goal
+    "address",  # admin
+    "address",  # pointList
+    "address",  # wallet
+]
+
+BATCH_AUCTION_TYPES = [
+    "address",  # funder
+    "address",  # token
+    "uint256",  # totalTokens
+    "uint256",  # startTime
+    "uint256",  # endTime
+    "address",  # paymentCurrency
+    "uint256",  # minimumCommitmentAmount
+    "address",  # admin
+    "address",  # pointList
+    "address",  # wallet
+]
+
+# FixedToken, MintableToken and SushiToken share the same init data
+TOKEN_TYPES = [
+    "string",   # name
+    "string",   # symbol
+    "address",  # owner
+    "uint256",  # initialSupply
+]
+
+MASTERCHEF_TYPES = [
+    "address",  # rewards
+    "uint256",  # rewardsPerBlock
+    "uint256",  # startBlock
+    "address",  # divaddr
+    "address",  # accessControls
+]
+
+POST_AUCTION_LAUNCHER_TYPES = [
+    "address",  # market
+    "address",  # factory
+    "address",  # admin
+    "address",  # wallet
+    "uint256",  # liquidityPercent
+    "uint256",  # locktime
+]
+
+
+def encode_init_data(types, values):
+    # Values are converted the same way brownie converts contract call
+    # arguments, so contracts, accounts, floats and strings like "1 ether"
+    # all encode to the bytes the template would return.
+    if len(types) != len(values):
+        raise ValueError("Expected " + str(len(types)) + " values, got " + str(len(values)))
+    converted = []
+    for abi_type, value in zip(types, values):
+        if abi_type == "address":
+            converted.append(to_address(str(value)))
+        elif abi_type == "uint256":
+            converted.append(int(Wei(value)))
+        else:
+            converted.append(value)
+    return encode_abi(types, converted)
+
+
+def get_dutch_auction_data(funder, token, total_tokens, start_time, end_time, payment_currency,
+                           start_price, minimum_price, admin, point_list, wallet):
+    return encode_init_data(DUTCH_AUCTION_TYPES, [
+        funder, token, total_tokens, start_time, end_time, payment_currency,
+        start_price, minimum_price, admin, point_list, wallet])
+
+
+def get_hyperbolic_auction_data(funder, token, total_tokens, start_time, end_time, payment_currency,
+                                factor, minimum_price, admin, point_list, wallet):
+    return encode_init_data(HYPERBOLIC_AUCTION_TYPES, [
+        funder, token, total_tokens, start_time, end_time, payment_currency,
+        factor, minimum_price, admin, point_list, wallet])
+
+
+def get_crowdsale_data(funder, token, payment_currency, total_tokens, start_time, end_time,
+                       rate, goal, admin, point_list, wallet):
+    return encode_init_data(CROWDSALE_TYPES, [
+        funder, token, payment_currency, total_tokens, start_time, end_time,
+        rate, goal, admin, point_list, wallet])
+
+
+def get_batch_auction_data(funder, token, total_tokens, start_time, end_time, payment_currency,
+                           minimum_commitment_amount, admin, point_list, wallet):
+    return encode_init_data(BATCH_AUCTION_TYPES, [
+        funder, token, total_tokens, start_time, end_time, payment_currency,
+        minimum_commitment_amount, admin, point_list, wallet])
+
+
+def get_token_data(name, symbol, owner, initial_supply):
+    return encode_init_data(TOKEN_TYPES, [name, symbol, owner, initial_supply])
+
+
+def get_masterchef_data(rewards, rewards_per_block, start_block, divaddr, access_controls):
+    return encode_init_data(MASTERCHEF_TYPES, [
+        rewards, rewards_per_block, start_block, divaddr, access_controls])
+
+
+def get_post_auction_launcher_data(market, factory, admin, wallet, liquidity_percent, locktime):
+    return encode_init_data(POST_AUCTION_LAUNCHER_TYPES, [
+        market, factory, admin, wallet, liquidity_percent, locktime])
@@ -0,0 +1,95 @@
+from brownie import *
+from eth_utils import keccak, to_checksum_address
+import csv
+import json
+
+# Builds the Merkle tree of a MerkleList from a CSV with one account,points
+# row per account, and writes the proof of every account.
+#
+# The CSV is read twice, once to hash the leaves and once to write the
+# proofs, so only the 32 byte hashes of the tree are kept in memory. Proofs
+# go to a JSON lines file, one {"account", "points", "proof"} per row in
+# the order of the CSV.
+#
+#   brownie run scripts/merkle_list.py main allowlist.csv proofs.jsonl
+#
+# Leaves are keccak256(abi.encodePacked(account, points)) and pairs are
+# sorted before hashing, as in OpenZeppelin's MerkleProof.
+
+EMPTY_ROOT = bytes(32)
+
+
+def leaf_hash(account, points):
+    return keccak(bytes.fromhex(to_checksum_address(account)[2:]) + int(points).to_bytes(32, "big"))
+
+
+def hash_pair(a, b):
+    return keccak(a + b) if a <= b else keccak(b + a)
+
+
+def read_csv(path):
+    # Yields (account, points) rows, a header row is skipped
+    with open(path, newline="") as f:
+        for i, row in enumerate(csv.reader(f)):
+            if not row or not row[0].strip():
+                continue
+            account, points = row[0].strip(), row[1].strip()
+            if i == 0 and not account.startswith("0x"):
+                continue
+            yield to_checksum_address(account), int(points)
+
+
+class MerkleTree:
+    def __init__(self, leaves):
+        # An unpaired node at the end of a level moves up as it is
+        self.levels = [list(leaves)]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parents = [hash_pair(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parents.append(level[-1])
+            self.levels.append(parents)
+
+    def __len__(self):
+        return len(self.levels[0])
+
+    @property
+    def root(self):
+        if not self.levels[0]:
+            return EMPTY_ROOT
+        return self.levels[-1][0]
+
+    def proof(self, index):
+        proof = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                proof.append(level[sibling])
+            index //= 2
+        return proof
+
+
+def verify(proof, root, leaf):
+    computed = leaf
+    for node in proof:
+        computed = hash_pair(computed, node)
+    return computed == root
+
+
+def build_from_csv(path):
+    return MerkleTree(leaf_hash(account, points) for account, points in read_csv(path))
+
+
+def write_proofs(csv_path, tree, out_path):
+    with open(out_path, "w") as f:
+        for i, (account, points) in enumerate(read_csv(csv_path)):
+            proof = ["0x" + node.hex() for node in tree.proof(i)]
+            f.write(json.dumps({"account": account, "points": points, "proof": proof}) + "\n")
+
+
+def main(csv_path, out_path=None):
+    tree = build_from_csv(csv_path)
+    print(len(tree), "accounts, Merkle root", "0x" + tree.root.hex())
+    if out_path is not None:
+        write_proofs(csv_path, tree, out_path)
+        print("Proofs written to", out_path)
@@ -0,0 +1,58 @@
+from brownie import *
+from .deployment_ledger import get_address
+
+# Batches view calls on any contracts into one eth_call through the
+# Multicall contract, e.g.
+#
+#   client = MulticallClient()
+#   totals, balance = client.read([
+#       (dutch_auction.marketStatus, ()),
+#       (fixed_token.balanceOf, (dutch_auction,)),
+#   ])
+#
+# Every read is pinned to one block. Identical calls are only sent once
+# per block, within a read and across reads, until a new block arrives.
+
+# Calls per eth_call, kept below the gas cap of common providers
+MULTICALL_BATCH_SIZE = 500
+
+
+class MulticallClient:
+    def __init__(self, multicall=None, batch_size=MULTICALL_BATCH_SIZE):
+        if multicall is None:
+            multicall = Multicall.at(get_address("multicall"))
+        self.multicall = multicall
+        self.batch_size = batch_size
+        # Number of eth_calls sent to the Multicall contract
+        self.eth_calls = 0
+        self._block = None
+        self._results = {}
+
+    def read(self, calls, block_identifier=None, require_success=True):
+        # `calls` is a list of (view function, args). Returns the decoded
+        # outputs in the same order, at the latest block by default. With
+        # `require_success` off, calls that revert return None.
+        block = web3.eth.block_number if block_identifier is None else block_identifier
+        if block != self._block:
+            self._block = block
+            self._results = {}
+
+        keys = [(fn._address, fn.encode_input(*args)) for fn, args in calls]
+        pending = list(dict.fromkeys(key for key in keys if key not in self._results))
+        for i in range(0, len(pending), self.batch_size):
+            batch = pending[i:i + self.batch_size]
+            results = self.multicall.tryAggregate.call(False, batch, block_identifier=block)
+            self.eth_calls += 1
+            for key, (success, data) in zip(batch, results):
+                self._results[key] = (success, data)
+
+        outputs = []
+        for (fn, args), key in zip(calls, keys):
+            success, data = self._results[key]
+            if not success:
+                if require_success:
+                    raise ValueError("Call to " + fn._name + " on " + fn._address + " reverted")
+                outputs.append(None)
+                continue
+            outputs.append(fn.decode_output(data))
+        return outputs
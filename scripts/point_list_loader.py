@@ -0,0 +1,141 @@
+from brownie import *
+from collections import deque
+from .confirmations import required_confirmations
+from .merkle_list import read_csv
+from .multicall import MulticallClient
+import json
+import os
+
+# Loads a large allowlist into a PointList from a CSV with one account,points
+# row per account.
+#
+# Rows are read from the file in batches and compared with the current
+# `points` of the list through Multicall, only the rows that change anything
+# are sent. setPoints chunks are sized to a target gas per transaction from
+# the estimate of the first chunk, and several are kept pending at once.
+#
+# Progress is saved next to the CSV after each confirmed chunk. A run that
+# stops halfway resumes after the last confirmed row. Rows that were sent
+# but not confirmed are compared again, so nothing is written twice.
+#
+#   brownie run scripts/point_list_loader.py main <point list> allowlist.csv --network mainnet
+
+# Gas per setPoints transaction
+TARGET_GAS = 6000000
+# Rows sent in the first chunk, whose gas estimate sizes the next ones
+SAMPLE_SIZE = 50
+# Rows compared with the list per read
+READ_BATCH_SIZE = 1000
+# setPoints transactions pending at once
+MAX_PENDING = 4
+
+
+def checkpoint_path(csv_path, point_list):
+    return "{}.{}.checkpoint".format(csv_path, point_list.address)
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class PointListLoader:
+    def __init__(self, point_list, csv_path, sender, client=None, target_gas=TARGET_GAS,
+                 sample_size=SAMPLE_SIZE, read_batch_size=READ_BATCH_SIZE, max_pending=MAX_PENDING):
+        # `sender` must be an admin or operator of the list
+        self.point_list = point_list
+        self.csv_path = csv_path
+        self.sender = sender
+        self.client = MulticallClient() if client is None else client
+        self.target_gas = target_gas
+        self.sample_size = sample_size
+        self.read_batch_size = read_batch_size
+        self.max_pending = max_pending
+        self.checkpoint_path = checkpoint_path(csv_path, point_list)
+
+        self.chunk_size = None
+        self.rows_done = 0
+        self.unchanged = 0
+        self.written = 0
+        self.transactions = []
+        self._pending = deque()
+
+    def load(self):
+        # Returns the number of rows written to the list
+        self.rows_done = self._read_checkpoint()
+        rows = ((row, account, points) for row, (account, points) in enumerate(read_csv(self.csv_path))
+                if row >= self.rows_done)
+        chunk = []
+        last_row = None
+        for batch in _batches(rows, self.read_batch_size):
+            calls = [(self.point_list.points, (account,)) for _, account, _ in batch]
+            current = self.client.read(calls)
+            for (row, account, points), current_points in zip(batch, current):
+                if points == current_points:
+                    self.unchanged += 1
+                    continue
+                chunk.append((row, account, points))
+                if len(chunk) == (self.chunk_size or self.sample_size):
+                    self._send(chunk)
+                    chunk = []
+            last_row = batch[-1][0] + 1
+            if not chunk and not self._pending:
+                # Everything read so far is on chain already
+                self._write_checkpoint(last_row)
+        if chunk:
+            self._send(chunk)
+        while self._pending:
+            self._confirm_oldest()
+        if last_row is not None:
+            self._write_checkpoint(last_row)
+        return self.written
+
+    def _send(self, chunk):
+        chunk_accounts = [account for _, account, _ in chunk]
+        amounts = [points for _, _, points in chunk]
+        if self.chunk_size is None:
+            gas = self.point_list.setPoints.estimate_gas(chunk_accounts, amounts, {"from": self.sender})
+            self.chunk_size = max(int(self.target_gas * len(chunk) / gas), 1)
+        while len(self._pending) >= self.max_pending:
+            self._confirm_oldest()
+        tx = self.point_list.setPoints(chunk_accounts, amounts, {"from": self.sender, "required_confs": 0})
+        self.transactions.append(tx)
+        self._pending.append((tx, chunk[-1][0] + 1, len(chunk)))
+
+    def _confirm_oldest(self):
+        tx, rows_through, rows = self._pending.popleft()
+        tx.wait(required_confirmations())
+        if tx.status != 1:
+            raise ValueError("setPoints reverted in " + tx.txid + ", resume after fixing the cause")
+        self.written += rows
+        self._write_checkpoint(rows_through)
+
+    def _read_checkpoint(self):
+        if not os.path.exists(self.checkpoint_path):
+            return 0
+        with open(self.checkpoint_path) as f:
+            return json.load(f)["rows_done"]
+
+    def _write_checkpoint(self, rows_done):
+        # Written to a temporary file and renamed, a crash never leaves half
+        # a checkpoint
+        self.rows_done = rows_done
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"rows_done": rows_done}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+
+def main(point_list, csv_path):
+    point_list = PointList.at(point_list)
+    loader = PointListLoader(point_list, csv_path, accounts[0])
+    written = loader.load()
+    print(written, "rows written in", len(loader.transactions), "transactions,",
+          loader.unchanged, "rows already on chain")
+    print("Total points", point_list.totalPoints())
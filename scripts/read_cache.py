@@ -0,0 +1,105 @@
+from brownie import *
+from collections import OrderedDict
+from concurrent.futures import Future
+import threading
+import time
+
+# Caches view calls, such as MISOHelper.getFarmDetail or
+# CalculationsSushiswap.getPriceUsdc, by contract, method, arguments and
+# block number. Every call is made at an explicit block, so a cached result
+# is exact for that block and is dropped once a new block arrives.
+#
+#   cache = ReadCache()
+#   farm_info, user_infos = cache.call(miso_helper.getFarmDetail, farm, user)
+#
+# Safe to share between threads. Callers asking for the same key while it
+# is being fetched wait for that request instead of sending their own.
+
+# Maximum number of cached results, the least recently used go first
+READ_CACHE_SIZE = 10000
+# Seconds the latest block number is trusted before it is asked for again
+BLOCK_POLL_INTERVAL = 1
+
+
+def _freeze(value):
+    # Arguments as a hashable key, contracts and accounts by address
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if hasattr(value, "address"):
+        return str(value.address)
+    return value
+
+
+def _method_key(fn):
+    # Brownie contract methods by address and name, anything else by identity
+    if hasattr(fn, "_address"):
+        return (fn._address, fn._name)
+    return fn
+
+
+class ReadCache:
+    def __init__(self, max_size=READ_CACHE_SIZE, block_poll_interval=BLOCK_POLL_INTERVAL):
+        self.max_size = max_size
+        self.block_poll_interval = block_poll_interval
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._results = OrderedDict()
+        self._in_flight = {}
+        self._block = None
+        self._block_checked = 0
+
+    def latest_block(self):
+        with self._lock:
+            if self._block is not None and time.time() - self._block_checked < self.block_poll_interval:
+                return self._block
+        block = web3.eth.block_number
+        with self._lock:
+            if self._block is None or block > self._block:
+                # Everything cached is for older blocks now
+                self._results.clear()
+                self._block = block
+            self._block_checked = time.time()
+            return self._block
+
+    def call(self, fn, *args, block_identifier=None):
+        # Calls `fn(*args, block_identifier=block)` once per block, at the
+        # latest block by default
+        block = self.latest_block() if block_identifier is None else block_identifier
+        key = (_method_key(fn), _freeze(args), block)
+
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return self._results[key]
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not owner:
+            return future.result()
+
+        try:
+            result = fn(*args, block_identifier=block)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._in_flight[key]
+            # Results for a block that is already gone are not kept
+            if self._block is None or block >= self._block:
+                self._results[key] = result
+                if len(self._results) > self.max_size:
+                    self._results.popitem(last=False)
+        future.set_result(result)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
@@ -6,7 +6,7 @@ import time
 
 
 def verify(contract_id, container):
-    contract_address = CONTRACTS[network.show_active()][contract_id]
+    contract_address = get_address(contract_id)
     contract = container.at(contract_address)
     print(contract_id, ": Verification initiated..")
     try:
@@ -6,18 +6,71 @@ import pytest
 from settings import *
 
 
+#####################################
+# Session baseline
+######################################
+# Contracts that don't depend on the chain time are session scoped and
+# deployed once. The chain is then snapshotted, and module_isolation, which
+# brownie runs around every module, reverts to this snapshot instead of
+# resetting to an empty chain. Auctions stay module scoped.
+#
+# Every session fixture needed by a collected test is deployed before the
+# snapshot, otherwise one first requested inside a module would be reverted
+# away at the end of that module while pytest keeps it cached.
+#
+# chain.snapshot() only keeps one snapshot, which fn_isolation takes before
+# every test, so the session snapshot is taken on the node itself.
+
+def _evm_snapshot():
+    return web3.provider.make_request("evm_snapshot", [])["result"]
+
+
+@pytest.fixture(scope='session', autouse=True)
+def session_baseline(request):
+    for name in _session_fixture_names(request.session.items):
+        request.getfixturevalue(name)
+    return {"snapshot": _evm_snapshot()}
+
+
+@pytest.fixture(scope='module')
+def module_isolation(session_baseline):
+    # Replaces brownie's module_isolation, which resets to an empty chain
+    yield
+    web3.provider.make_request("evm_revert", [session_baseline["snapshot"]])
+    # The node drops a snapshot once reverted to
+    session_baseline["snapshot"] = _evm_snapshot()
+    # Resyncs chain.time() with the reverted node
+    chain.sleep(0)
+
+
+def _session_fixture_names(items):
+    names = []
+    for item in items:
+        fixture_info = getattr(item, "_fixtureinfo", None)
+        if fixture_info is None:
+            continue
+        for name in item.fixturenames:
+            fixture_defs = fixture_info.name2fixturedefs.get(name)
+            if not fixture_defs or name == "session_baseline" or name in names:
+                continue
+            fixture_def = fixture_defs[-1]
+            if fixture_def.scope == 'session' and fixture_def.func.__module__ == __name__:
+                names.append(name)
+    return names
+
+
 #####################################
 # MISOAccessControls
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def miso_access_controls(MISOAccessControls):
     access_controls = MISOAccessControls.deploy({'from': accounts[0]})
     access_controls.initAccessControls(accounts[0], {'from': accounts[0]})
     access_controls.addOperatorRole(accounts[0], {'from': accounts[0]})
     return access_controls
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def public_access_controls(MISOAccessControls):
     access_controls = MISOAccessControls.deploy({'from': accounts[0]})
     access_controls.initAccessControls(accounts[0], {'from': accounts[0]})
@@ -31,7 +84,7 @@ def public_access_controls(MISOAccessControls):
 # BentoBox
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def bento_box(BoringFactory):
     bento_box = BoringFactory.deploy({'from': accounts[0]})
     return bento_box
@@ -41,7 +94,7 @@ def bento_box(BoringFactory):
 # MISOTokenFactory
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def token_factory(MISOTokenFactory, miso_access_controls, fixed_token_template, mintable_token_template):
     token_factory = MISOTokenFactory.deploy({'from': accounts[0]})
     token_factory.initMISOTokenFactory(miso_access_controls, {'from': accounts[0]})
@@ -63,7 +116,7 @@ def token_factory(MISOTokenFactory, miso_access_controls, fixed_token_template,
 # FixedToken
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def fixed_token(FixedToken):
     fixed_token = FixedToken.deploy({'from': accounts[0]})
     name = "Fixed Token"
@@ -84,7 +137,7 @@ def fixed_token(FixedToken):
 # FixedToken for Crowdsale
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def fixed_token2(FixedToken):
     fixed_token = FixedToken.deploy({'from': accounts[0]})
     name = "Fixed Token TWO"
@@ -100,7 +153,7 @@ def fixed_token2(FixedToken):
 # USDC for Launcher
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def usdc_token(USDC):
     usdc_token = USDC.deploy({'from': accounts[0]})
     name = "USDC Token"
@@ -116,7 +169,7 @@ def usdc_token(USDC):
 # FixedToken for Dutch Auction with Lists
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def dutch_list_token(FixedToken):
     dutch_list_token = FixedToken.deploy({'from': accounts[0]})
     name = "Batch Auction Token"
@@ -130,7 +183,7 @@ def dutch_list_token(FixedToken):
 # FixedToken for BatchAuction
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def batch_auction_token(FixedToken):
     batch_auction_token = FixedToken.deploy({'from': accounts[0]})
     name = "Batch Auction Token"
@@ -139,7 +192,7 @@ def batch_auction_token(FixedToken):
     batch_auction_token.initToken(name, symbol, owner,AUCTION_TOKENS, {'from': owner})
     return batch_auction_token
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def fixed_token_template(FixedToken):
     fixed_token_template = FixedToken.deploy({'from': accounts[0]})
     return fixed_token_template
@@ -148,7 +201,7 @@ def fixed_token_template(FixedToken):
 #####################################
 # MintableToken
 ######################################
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def mintable_token(MintableToken):
     mintable_token = MintableToken.deploy({'from': accounts[0]})
 
@@ -164,7 +217,7 @@ def mintable_token(MintableToken):
 
     return mintable_token
     
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def mintable_token_template(MintableToken):
     mintable_token_template = MintableToken.deploy({'from': accounts[0]})
     return mintable_token_template
@@ -174,7 +227,7 @@ def mintable_token_template(MintableToken):
 #####################################
 # SushiToken
 ######################################
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def sushi_token(SushiToken):
     sushi_token = SushiToken.deploy({'from': accounts[0]})
 
@@ -188,7 +241,7 @@ def sushi_token(SushiToken):
 
     return sushi_token
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def sushi_token_template(SushiToken):
     sushi_token_template = SushiToken.deploy({'from': accounts[0]})
     return sushi_token_template
@@ -196,7 +249,7 @@ def sushi_token_template(SushiToken):
 # WETH9
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def weth_token(WETH9):
     weth_token = WETH9.deploy({'from': accounts[0]})
     return weth_token
@@ -206,7 +259,7 @@ def weth_token(WETH9):
 # Point List
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def point_list(PointList):
     point_list = PointList.deploy({"from": accounts[0]})
     point_list.initPointList(accounts[0], {"from": accounts[0]})
@@ -219,7 +272,7 @@ def point_list(PointList):
 # MISOMarket
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def auction_factory(MISOMarket, miso_access_controls,bento_box, dutch_auction_template, crowdsale_template):
     auction_factory = MISOMarket.deploy({'from': accounts[0]})
 
@@ -232,7 +285,7 @@ def auction_factory(MISOMarket, miso_access_controls,bento_box, dutch_auction_te
 # DutchAuction
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='module')
 def dutch_auction(DutchAuction, fixed_token):
     assert fixed_token.balanceOf(accounts[0]) == AUCTION_TOKENS
     
@@ -262,7 +315,7 @@ def dutch_auction(DutchAuction, fixed_token):
     chain.sleep(10)
     return dutch_auction 
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='module')
 def dutch_auction_list(DutchAuction, dutch_list_token, point_list):
     assert dutch_list_token.balanceOf(accounts[0]) == AUCTION_TOKENS
     
@@ -296,7 +349,7 @@ def dutch_auction_list(DutchAuction, dutch_list_token, point_list):
 # BatchAuction
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='module')
 def batch_auction(BatchAuction, batch_auction_token):
     assert batch_auction_token.balanceOf(accounts[0]) == AUCTION_TOKENS
     
@@ -324,7 +377,7 @@ def batch_auction(BatchAuction, batch_auction_token):
     chain.sleep(10)
     return batch_auction 
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def dutch_auction_template(DutchAuction):
     dutch_auction_template = DutchAuction.deploy({"from": accounts[0]})
     return dutch_auction_template
@@ -333,7 +386,7 @@ def dutch_auction_template(DutchAuction):
 # Crowdsale
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def crowdsale_template(Crowdsale, mintable_token):
     crowdsale_template = Crowdsale.deploy({"from":accounts[0]})
     return crowdsale_template
@@ -342,7 +395,7 @@ def crowdsale_template(Crowdsale, mintable_token):
 # FixedToken for Hyperbolic Auction
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def hyperbolic_auction_token(FixedToken):
     batch_auction_token = FixedToken.deploy({'from': accounts[0]})
     name = "Hyperbolic Auction Token"
@@ -356,7 +409,7 @@ def hyperbolic_auction_token(FixedToken):
 # Hyperbolic Auction
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='module')
 def hyperbolic_auction(HyperbolicAuction, hyperbolic_auction_token):
     assert hyperbolic_auction_token.balanceOf(accounts[0]) == AUCTION_TOKENS
     
@@ -389,7 +442,7 @@ def hyperbolic_auction(HyperbolicAuction, hyperbolic_auction_token):
 # UninswapV2Factory
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def uniswap_factory(UniswapV2Factory):
     uniswap_factory = UniswapV2Factory.deploy(accounts[0], {"from": accounts[0]})
     return uniswap_factory
@@ -410,14 +463,14 @@ def uniswap_factory(UniswapV2Factory):
 #     return seed_liquidity_template
 
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def post_auction_launcher_template(PostAuctionLauncher, weth_token):
     post_auction_launcher_template = PostAuctionLauncher.deploy(weth_token, {"from": accounts[0]})
     return post_auction_launcher_template
 
 
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def launcher(MISOLauncher, miso_access_controls, post_auction_launcher_template, weth_token, bento_box):
     launcher = MISOLauncher.deploy({"from": accounts[0]})
     launcher.initMISOLauncher(miso_access_controls, weth_token, bento_box)
@@ -451,7 +504,7 @@ def launcher(MISOLauncher, miso_access_controls, post_auction_launcher_template,
 
 #     return pool_liquidity
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def launcher_post_auction(PostAuctionLauncher, launcher):
     template_type = 3
     template_id = launcher.currentTemplateId(template_type)
@@ -467,7 +520,7 @@ def launcher_post_auction(PostAuctionLauncher, launcher):
 # Farm Factory
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def farm_factory(MISOFarmFactory,miso_access_controls,farm_template):
     miso_dev = accounts[5]
     minimum_fee = 0 
@@ -480,7 +533,7 @@ def farm_factory(MISOFarmFactory,miso_access_controls,farm_template):
     assert "FarmTemplateAdded" in tx.events
     return farm_factory
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def farm_template(MISOMasterChef):
     farm_template = MISOMasterChef.deploy({"from":accounts[0]})
     return farm_template
@@ -489,7 +542,7 @@ def farm_template(MISOMasterChef):
 # MISORecipe
 ######################################
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def token_factory_sushi(MISOTokenFactory, miso_access_controls, sushi_token_template):
     token_factory_sushi = MISOTokenFactory.deploy({'from': accounts[0]})
     token_factory_sushi.initMISOTokenFactory(miso_access_controls, {'from': accounts[0]})
@@ -498,7 +551,7 @@ def token_factory_sushi(MISOTokenFactory, miso_access_controls, sushi_token_temp
     token_factory_sushi.addTokenTemplate(sushi_token_template, {"from": accounts[0]})
     return token_factory_sushi
 
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def miso_recipe_02(MISORecipe02,miso_access_controls,token_factory_sushi, weth_token, auction_factory, launcher,uniswap_factory,farm_factory):
     miso_recipe_02 = MISORecipe02.deploy(token_factory_sushi,weth_token,auction_factory,launcher,uniswap_factory,farm_factory,{"from":accounts[0]})
     
@@ -513,7 +566,7 @@ def miso_recipe_02(MISORecipe02,miso_access_controls,token_factory_sushi, weth_t
 #####################################
 # Token Lock
 ######################################
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def token_lock(TokenVault,fixed_token2):
     token_lock = TokenVault.deploy({"from":accounts[0]})
     #ixed_token2.approve(token_lock, AUCTION_TOKENS,{"from": accounts[0]})
@@ -523,7 +576,7 @@ def token_lock(TokenVault,fixed_token2):
 #####################################
 #Documentation
 #####################################
-@pytest.fixture(scope='module', autouse=True)
+@pytest.fixture(scope='session')
 def document(Documents):
     document = Documents.deploy({"from": accounts[0]})
     return document
\ No newline at end of file
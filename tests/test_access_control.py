@@ -5,6 +5,11 @@ import pytest
 from brownie import Contract
 from settings import *
 
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
 def test_smart_contract_role(miso_access_controls):
     miso_access_controls.addSmartContractRole(accounts[1],{"from":accounts[0]})
     assert(miso_access_controls.hasSmartContractRole(accounts[1]))
@@ -0,0 +1,231 @@
+from brownie import accounts, chain
+import pytest
+from settings import *
+
+np = pytest.importorskip("numpy")
+from scripts.auction_sim import *
+
+# Differential tests of the off-chain auction models against the contracts
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+# An auction small enough that one bidder can commit past its cap at any
+# price. The capped commitment then equals the price at the block the
+# commit is mined in, which pins down the price function exactly.
+SIM_TOKENS = 1 * TENPOW18
+SIM_START_PRICE = 10 * TENPOW18
+SIM_MINIMUM_PRICE = 0.1 * TENPOW18
+SIM_COMMITMENT = 20 * TENPOW18
+
+
+def _auction_token(FixedToken, total_tokens):
+    token = FixedToken.deploy({'from': accounts[0]})
+    token.initToken("Sim Token", "SIM", accounts[0], total_tokens, {'from': accounts[0]})
+    return token
+
+
+def _capped_commitment(auction, fraction):
+    start_time, end_time, total_tokens = auction.marketInfo()
+    chain.sleep(start_time - chain.time() + int((end_time - start_time) * fraction))
+    tx = auction.commitEth(accounts[2], True, {'from': accounts[2], 'value': SIM_COMMITMENT})
+    return tx.events["AddedCommitment"]["commitment"], tx.timestamp
+
+
+def _settle(auction, commitments):
+    bidders = accounts[2:2 + len(commitments)]
+    for bidder, commitment in zip(bidders, commitments):
+        auction.commitEth(bidder, True, {'from': bidder, 'value': commitment})
+    chain.sleep(AUCTION_TIME + 10)
+    chain.mine()
+    return bidders
+
+
+#####################################
+# DutchAuction
+######################################
+
+@pytest.fixture(scope='function')
+def sim_dutch_auction(DutchAuction, FixedToken):
+    token = _auction_token(FixedToken, SIM_TOKENS)
+    auction = DutchAuction.deploy({'from': accounts[0]})
+    token.approve(auction, SIM_TOKENS, {'from': accounts[0]})
+    start_time = chain.time() + 10
+    auction.initAuction(accounts[0], token, SIM_TOKENS, start_time, start_time + AUCTION_TIME, ETH_ADDRESS,
+                        SIM_START_PRICE, SIM_MINIMUM_PRICE, accounts[0], ZERO_ADDRESS, accounts[1], {'from': accounts[0]})
+    return auction
+
+
+def test_dutch_price_drop(dutch_auction):
+    start_time, end_time, total_tokens = dutch_auction.marketInfo()
+    start_price, minimum_price = dutch_auction.marketPrice()
+    assert dutch_price_drop(start_time, end_time, start_price, minimum_price) == dutch_auction.priceDrop()
+
+
+@pytest.mark.parametrize("fraction", [0, 0.1, 0.5, 0.77, 0.99])
+def test_dutch_price_function(sim_dutch_auction, fraction):
+    commitment, timestamp = _capped_commitment(sim_dutch_auction, fraction)
+    start_time, end_time, total_tokens = sim_dutch_auction.marketInfo()
+    start_price, minimum_price = sim_dutch_auction.marketPrice()
+
+    price = dutch_price_function(timestamp, start_time, end_time, start_price, minimum_price)
+    assert calculate_commitment(SIM_COMMITMENT, price, 0, total_tokens) == commitment
+
+
+def test_dutch_price_function_outside_auction(dutch_auction):
+    start_time, end_time, total_tokens = dutch_auction.marketInfo()
+    start_price, minimum_price = dutch_auction.marketPrice()
+    prices = dutch_price_function([start_time - 1, start_time, end_time, end_time + 1],
+                                  start_time, end_time, start_price, minimum_price)
+    assert list(prices) == [start_price, start_price, minimum_price, minimum_price]
+
+
+@pytest.mark.parametrize("commitments", [
+    [10 * TENPOW18, 25 * TENPOW18, 40 * TENPOW18, 5 * TENPOW18],
+    [1 * TENPOW18, 2 * TENPOW18, 0.5 * TENPOW18],
+])
+def test_dutch_settlement(dutch_auction, fixed_token, commitments):
+    bidders = _settle(dutch_auction, commitments)
+    start_time, end_time, total_tokens = dutch_auction.marketInfo()
+    start_price, minimum_price = dutch_auction.marketPrice()
+    commitments_total = dutch_auction.marketStatus()[0]
+    assert commitments_total == sum(commitments)
+
+    result = simulate_dutch_auction(chain[-1].timestamp, commitments_total, start_time, end_time, total_tokens,
+                                    start_price, minimum_price, commitments=commitments)
+    assert result["price"] == dutch_auction.priceFunction()
+    assert result["token_price"] == dutch_auction.tokenPrice()
+    assert result["clearing_price"] == dutch_auction.clearingPrice()
+    assert result["successful"] == dutch_auction.auctionSuccessful()
+    assert list(result["tokens_claimable"]) == [dutch_auction.tokensClaimable(bidder) for bidder in bidders]
+
+    # Claims are capped by the tokens left in the auction once some are withdrawn
+    if dutch_auction.auctionSuccessful():
+        dutch_auction.finalize({'from': accounts[0]})
+        dutch_auction.withdrawTokens({'from': bidders[0]})
+        claimed = [dutch_auction.claimed(bidder) for bidder in bidders]
+        claimable = tokens_claimable(commitments, commitments_total, total_tokens, claimed,
+                                     fixed_token.balanceOf(dutch_auction))
+        assert list(claimable) == [dutch_auction.tokensClaimable(bidder) for bidder in bidders]
+
+
+#####################################
+# HyperbolicAuction
+######################################
+
+@pytest.fixture(scope='function')
+def sim_hyperbolic_auction(HyperbolicAuction, FixedToken):
+    token = _auction_token(FixedToken, SIM_TOKENS)
+    auction = HyperbolicAuction.deploy({'from': accounts[0]})
+    token.approve(auction, SIM_TOKENS, {'from': accounts[0]})
+    start_time = chain.time() + 10
+    auction.initAuction(accounts[0], token, SIM_TOKENS, start_time, start_time + AUCTION_TIME, ETH_ADDRESS,
+                        HYPERBOLIC_AUCTION_FACTOR, SIM_MINIMUM_PRICE, accounts[0], ZERO_ADDRESS, accounts[1], {'from': accounts[0]})
+    return auction
+
+
+def test_hyperbolic_alpha(hyperbolic_auction):
+    start_time, end_time, total_tokens = hyperbolic_auction.marketInfo()
+    minimum_price, alpha = hyperbolic_auction.marketPrice()
+    assert hyperbolic_alpha(start_time, end_time, minimum_price) == alpha
+
+
+# At the start time the price is uint256(-1) and commits revert. Early on the
+# price is above the cap of a single commit, which is then accepted in full.
+@pytest.mark.parametrize("fraction", [0.001, 0.01, 0.1, 0.5, 0.77, 0.99])
+def test_hyperbolic_price_function(sim_hyperbolic_auction, fraction):
+    commitment, timestamp = _capped_commitment(sim_hyperbolic_auction, fraction)
+    start_time, end_time, total_tokens = sim_hyperbolic_auction.marketInfo()
+    minimum_price, alpha = sim_hyperbolic_auction.marketPrice()
+
+    price = hyperbolic_price_function(timestamp, start_time, end_time, minimum_price)
+    assert calculate_commitment(SIM_COMMITMENT, price, 0, total_tokens) == commitment
+
+
+def test_hyperbolic_price_function_outside_auction(hyperbolic_auction):
+    start_time, end_time, total_tokens = hyperbolic_auction.marketInfo()
+    minimum_price, alpha = hyperbolic_auction.marketPrice()
+    prices = hyperbolic_price_function([start_time - 1, start_time, end_time, end_time + 1],
+                                       start_time, end_time, minimum_price, alpha)
+    assert list(prices) == [UINT256_MAX, UINT256_MAX, minimum_price, minimum_price]
+
+
+def test_hyperbolic_commitment_stream(sim_hyperbolic_auction):
+    # Later commits are capped by the price the earlier ones pushed the
+    # auction to, the replay has to follow the same path
+    start_time, end_time, total_tokens = sim_hyperbolic_auction.marketInfo()
+    minimum_price, alpha = sim_hyperbolic_auction.marketPrice()
+    commits = [(0.01, 2 * TENPOW18), (0.02, 4 * TENPOW18), (0.04, 3 * TENPOW18), (0.6, 0.5 * TENPOW18)]
+
+    accepted = []
+    timestamps = []
+    for bidder, (fraction, commitment) in zip(accounts[2:], commits):
+        chain.sleep(start_time + int((end_time - start_time) * fraction) - chain.time())
+        tx = sim_hyperbolic_auction.commitEth(bidder, True, {'from': bidder, 'value': commitment})
+        accepted.append(tx.events["AddedCommitment"]["commitment"] if "AddedCommitment" in tx.events else 0)
+        timestamps.append(tx.timestamp)
+
+    prices = hyperbolic_price_function(timestamps, start_time, end_time, minimum_price, alpha)
+    replayed, totals = replay_commitments([commitment for fraction, commitment in commits], prices, total_tokens)
+    assert list(replayed) == accepted
+    assert totals[-1] == sim_hyperbolic_auction.marketStatus()[0]
+
+
+@pytest.mark.parametrize("commitments", [
+    [10 * TENPOW18, 25 * TENPOW18, 40 * TENPOW18, 5 * TENPOW18],
+    [1 * TENPOW18, 2 * TENPOW18, 0.5 * TENPOW18],
+])
+def test_hyperbolic_settlement(hyperbolic_auction, hyperbolic_auction_token, commitments):
+    bidders = _settle(hyperbolic_auction, commitments)
+    start_time, end_time, total_tokens = hyperbolic_auction.marketInfo()
+    minimum_price, alpha = hyperbolic_auction.marketPrice()
+    commitments_total = hyperbolic_auction.marketStatus()[0]
+    assert commitments_total == sum(commitments)
+
+    result = simulate_hyperbolic_auction(chain[-1].timestamp, commitments_total, start_time, end_time, total_tokens,
+                                         minimum_price, alpha, commitments=commitments)
+    assert result["price"] == hyperbolic_auction.priceFunction()
+    assert result["token_price"] == hyperbolic_auction.tokenPrice()
+    assert result["clearing_price"] == hyperbolic_auction.clearingPrice()
+    assert result["successful"] == hyperbolic_auction.auctionSuccessful()
+    assert list(result["tokens_claimable"]) == [hyperbolic_auction.tokensClaimable(bidder) for bidder in bidders]
+
+    if hyperbolic_auction.auctionSuccessful():
+        hyperbolic_auction.finalize({'from': accounts[0]})
+        hyperbolic_auction.withdrawTokens({'from': bidders[0]})
+        claimed = [hyperbolic_auction.claimed(bidder) for bidder in bidders]
+        claimable = tokens_claimable(commitments, commitments_total, total_tokens, claimed,
+                                     hyperbolic_auction_token.balanceOf(hyperbolic_auction))
+        assert list(claimable) == [hyperbolic_auction.tokensClaimable(bidder) for bidder in bidders]
+
+
+#####################################
+# Reverts
+######################################
+
+def test_revert_per_scenario():
+    # Before the start the hyperbolic price is uint256(-1) and the commit
+    # overflows, the other scenarios of the sweep are still evaluated
+    start_time, end_time = 1000, 1000 + AUCTION_TIME
+    timestamps = [start_time - 1, start_time, start_time + 100, end_time]
+    prices = hyperbolic_price_function(timestamps, start_time, end_time, SIM_MINIMUM_PRICE)
+    accepted = calculate_commitment(SIM_COMMITMENT, prices, 0, SIM_TOKENS)
+    assert list(reverted(accepted)) == [True, True, False, False]
+    assert accepted[3] == SIM_MINIMUM_PRICE
+
+    # A reverted commit leaves the commitments total as it was
+    replayed, totals = replay_commitments([SIM_COMMITMENT, SIM_COMMITMENT], [prices[0], prices[3]], SIM_TOKENS)
+    assert reverted(replayed[0]) and replayed[1] == SIM_MINIMUM_PRICE
+    assert list(totals) == [0, SIM_MINIMUM_PRICE]
+
+    # Claims over the tokens owed underflow, only for that bidder
+    claimable = tokens_claimable([TENPOW18, TENPOW18], 2 * TENPOW18, SIM_TOKENS, [0, SIM_TOKENS])
+    assert list(reverted(claimable)) == [False, True]
+    assert reverted(dutch_price_drop(start_time, start_time, SIM_START_PRICE, SIM_MINIMUM_PRICE))
+    # A price drop that does not fit in 112 bits is rejected by initAuction
+    drops = dutch_price_drop(start_time, start_time + 1, [UINT112_MAX + 1, UINT112_MAX + 2], 1)
+    assert list(reverted(drops)) == [False, True]
+    assert reverted(dutch_price_function(start_time, start_time, start_time + 1, UINT112_MAX + 2, 1))
@@ -0,0 +1,57 @@
+from brownie import accounts
+import asyncio
+import pytest
+from settings import *
+from scripts.bid_load import BidLoadGenerator, LatencyHistogram, constant_arrivals, burst_arrivals
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+@pytest.mark.parametrize("auction_type", ["dutch_auction", "batch_auction"])
+def test_bid_load(request, auction_type):
+    auction = request.getfixturevalue(auction_type)
+    bidders = accounts[2:6]
+    commitment = TENPOW18 // 10
+    # Three bids per bidder, so every bidder has several nonces in flight
+    generator = BidLoadGenerator(auction, bidders, commitment, rate=1000, max_in_flight=5)
+    asyncio.run(generator.run(12))
+
+    assert generator.included == 12
+    assert generator.reverted == generator.rejected == 0
+    assert len(generator.latency) == 12
+    assert sum(generator.latency.counts) == 12
+    for bidder in bidders:
+        assert auction.commitments(bidder) == 3 * commitment
+
+
+def test_bid_load_constant_arrivals(dutch_auction):
+    generator = BidLoadGenerator(dutch_auction, accounts[2:4], TENPOW18 // 10, rate=100, arrivals="constant")
+    asyncio.run(generator.run(4))
+    # Three gaps of 10ms between four bids
+    assert generator.elapsed >= 0.03
+    assert generator.included == 4
+
+
+def test_bid_load_burst_arrivals(dutch_auction):
+    # Two bursts of three bids, 30ms apart at 100 bids per second
+    generator = BidLoadGenerator(dutch_auction, accounts[2:5], TENPOW18 // 10, rate=100,
+                                 arrivals=burst_arrivals(100, 3))
+    asyncio.run(generator.run(6))
+    assert generator.elapsed >= 0.03
+    assert generator.included == 6
+
+    delays = BidLoadGenerator(dutch_auction, accounts[2:3], 1, rate=100, arrivals="burst").arrivals
+    assert [next(delays) for _ in range(10)] == [0] * 9 + [0.1]
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram(buckets=[0.1, 1])
+    for seconds in [0.05, 0.1, 0.5, 2, 3]:
+        histogram.record(seconds)
+    assert histogram.counts == [2, 1, 2]
+    assert histogram.percentile(50) == 0.5
+    assert histogram.percentile(99) == 3
+    assert next(constant_arrivals(4)) == 0.25
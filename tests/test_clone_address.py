@@ -0,0 +1,76 @@
+from brownie import accounts, reverts
+import pytest
+from settings import *
+from scripts.clone_address import predict_token_address, predict_market_address, \
+    predict_farm_address, predict_launcher_address
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+SALT = "0x" + "4d49534f".rjust(64, "0")
+
+
+def test_create_token_with_salt(token_factory, fixed_token_template):
+    template_id = 1 # Fixed Token Template
+    predicted = predict_token_address(token_factory, template_id, accounts[2], SALT)
+    data = fixed_token_template.getInitData("Salted Token", "SLT", accounts[2], 100 * TENPOW18)
+    tx = token_factory.createTokenWithSalt(template_id, ZERO_ADDRESS, data, SALT, {"from": accounts[2]})
+    assert tx.events["TokenCreated"]["addr"] == predicted
+    assert tx.return_value == predicted
+
+    # Each sender has its own addresses for the same salt
+    assert predict_token_address(token_factory, template_id, accounts[3], SALT) != predicted
+    with reverts("CloneFactory: Salt already used"):
+        token_factory.deployTokenWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[2]})
+
+
+def test_deploy_farm_with_salt(farm_factory):
+    template_id = 1
+    predicted = predict_farm_address(farm_factory, template_id, accounts[2], SALT)
+    tx = farm_factory.deployFarmWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[2]})
+    assert tx.events["FarmCreated"]["addr"] == predicted
+
+
+def test_deploy_market_with_salt(auction_factory, dutch_auction_template):
+    template_id = auction_factory.getTemplateId(dutch_auction_template)
+    predicted = predict_market_address(auction_factory, template_id, accounts[2], SALT)
+    tx = auction_factory.deployMarketWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[2]})
+    assert tx.events["MarketCreated"]["addr"] == predicted
+    with reverts("CloneFactory: Salt already used"):
+        auction_factory.deployMarketWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[2]})
+
+
+def test_market_salt_cannot_be_taken(auction_factory, dutch_auction_template):
+    template_id = auction_factory.getTemplateId(dutch_auction_template)
+    predicted = predict_market_address(auction_factory, template_id, accounts[2], SALT)
+
+    # A third party using the same salt gets its own address
+    tx = auction_factory.deployMarketWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[3]})
+    assert tx.events["MarketCreated"]["addr"] == predict_market_address(auction_factory, template_id, accounts[3], SALT)
+    assert tx.events["MarketCreated"]["addr"] != predicted
+
+    tx = auction_factory.deployMarketWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[2]})
+    assert tx.events["MarketCreated"]["addr"] == predicted
+
+
+def test_deploy_launcher_with_salt(launcher):
+    template_id = launcher.currentTemplateId(3)
+    predicted = predict_launcher_address(launcher, template_id, accounts[2], SALT)
+    tx = launcher.deployLauncherWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[2]})
+    assert tx.events["LauncherCreated"]["addr"] == predicted
+    with reverts("CloneFactory: Salt already used"):
+        launcher.deployLauncherWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[2]})
+
+
+def test_launcher_salt_cannot_be_taken(launcher):
+    template_id = launcher.currentTemplateId(3)
+    predicted = predict_launcher_address(launcher, template_id, accounts[2], SALT)
+
+    tx = launcher.deployLauncherWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[3]})
+    assert tx.events["LauncherCreated"]["addr"] != predicted
+
+    tx = launcher.deployLauncherWithSalt(template_id, ZERO_ADDRESS, SALT, {"from": accounts[2]})
+    assert tx.events["LauncherCreated"]["addr"] == predicted
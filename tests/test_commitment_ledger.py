@@ -0,0 +1,64 @@
+from brownie import accounts, chain
+import pytest
+from settings import *
+
+np = pytest.importorskip("numpy")
+from scripts.commitment_ledger import CommitmentLedger
+
+# The ledger must agree with the auction's own getters for every bidder
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+# With the repeated commit of the first bidder this raises 10 ETH, which
+# sells out the crowdsale and clears every other auction at its reserve
+COMMITMENTS = [4 * TENPOW18, 2 * TENPOW18, 0.5 * TENPOW18, 2.5 * TENPOW18]
+
+
+@pytest.fixture(scope='module')
+def crowdsale(Crowdsale, FixedToken):
+    token = FixedToken.deploy({'from': accounts[0]})
+    token.initToken("Ledger Token", "LDG", accounts[0], AUCTION_TOKENS, {'from': accounts[0]})
+    crowdsale = Crowdsale.deploy({'from': accounts[0]})
+    token.approve(crowdsale, AUCTION_TOKENS, {'from': accounts[0]})
+    start_time = chain.time() + 10
+    crowdsale.initCrowdsale(accounts[0], token, ETH_ADDRESS, AUCTION_TOKENS, start_time, start_time + AUCTION_TIME,
+                            CROWDSALE_RATE, CROWDSALE_GOAL, accounts[0], ZERO_ADDRESS, accounts[1], {'from': accounts[0]})
+    chain.sleep(10)
+    return crowdsale
+
+
+def _assert_ledger(ledger, auction):
+    report = ledger.report()
+    assert report["bidders"] == ledger.bidders
+    assert list(report["commitments"]) == [auction.commitments(bidder) for bidder in ledger.bidders]
+    assert list(report["claimed"]) == [auction.claimed(bidder) for bidder in ledger.bidders]
+    assert list(report["tokens_claimable"]) == [auction.tokensClaimable(bidder) for bidder in ledger.bidders]
+
+
+@pytest.mark.parametrize("auction_type", ["crowdsale", "dutch_auction", "batch_auction", "hyperbolic_auction"])
+def test_commitment_ledger(request, auction_type):
+    auction = request.getfixturevalue(auction_type)
+    bidders = accounts[2:2 + len(COMMITMENTS)]
+    # One bidder commits twice
+    for bidder, commitment in zip(bidders + [bidders[0]], COMMITMENTS + [1 * TENPOW18]):
+        auction.commitEth(bidder, True, {'from': bidder, 'value': commitment})
+
+    ledger = CommitmentLedger(auction, chunk_size=100)
+    ledger.sync()
+    assert ledger.bidders == list(bidders)
+    assert ledger.commitments_total == auction.marketStatus()[0]
+    _assert_ledger(ledger, auction)
+
+    # Claims are picked up from the token transfers on the next sync
+    chain.sleep(AUCTION_TIME + 10)
+    chain.mine()
+    assert auction.auctionSuccessful()
+    auction.finalize({'from': accounts[0]})
+    for bidder in bidders[:2]:
+        auction.withdrawTokens({'from': bidder})
+    ledger.sync()
+    _assert_ledger(ledger, auction)
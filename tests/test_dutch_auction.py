@@ -238,6 +238,41 @@ def test_dutch_auction_clearingPrice(dutch_auction):
     assert dutch_auction.clearingPrice() == AUCTION_RESERVE
 
 
+def test_dutch_auction_price_drop_after_update(dutch_auction):
+    def price_drop():
+        start_price, minimum_price = dutch_auction.marketPrice()
+        start_time, end_time, _ = dutch_auction.marketInfo()
+        return (start_price - minimum_price) // (end_time - start_time)
+
+    assert dutch_auction.priceDrop() == price_drop()
+
+    # The stored price drop follows the admin setters
+    start_time = chain.time() + 100
+    dutch_auction.setAuctionTime(start_time, start_time + 2 * AUCTION_TIME, {"from": accounts[0]})
+    assert dutch_auction.priceDrop() == price_drop()
+    dutch_auction.setAuctionPrice(2 * AUCTION_START_PRICE, AUCTION_RESERVE, {"from": accounts[0]})
+    assert dutch_auction.priceDrop() == price_drop()
+
+    chain.sleep(100 + AUCTION_TIME)
+    chain.mine()
+    expected = 2 * AUCTION_START_PRICE - (chain.time() - start_time) * price_drop()
+    assert abs(dutch_auction.priceFunction() - expected) <= 2 * price_drop()
+
+
+def test_dutch_auction_price_drop_too_large(dutch_auction_init_with_abi, fixed_token2):
+    fixed_token2.approve(dutch_auction_init_with_abi, AUCTION_TOKENS, {"from": accounts[0]})
+    start_time = chain.time() + 10
+    operator = accounts[4]
+    wallet = accounts[1]
+
+    # The price drop per second is stored in 112 bits
+    with reverts("DutchAuction: price drop too large"):
+        dutch_auction_init_with_abi.initAuction(accounts[0], fixed_token2, AUCTION_TOKENS, start_time, start_time + 1, ETH_ADDRESS, 2**112 + 1, 1, operator, ZERO_ADDRESS, wallet, {"from": accounts[0]})
+
+    dutch_auction_init_with_abi.initAuction(accounts[0], fixed_token2, AUCTION_TOKENS, start_time, start_time + 1, ETH_ADDRESS, 2**112, 1, operator, ZERO_ADDRESS, wallet, {"from": accounts[0]})
+    assert dutch_auction_init_with_abi.priceDrop() == 2**112 - 1
+
+
 # ############### Commit Eth Test ###############################
 
 # def test_dutch_auction_commit_eth(dutch_auction_cal_pool_eth):
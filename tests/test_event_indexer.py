@@ -0,0 +1,110 @@
+from brownie import accounts, chain
+import pytest
+from settings import *
+from scripts.init_data import *
+from scripts.event_indexer import EventIndexer
+
+# The index must return what MISOHelper reads from the chain
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+@pytest.fixture(scope='function')
+def miso_helper(MISOHelper, miso_access_controls, token_factory, auction_factory, launcher, farm_factory):
+    return MISOHelper.deploy(miso_access_controls, token_factory, auction_factory, launcher, farm_factory, {"from": accounts[0]})
+
+
+@pytest.fixture(scope='function')
+def indexer(tmp_path, token_factory, auction_factory, launcher, farm_factory):
+    factories = {
+        "miso_market": auction_factory.address,
+        "miso_token_factory": token_factory.address,
+        "farm_factory": farm_factory.address,
+        "miso_launcher": launcher.address,
+    }
+    # Small chunks so the backfill crosses several of them
+    indexer = EventIndexer(str(tmp_path / "index.sqlite"), factories, start_block=0, chunk_size=50)
+    yield indexer
+    indexer.close()
+
+
+def _create_token(token_factory, name, template_id=1):
+    data = get_token_data(name, "IDX", accounts[0], AUCTION_TOKENS)
+    tx = token_factory.createToken(template_id, accounts[0], data, {"from": accounts[0]})
+    return tx.events["TokenCreated"]["addr"]
+
+
+def _create_market(auction_factory, dutch_auction_template, FixedToken, DutchAuction):
+    token = FixedToken.deploy({"from": accounts[0]})
+    token.initToken("Index Token", "IDX", accounts[0], AUCTION_TOKENS, {"from": accounts[0]})
+    token.approve(auction_factory, AUCTION_TOKENS, {"from": accounts[0]})
+    start_time = chain.time() + 100
+    data = get_dutch_auction_data(auction_factory, token, AUCTION_TOKENS, start_time, start_time + AUCTION_TIME,
+                                  ETH_ADDRESS, AUCTION_START_PRICE, AUCTION_RESERVE, accounts[0], ZERO_ADDRESS, accounts[1])
+    template_id = auction_factory.getTemplateId(dutch_auction_template)
+    tx = auction_factory.createMarket(template_id, token, AUCTION_TOKENS, accounts[0], data, {"from": accounts[0]})
+    return DutchAuction.at(tx.events["MarketCreated"]["addr"])
+
+
+def _market_tuple(market):
+    token = market["tokenInfo"]
+    return (market["addr"], market["templateId"], market["startTime"], market["endTime"], market["finalized"],
+            (token["addr"], token["decimals"], token["name"], token["symbol"]))
+
+
+def _token_tuple(token):
+    return (token["addr"], token["decimals"], token["name"], token["symbol"])
+
+
+def test_index_tokens(indexer, miso_helper, token_factory):
+    _create_token(token_factory, "Fixed Index Token", 1)
+    _create_token(token_factory, "Mintable Index Token", 2)
+    indexer.sync()
+
+    assert indexer.number_of_tokens() == token_factory.numberOfTokens()
+    assert [_token_tuple(token) for token in indexer.get_tokens()] == miso_helper.getTokens()
+    assert [_token_tuple(token) for token in indexer.get_tokens(1, 1)] == miso_helper.getTokens(1, 1)
+
+
+def test_index_markets(indexer, miso_helper, auction_factory, dutch_auction_template, FixedToken, DutchAuction):
+    for _ in range(3):
+        _create_market(auction_factory, dutch_auction_template, FixedToken, DutchAuction)
+    indexer.sync()
+
+    assert indexer.number_of_auctions() == auction_factory.numberOfAuctions()
+    assert [_market_tuple(market) for market in indexer.get_markets()] == miso_helper.getMarkets()
+    assert [_market_tuple(market) for market in indexer.get_markets(2, 1)] == miso_helper.getMarkets(2, 1)
+    assert [_market_tuple(market) for market in indexer.get_markets(2, 0, 1)] == miso_helper.getMarkets(2, 0, 1)
+
+
+def test_index_market_updates(indexer, miso_helper, auction_factory, dutch_auction_template, FixedToken, DutchAuction):
+    market = _create_market(auction_factory, dutch_auction_template, FixedToken, DutchAuction)
+    indexer.sync()
+
+    start_time = chain.time() + 500
+    market.setAuctionTime(start_time, start_time + AUCTION_TIME, {"from": accounts[0]})
+    market.cancelAuction({"from": accounts[0]})
+    indexer.sync()
+
+    markets = indexer.get_markets()
+    assert markets[0]["startTime"] == start_time
+    assert markets[0]["finalized"] == True
+    assert [_market_tuple(market) for market in markets] == miso_helper.getMarkets()
+
+
+def test_index_reorg(indexer, miso_helper, token_factory):
+    _create_token(token_factory, "Dropped Token")
+    indexer.sync()
+    assert [token["name"] for token in indexer.get_tokens()] == ["Dropped Token"]
+
+    # Replace the last block with a different one at the same height. The
+    # clone lands on the same address, only its name tells them apart.
+    chain.undo()
+    _create_token(token_factory, "Kept Token")
+    indexer.sync()
+
+    assert [token["name"] for token in indexer.get_tokens()] == ["Kept Token"]
+    assert [_token_tuple(token) for token in indexer.get_tokens()] == miso_helper.getTokens()
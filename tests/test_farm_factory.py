@@ -172,4 +172,20 @@ def test_farm_factory_remove_farm_template_not_operator(farm_factory):
 def test_farm_factory_set_dividends_not_operator(farm_factory):
     miso_dev = accounts[5]
     with reverts():
-        farm_factory.setDividends(miso_dev,{"from":accounts[5]})
\ No newline at end of file
+        farm_factory.setDividends(miso_dev,{"from":accounts[5]})
+
+def test_farm_factory_template_farms(create_farm, farm_factory):
+    farm = farm_factory.farms(0)
+    assert farm_factory.numberOfTemplateFarms(1) == 1
+    assert farm_factory.templateFarms(1, 0) == farm
+    assert farm_factory.numberOfTemplateFarms(2) == 0
+
+def test_farm_factory_init_farm_factory(create_farm, farm_factory, farm_template, MISOMasterChef):
+    farm = MISOMasterChef.at(farm_factory.farms(0))
+    assert farm.farmFactory() == farm_factory
+    with reverts("MasterChef.initFarmFactory: Already initialised"):
+        farm.initFarmFactory({"from": accounts[5]})
+
+    # Farms that were not cloned by a factory can not be given one
+    with reverts("MasterChef.initFarmFactory: Farm was not cloned by a factory"):
+        farm_template.initFarmFactory({"from": accounts[5]})
@@ -0,0 +1,265 @@
+from brownie import accounts, chain, web3
+import json
+import os
+import pytest
+from settings import *
+from scripts.init_data import *
+
+# Gas benchmarks for the auction lifecycle and the factories.
+#
+# The gas used on every path is compared with reports/gas_baseline.json and
+# the test fails when a path uses more than GAS_THRESHOLD above its baseline.
+# A path with no baseline is skipped. The file is only written when the
+# baseline is recorded on purpose, after an intended change in gas use:
+#
+#   UPDATE_GAS_BASELINE=1 brownie test tests/test_gas_benchmarks.py
+
+GAS_BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "reports", "gas_baseline.json")
+GAS_THRESHOLD = 0.02
+
+AUCTION_TYPES = ["DutchAuction", "Crowdsale", "BatchAuction", "HyperbolicAuction"]
+BIDDER_COUNTS = [1, 4, 8]
+
+# Total raised by all bidders together. A crowdsale sells out at 10 ETH, the
+# other auctions clear above their reserve with 20 ETH.
+SUCCESSFUL_COMMITMENTS = {"Crowdsale": 10 * TENPOW18}
+SUCCESSFUL_COMMITMENT = 20 * TENPOW18
+# Committed by each bidder, far below every reserve and goal
+FAILED_COMMITMENT = 0.001 * TENPOW18
+
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+class GasBaseline:
+    def __init__(self, path, update):
+        self.path = path
+        self.update = update
+        self.baseline = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.baseline = json.load(f)
+        self.measured = {}
+
+    def check(self, name, gas_used):
+        self.measured[name] = gas_used
+        if self.update:
+            return
+        if name not in self.baseline:
+            pytest.skip(name + " has no gas baseline, record it with UPDATE_GAS_BASELINE=1")
+        limit = self.baseline[name] * (1 + GAS_THRESHOLD)
+        assert gas_used <= limit, (
+            name + " used " + str(gas_used) + " gas, baseline is " + str(self.baseline[name]))
+
+    def save(self):
+        # Only when recording, a normal run never changes the baseline
+        if not self.update or not self.measured:
+            return
+        self.baseline.update(self.measured)
+        with open(self.path, "w") as f:
+            json.dump(self.baseline, f, indent=4, sort_keys=True)
+            f.write("\n")
+
+
+@pytest.fixture(scope='module')
+def gas_baseline():
+    baseline = GasBaseline(GAS_BASELINE, os.environ.get("UPDATE_GAS_BASELINE") == "1")
+    yield baseline
+    baseline.save()
+
+
+#####################################
+# Helper Functions
+#####################################
+
+def _auction_token(FixedToken):
+    token = FixedToken.deploy({'from': accounts[0]})
+    token.initToken("Gas Token", "GAS", accounts[0], AUCTION_TOKENS, {'from': accounts[0]})
+    return token
+
+
+def _deploy_auction(request, auction_type, FixedToken):
+    token = _auction_token(FixedToken)
+    auction = request.getfixturevalue(auction_type).deploy({'from': accounts[0]})
+    token.approve(auction, AUCTION_TOKENS, {'from': accounts[0]})
+
+    start_time = chain.time() + 10
+    end_time = start_time + AUCTION_TIME
+    admin = accounts[0]
+    wallet = accounts[1]
+    if auction_type == "Crowdsale":
+        auction.initCrowdsale(accounts[0], token, ETH_ADDRESS, AUCTION_TOKENS, start_time, end_time,
+                              CROWDSALE_RATE, CROWDSALE_GOAL, admin, ZERO_ADDRESS, wallet, {'from': accounts[0]})
+    elif auction_type == "BatchAuction":
+        auction.initAuction(accounts[0], token, AUCTION_TOKENS, start_time, end_time, ETH_ADDRESS,
+                            AUCTION_MINIMUM_COMMITMENT, admin, ZERO_ADDRESS, wallet, {'from': accounts[0]})
+    elif auction_type == "HyperbolicAuction":
+        auction.initAuction(accounts[0], token, AUCTION_TOKENS, start_time, end_time, ETH_ADDRESS,
+                            HYPERBOLIC_AUCTION_FACTOR, AUCTION_RESERVE, admin, ZERO_ADDRESS, wallet, {'from': accounts[0]})
+    else:
+        auction.initAuction(accounts[0], token, AUCTION_TOKENS, start_time, end_time, ETH_ADDRESS,
+                            AUCTION_START_PRICE, AUCTION_RESERVE, admin, ZERO_ADDRESS, wallet, {'from': accounts[0]})
+    chain.sleep(10)
+    chain.mine()
+    return auction
+
+
+def _bidders(count):
+    # accounts[0] is the admin and accounts[1] the wallet
+    return accounts[2:2 + count]
+
+
+def _run_auction(auction, commitment, bidders):
+    commits = [auction.commitEth(bidder, True, {'from': bidder, 'value': commitment}) for bidder in bidders]
+    chain.sleep(AUCTION_TIME + 10)
+    chain.mine()
+    finalize = auction.finalize({'from': accounts[0]})
+    withdraws = [auction.withdrawTokens({'from': bidder}) for bidder in bidders]
+    return commits, finalize, withdraws
+
+
+def _check_lifecycle(gas_baseline, path, commits, finalize, withdraws):
+    # Most expensive call of each kind, later bidders can pay more or less
+    # than the first one depending on storage already written
+    gas_baseline.check(path + " commitEth", max(tx.gas_used for tx in commits))
+    gas_baseline.check(path + " finalize", finalize.gas_used)
+    gas_baseline.check(path + " withdrawTokens", max(tx.gas_used for tx in withdraws))
+
+
+#####################################
+# Auction lifecycle
+#####################################
+
+@pytest.mark.parametrize("bidder_count", BIDDER_COUNTS)
+@pytest.mark.parametrize("auction_type", AUCTION_TYPES)
+def test_successful_auction_gas(request, gas_baseline, FixedToken, auction_type, bidder_count):
+    auction = _deploy_auction(request, auction_type, FixedToken)
+    commitment = SUCCESSFUL_COMMITMENTS.get(auction_type, SUCCESSFUL_COMMITMENT) // bidder_count
+
+    commits, finalize, withdraws = _run_auction(auction, commitment, _bidders(bidder_count))
+    assert auction.auctionSuccessful()
+
+    path = auction_type + " successful " + str(bidder_count) + " bidders"
+    _check_lifecycle(gas_baseline, path, commits, finalize, withdraws)
+
+
+@pytest.mark.parametrize("bidder_count", BIDDER_COUNTS)
+@pytest.mark.parametrize("auction_type", AUCTION_TYPES)
+def test_failed_auction_gas(request, gas_baseline, FixedToken, auction_type, bidder_count):
+    auction = _deploy_auction(request, auction_type, FixedToken)
+
+    commits, finalize, withdraws = _run_auction(auction, FAILED_COMMITMENT, _bidders(bidder_count))
+    assert auction.auctionSuccessful() == False
+
+    path = auction_type + " failed " + str(bidder_count) + " bidders"
+    _check_lifecycle(gas_baseline, path, commits, finalize, withdraws)
+
+
+@pytest.mark.parametrize("auction_type", AUCTION_TYPES)
+def test_cancel_auction_gas(request, gas_baseline, FixedToken, auction_type):
+    auction = _deploy_auction(request, auction_type, FixedToken)
+    tx = auction.cancelAuction({'from': accounts[0]})
+    gas_baseline.check(auction_type + " cancelAuction", tx.gas_used)
+
+
+#####################################
+# DutchAuction commit path
+#####################################
+
+# Reads of each market struct slot in one commit. Each struct is copied to
+# memory once, the status slot is read once more when commitmentsTotal is
+# written back.
+COMMIT_STRUCT_READS = {"marketInfo": 1, "marketPrice": 1, "marketStatus": 2}
+
+
+def _struct_slots(auction):
+    # Storage slot of each market struct, found by its packed value
+    start_time, end_time, total_tokens = auction.marketInfo()
+    start_price, minimum_price = auction.marketPrice()
+    commitments_total, finalized, use_point_list = auction.marketStatus()
+    price_drop = auction.priceDrop()
+    packed = {
+        "marketInfo": start_time | end_time << 64 | total_tokens << 128,
+        "marketPrice": start_price | minimum_price << 128,
+        "marketStatus": commitments_total | int(finalized) << 128 | int(use_point_list) << 136 | price_drop << 144,
+    }
+    slots = {}
+    for slot in range(64):
+        value = int(web3.eth.get_storage_at(auction.address, slot).hex(), 16)
+        for name, struct_value in packed.items():
+            if value == struct_value:
+                slots[slot] = name
+    assert sorted(slots.values()) == sorted(packed)
+    return slots
+
+
+def _struct_reads(tx, auction, slots):
+    # Copying a packed struct to memory may load its slot once per member, so
+    # consecutive loads of a slot in the same function count as one read. A
+    # store or a load of another slot starts a new read.
+    counts = {name: 0 for name in slots.values()}
+    last = None
+    for step in tx.trace:
+        if step["address"] != auction.address or step["op"] not in ("SLOAD", "SSTORE"):
+            continue
+        if step["op"] == "SSTORE":
+            last = None
+            continue
+        slot = int(step["stack"][-1], 16)
+        read = (slot, step["fn"])
+        if slot in slots and read != last:
+            counts[slots[slot]] += 1
+        last = read
+    return counts
+
+
+def test_dutch_auction_commit_struct_reads(request, FixedToken):
+    auction = _deploy_auction(request, "DutchAuction", FixedToken)
+    # Halfway down the price curve, where the price is computed
+    chain.sleep(AUCTION_TIME // 2)
+    chain.mine()
+    bidders = _bidders(2)
+    auction.commitEth(bidders[0], True, {'from': bidders[0], 'value': TENPOW18})
+    slots = _struct_slots(auction)
+
+    auction.commitEth(bidders[1], True, {'from': bidders[1], 'value': TENPOW18})
+    again = auction.commitEth(bidders[1], True, {'from': bidders[1], 'value': TENPOW18})
+
+    # Every market struct is copied from storage once per commit
+    reads = _struct_reads(again, auction, slots)
+    for name, count in COMMIT_STRUCT_READS.items():
+        assert reads[name] == count, name + " read " + str(reads[name]) + " times"
+
+
+#####################################
+# Factories
+#####################################
+
+def test_create_token_gas(gas_baseline, token_factory, fixed_token_template, mintable_token_template):
+    for name, template in [("FixedToken", fixed_token_template), ("MintableToken", mintable_token_template)]:
+        template_id = token_factory.getTemplateId(template)
+        data = get_token_data("Gas Token", "GAS", accounts[0], AUCTION_TOKENS)
+        tx = token_factory.createToken(template_id, accounts[0], data, {'from': accounts[0]})
+        gas_baseline.check("MISOTokenFactory.createToken " + name, tx.gas_used)
+
+
+def test_create_market_gas(gas_baseline, auction_factory, dutch_auction_template, FixedToken):
+    token = _auction_token(FixedToken)
+    token.approve(auction_factory, AUCTION_TOKENS, {'from': accounts[0]})
+    start_time = chain.time() + 100
+    data = get_dutch_auction_data(auction_factory, token, AUCTION_TOKENS, start_time, start_time + AUCTION_TIME,
+                                  ETH_ADDRESS, AUCTION_START_PRICE, AUCTION_RESERVE, accounts[0], ZERO_ADDRESS, accounts[1])
+    template_id = auction_factory.getTemplateId(dutch_auction_template)
+    tx = auction_factory.createMarket(template_id, token, AUCTION_TOKENS, accounts[0], data, {'from': accounts[0]})
+    gas_baseline.check("MISOMarket.createMarket DutchAuction", tx.gas_used)
+
+
+def test_create_farm_gas(gas_baseline, farm_factory, miso_access_controls, FixedToken):
+    rewards = _auction_token(FixedToken)
+    rewards.approve(farm_factory, AUCTION_TOKENS, {'from': accounts[0]})
+    data = get_masterchef_data(rewards, TENPOW18, len(chain) + 10, accounts[4], miso_access_controls)
+    tx = farm_factory.createFarm(1, accounts[4], data, {'from': accounts[0]})
+    gas_baseline.check("MISOFarmFactory.createFarm MISOMasterChef", tx.gas_used)
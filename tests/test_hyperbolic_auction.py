@@ -123,6 +123,26 @@ def test_hyperbolic_auction_auction_not_successful(hyperbolic_auction):
     assert hyperbolic_auction.finalized({'from': accounts[0]}) == False
     assert hyperbolic_auction.auctionSuccessful({'from': accounts[0]}) == False
 
+def test_hyperbolic_auction_alpha_after_update(hyperbolic_auction):
+    def alpha():
+        start_time, end_time, _ = hyperbolic_auction.marketInfo()
+        minimum_price, _ = hyperbolic_auction.marketPrice()
+        return (end_time - start_time) * minimum_price
+
+    assert hyperbolic_auction.marketPrice()[1] == alpha()
+
+    start_time = chain.time() + 100
+    hyperbolic_auction.setAuctionTime(start_time, start_time + 2 * AUCTION_TIME, {"from": accounts[0]})
+    assert hyperbolic_auction.marketPrice()[1] == alpha()
+    hyperbolic_auction.setAuctionPrice(2 * AUCTION_RESERVE, {"from": accounts[0]})
+    assert hyperbolic_auction.marketPrice()[1] == alpha()
+
+    # Ends on the new minimum price
+    chain.sleep(100 + 2 * AUCTION_TIME - 1)
+    chain.mine()
+    assert hyperbolic_auction.priceFunction() >= 2 * AUCTION_RESERVE
+
+
 def test_hyperbolic_auction_commit_Eth_twice(hyperbolic_auction_cal):
     assert hyperbolic_auction_cal.tokensClaimable(accounts[2]) == 0
     token_buyer_a=  accounts[2]
@@ -0,0 +1,72 @@
+from brownie import accounts, web3, chain
+import pytest
+from settings import *
+from scripts.init_data import *
+
+# The local encoders must produce the same bytes as the templates' get*InitData
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+def _auction_times():
+    start_time = chain.time() + 10
+    return start_time, start_time + AUCTION_TIME
+
+
+def test_dutch_auction_data(dutch_auction_template, fixed_token):
+    start_time, end_time = _auction_times()
+    args = [accounts[0], fixed_token, AUCTION_TOKENS, start_time, end_time, ETH_ADDRESS,
+            AUCTION_START_PRICE, AUCTION_RESERVE, accounts[0], ZERO_ADDRESS, accounts[1]]
+    assert get_dutch_auction_data(*args) == bytes(dutch_auction_template.getAuctionInitData(*args))
+
+
+def test_hyperbolic_auction_data(hyperbolic_auction, hyperbolic_auction_token):
+    start_time, end_time = _auction_times()
+    args = [accounts[0], hyperbolic_auction_token, AUCTION_TOKENS, start_time, end_time, ETH_ADDRESS,
+            HYPERBOLIC_AUCTION_FACTOR, AUCTION_RESERVE, accounts[0], ZERO_ADDRESS, accounts[1]]
+    assert get_hyperbolic_auction_data(*args) == bytes(hyperbolic_auction.getAuctionInitData(*args))
+
+
+def test_crowdsale_data(crowdsale_template, mintable_token):
+    start_time, end_time = _auction_times()
+    args = [accounts[0], mintable_token, ETH_ADDRESS, CROWDSALE_TOKENS, start_time, end_time,
+            CROWDSALE_RATE, CROWDSALE_GOAL, accounts[0], ZERO_ADDRESS, accounts[1]]
+    assert get_crowdsale_data(*args) == bytes(crowdsale_template.getCrowdsaleInitData(*args))
+
+
+def test_batch_auction_data(batch_auction, batch_auction_token):
+    start_time, end_time = _auction_times()
+    args = [accounts[0], batch_auction_token, AUCTION_TOKENS, start_time, end_time, ETH_ADDRESS,
+            AUCTION_MINIMUM_COMMITMENT, accounts[0], ZERO_ADDRESS, accounts[1]]
+    assert get_batch_auction_data(*args) == bytes(batch_auction.getBatchAuctionInitData(*args))
+
+
+def test_token_data(fixed_token_template, mintable_token_template, sushi_token_template):
+    args = ["Fixed Token", "FXT", accounts[0], 1000 * TENPOW18]
+    data = get_token_data(*args)
+    assert data == bytes(fixed_token_template.getInitData(*args))
+    assert data == bytes(mintable_token_template.getInitData(*args))
+    assert data == bytes(sushi_token_template.getInitData(*args))
+
+    # Multi-word strings need more than one word of padding
+    args = ["A token name longer than thirty two bytes", "LONG", accounts[1], 0]
+    assert get_token_data(*args) == bytes(fixed_token_template.getInitData(*args))
+
+
+def test_masterchef_data(farm_template, fixed_token, miso_access_controls):
+    args = [fixed_token, 1 * TENPOW18, web3.eth.block_number + 10, accounts[1], miso_access_controls]
+    assert get_masterchef_data(*args) == bytes(farm_template.getInitData(*args))
+
+
+def test_post_auction_launcher_data(post_auction_launcher_template, dutch_auction, uniswap_factory):
+    args = [dutch_auction, uniswap_factory, accounts[0], accounts[1],
+            POOL_LIQUIDITY_PERCENT, POOL_LAUNCH_LOCKTIME]
+    assert get_post_auction_launcher_data(*args) == bytes(post_auction_launcher_template.getLauncherInitData(*args))
+
+
+def test_wrong_number_of_values():
+    with pytest.raises(ValueError):
+        encode_init_data(TOKEN_TYPES, ["Fixed Token", "FXT", accounts[0]])
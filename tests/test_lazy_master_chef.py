@@ -0,0 +1,163 @@
+from brownie import accounts, reverts, chain
+import pytest
+from settings import *
+
+REWARDS_PER_BLOCK = 1 * TENPOW18
+REWARDS_FUNDED = 10000 * TENPOW18
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+@pytest.fixture(scope='module')
+def lazy_farm_template(MISOLazyMasterChef):
+    return MISOLazyMasterChef.deploy({"from": accounts[0]})
+
+
+@pytest.fixture(scope='module')
+def lp_tokens(FixedToken):
+    lp_tokens = []
+    for i in range(3):
+        lp_token = FixedToken.deploy({'from': accounts[0]})
+        lp_token.initToken("LP Token " + str(i), "LPT" + str(i), accounts[0], 3000, {'from': accounts[0]})
+        for j in range(1, 4):
+            lp_token.transfer(accounts[j], 1000, {'from': accounts[0]})
+        lp_tokens.append(lp_token)
+    return lp_tokens
+
+
+@pytest.fixture(scope='module')
+def lazy_template_id(farm_factory, lazy_farm_template):
+    tx = farm_factory.addFarmTemplate(lazy_farm_template, {"from": accounts[0]})
+    template_id = tx.events["FarmTemplateAdded"]["templateId"]
+    assert farm_factory.currentTemplateId(2) == template_id
+    return template_id
+
+
+def _deploy_lazy_farm(Farm, FixedToken, farm_factory, lazy_farm_template, template_id, funded):
+    rewards = FixedToken.deploy({'from': accounts[0]})
+    rewards.initToken("Rewards", "RWD", accounts[0], funded, {'from': accounts[0]})
+    admin = accounts[1]
+    data = lazy_farm_template.getInitData(rewards, REWARDS_PER_BLOCK, len(chain), accounts[4], admin)
+    tx = farm_factory.createFarm(template_id, accounts[4], data, {"from": accounts[0]})
+    farm = Farm.at(tx.events["FarmCreated"]["addr"])
+    rewards.transfer(farm, funded, {'from': accounts[0]})
+    farm.addOperatorRole(admin, {"from": admin})
+    return farm, rewards
+
+
+@pytest.fixture(scope='module')
+def lazy_farm(MISOLazyMasterChef, FixedToken, farm_factory, lazy_farm_template, lazy_template_id, lp_tokens):
+    farm, _ = _deploy_lazy_farm(MISOLazyMasterChef, FixedToken, farm_factory, lazy_farm_template, lazy_template_id, REWARDS_FUNDED)
+    admin = accounts[1]
+
+    farm.addToken(100, lp_tokens[0], False, {"from": admin})
+    farm.addToken(300, lp_tokens[1], False, {"from": admin})
+    for pid in range(2):
+        lp_tokens[pid].approve(farm, 1000, {'from': accounts[pid + 2]})
+        farm.deposit(pid, 100, {'from': accounts[pid + 2]})
+    return farm
+
+
+def _pending_over(farm, pid, user, blocks):
+    before = farm.pendingRewards(pid, user)
+    chain.mine(blocks)
+    return farm.pendingRewards(pid, user) - before
+
+
+def test_lazy_farm_rewards(lazy_farm):
+    assert _pending_over(lazy_farm, 0, accounts[2], 10) == 10 * REWARDS_PER_BLOCK // 4
+    assert _pending_over(lazy_farm, 1, accounts[3], 10) == 10 * REWARDS_PER_BLOCK * 3 // 4
+
+    # Harvest pays out the blocks since the last harvest
+    lazy_farm.deposit(0, 0, {'from': accounts[2]})
+    chain.mine(10)
+    tx = lazy_farm.deposit(0, 0, {'from': accounts[2]})
+    assert tx.events["Transfer"]["value"] == 11 * REWARDS_PER_BLOCK // 4
+
+
+def test_lazy_farm_set_alloc(lazy_farm, lp_tokens):
+    settled_block = lazy_farm.deposit(1, 0, {'from': accounts[3]}).block_number
+
+    lazy_farm.set(0, 300, False, {"from": accounts[1]})
+    # The other pool is not touched, but keeps what it earned at the old allocation
+    assert lazy_farm.poolInfo(1)[2] == settled_block
+    tx = lazy_farm.deposit(1, 0, {'from': accounts[3]})
+    assert tx.events["Transfer"]["value"] == REWARDS_PER_BLOCK * 3 // 4 + REWARDS_PER_BLOCK // 2
+    assert lazy_farm.totalAllocPoint() == 600
+
+    assert _pending_over(lazy_farm, 0, accounts[2], 10) == 10 * REWARDS_PER_BLOCK // 2
+    assert _pending_over(lazy_farm, 1, accounts[3], 10) == 10 * REWARDS_PER_BLOCK // 2
+
+    # With an update every pool is settled, as on MISOMasterChef
+    tx = lazy_farm.set(1, 300, True, {"from": accounts[1]})
+    assert lazy_farm.poolInfo(0)[2] == tx.block_number
+    assert lazy_farm.lastAccRewardsPerAllocPoint(0) == lazy_farm.accRewardsPerAllocPoint()
+
+    with reverts("MasterChef.set: Sender must be admin"):
+        lazy_farm.set(0, 100, False, {"from": accounts[2]})
+
+
+def test_lazy_farm_add_token(lazy_farm, lp_tokens):
+    lazy_farm.addToken(400, lp_tokens[2], False, {"from": accounts[1]})
+    assert lazy_farm.lastAccRewardsPerAllocPoint(2) == lazy_farm.accRewardsPerAllocPoint()
+    # The new pool has no stake yet, its share is not paid to anyone
+    assert _pending_over(lazy_farm, 0, accounts[2], 8) == 8 * REWARDS_PER_BLOCK // 8
+
+    lp_tokens[2].approve(lazy_farm, 1000, {'from': accounts[1]})
+    lazy_farm.deposit(2, 100, {'from': accounts[1]})
+    assert _pending_over(lazy_farm, 2, accounts[1], 8) == 8 * REWARDS_PER_BLOCK // 2
+
+    lazy_farm.withdraw(2, 100, {'from': accounts[1]})
+    assert lp_tokens[2].balanceOf(accounts[1]) == 1000
+    assert lazy_farm.pendingRewards(2, accounts[1]) == 0
+    assert lazy_farm.getUserPids(accounts[1]) == []
+    assert lazy_farm.getUserPids(accounts[2]) == [0]
+
+
+def test_lazy_farm_idle_pools_run_out(MISOLazyMasterChef, FixedToken, farm_factory, lazy_farm_template, lazy_template_id, lp_tokens):
+    funded = 60 * REWARDS_PER_BLOCK
+    farm, rewards = _deploy_lazy_farm(MISOLazyMasterChef, FixedToken, farm_factory, lazy_farm_template, lazy_template_id, funded)
+    for pid in range(3):
+        farm.addToken(100, lp_tokens[pid], False, {"from": accounts[1]})
+    for pid in range(3):
+        lp_tokens[pid].approve(farm, 1000, {'from': accounts[pid + 1]})
+        farm.deposit(pid, 100, {'from': accounts[pid + 1]})
+
+    # Only the first pool is ever settled, the other two sit idle past the end of funding
+    for i in range(10):
+        chain.mine(10)
+        farm.deposit(0, 0, {'from': accounts[1]})
+        assert farm.tokenDebt() <= rewards.balanceOf(farm)
+    assert farm.blocksRemaining() == 0
+
+    # Every staker is paid in full, the last one included
+    for pid in range(3):
+        user = accounts[pid + 1]
+        pending = farm.pendingRewards(pid, user)
+        assert pending > 0
+        before = rewards.balanceOf(user)
+        farm.withdraw(pid, 100, {'from': user})
+        assert rewards.balanceOf(user) - before == pending
+        assert farm.tokenDebt() <= rewards.balanceOf(farm)
+    assert sum(rewards.balanceOf(accounts[i]) for i in range(1, 4)) <= funded
+
+
+def test_lazy_farm_empty_pool_tips(MISOLazyMasterChef, MISOMasterChef, FixedToken, farm_factory, lazy_farm_template, lazy_template_id, lp_tokens):
+    chef_template_id = farm_factory.currentTemplateId(1)
+    for Farm, template_id in [(MISOLazyMasterChef, lazy_template_id), (MISOMasterChef, chef_template_id)]:
+        farm, _ = _deploy_lazy_farm(Farm, FixedToken, farm_factory, lazy_farm_template, template_id, REWARDS_FUNDED)
+        farm.setDevPercentage(100, {"from": accounts[4]})
+        farm.addToken(100, lp_tokens[0], False, {"from": accounts[1]})
+        farm.addToken(300, lp_tokens[1], False, {"from": accounts[1]})
+        lp_tokens[0].approve(farm, 1000, {'from': accounts[2]})
+        deposit_block = farm.deposit(0, 100, {'from': accounts[2]}).block_number
+
+        # Only the staked pool is tipped, the empty pool's rewards and tips stay with the farm
+        chain.mine(10)
+        tx = farm.massUpdatePools({'from': accounts[2]})
+        staked_rewards = (tx.block_number - deposit_block) * REWARDS_PER_BLOCK // 4
+        assert farm.totalRewardDebt() == staked_rewards
+        assert farm.tips() == staked_rewards * 100 // 1000
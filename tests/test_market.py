@@ -285,5 +285,21 @@ def test_market_init_again(auction_factory,bento_box,miso_access_controls,dutch_
     with reverts():
         auction_factory.initMISOMarket(miso_access_controls,bento_box, [dutch_auction_template], {'from': accounts[0]})
 
+def test_market_template_auctions(auction_factory, dutch_auction_template, crowdsale_template, fixed_token_cal):
+    dutch_template_id = auction_factory.getTemplateId(dutch_auction_template)
+    crowdsale_template_id = auction_factory.getTemplateId(crowdsale_template)
+    start_time = chain.time() + 20
+    end_time = start_time + AUCTION_TIME
+    fixed_token_cal.approve(auction_factory, AUCTION_TOKENS, {"from": accounts[0]})
 
-
+    markets = []
+    for _ in range(2):
+        _data = dutch_auction_template.getAuctionInitData(
+            auction_factory, fixed_token_cal, AUCTION_TOKENS // 2, start_time, end_time, ETH_ADDRESS,
+            AUCTION_START_PRICE, AUCTION_RESERVE, accounts[0], ZERO_ADDRESS, accounts[1], {"from": accounts[0]})
+        tx = auction_factory.createMarket(dutch_template_id, fixed_token_cal, AUCTION_TOKENS // 2, accounts[1], _data, {"from": accounts[0]})
+        markets.append(tx.return_value)
+
+    assert auction_factory.numberOfTemplateAuctions(dutch_template_id) == 2
+    assert [auction_factory.templateAuctions(dutch_template_id, i) for i in range(2)] == markets
+    assert auction_factory.numberOfTemplateAuctions(crowdsale_template_id) == 0
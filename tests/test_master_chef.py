@@ -8,6 +8,11 @@ from settings import *
 TOKEN_1_AMOUNT = 10000
 TOTAL_LP_AMOUNT = 10000000000
 
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
 @pytest.fixture(scope='function')
 def token_1(FixedToken):
     token = FixedToken.deploy({'from': accounts[0]})
@@ -83,3 +88,57 @@ def test_emergencyWithdraw(farm, fake_lp_token):
 
     farm.emergencyWithdraw(0, {'from': accounts[1]})
     assert fake_lp_token.balanceOf(accounts[1]) == 1000
+
+
+@pytest.fixture(scope='function')
+def two_pool_farm(MISOMasterChef, FixedToken, farm_factory, farm_template, fake_lp_token):
+    rewards = FixedToken.deploy({'from': accounts[0]})
+    rewards.initToken("Rewards", "RWD", accounts[0], 10000 * TENPOW18, {'from': accounts[0]})
+    lp_token_2 = FixedToken.deploy({'from': accounts[0]})
+    lp_token_2.initToken("LP Token 2", "LPT2", accounts[0], TOTAL_LP_AMOUNT, {'from': accounts[0]})
+    lp_token_2.transfer(accounts[1], 1000, {'from': accounts[0]})
+
+    admin = accounts[1]
+    data = farm_template.getInitData(rewards, TENPOW18, len(chain), accounts[4], admin)
+    tx = farm_factory.createFarm(1, accounts[4], data, {"from": accounts[0]})
+    farm = MISOMasterChef.at(tx.events["FarmCreated"]["addr"])
+    rewards.transfer(farm, 10000 * TENPOW18, {'from': accounts[0]})
+    farm.addToken(100, fake_lp_token, True, {"from": admin})
+    farm.addToken(100, lp_token_2, True, {"from": admin})
+
+    fake_lp_token.approve(farm, 1000, {'from': accounts[1]})
+    lp_token_2.approve(farm, 1000, {'from': accounts[1]})
+    return farm, rewards, lp_token_2
+
+
+def test_depositMany_harvestMany(two_pool_farm, fake_lp_token):
+    farm, rewards, lp_token_2 = two_pool_farm
+    farm.depositMany([0, 1], [100, 200], {'from': accounts[1]})
+    assert farm.userInfo(0, accounts[1])[0] == 100
+    assert farm.userInfo(1, accounts[1])[0] == 200
+
+    chain.mine(10)
+    tx = farm.harvestMany([0, 1], {'from': accounts[1]})
+    # Both pools earned half the rewards of 11 blocks, paid in one transfer
+    assert len(tx.events["Transfer"]) == 1
+    assert tx.events["Transfer"]["value"] == 11 * TENPOW18
+    assert rewards.balanceOf(accounts[1]) == 11 * TENPOW18
+    assert farm.pendingRewards(0, accounts[1]) == 0
+
+    tx = farm.withdrawMany([0, 1], [100, 200], {'from': accounts[1]})
+    assert fake_lp_token.balanceOf(accounts[1]) == 1000
+    assert lp_token_2.balanceOf(accounts[1]) == 1000
+    assert tx.events["Transfer"][-1]["value"] == TENPOW18
+
+    with reverts("MasterChef.withdrawMany: Array lengths must match"):
+        farm.withdrawMany([0, 1], [0], {'from': accounts[1]})
+    with reverts("withdraw: not good"):
+        farm.withdrawMany([0], [1], {'from': accounts[1]})
+
+
+def test_batch(two_pool_farm, fake_lp_token):
+    farm, _, lp_token_2 = two_pool_farm
+    calls = [farm.deposit.encode_input(0, 100), farm.depositMany.encode_input([1], [100])]
+    farm.batch(calls, True, {'from': accounts[1]})
+    assert fake_lp_token.balanceOf(accounts[1]) == 900
+    assert lp_token_2.balanceOf(accounts[1]) == 900
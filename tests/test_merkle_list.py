@@ -0,0 +1,142 @@
+from brownie import accounts, reverts, chain
+import json
+import pytest
+from settings import *
+from scripts.merkle_list import build_from_csv, write_proofs, leaf_hash, verify
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+def _allowlist():
+    return [(accounts[i], i * TENPOW18) for i in range(2, 9)]
+
+
+@pytest.fixture(scope='module')
+def allowlist(tmp_path_factory):
+    path = tmp_path_factory.mktemp("merkle_list") / "allowlist.csv"
+    with open(path, "w") as f:
+        f.write("account,points\n")
+        for account, points in _allowlist():
+            f.write("{},{}\n".format(account, points))
+    tree = build_from_csv(path)
+    proofs_path = path.with_name("proofs.jsonl")
+    write_proofs(path, tree, proofs_path)
+    with open(proofs_path) as f:
+        proofs = {row["account"]: row["proof"] for row in map(json.loads, f)}
+    return tree, proofs
+
+
+@pytest.fixture(scope='module')
+def list_factory(ListFactory, MerkleList, PointList, miso_access_controls):
+    list_factory = ListFactory.deploy({"from": accounts[0]})
+    list_factory.initListFactory(miso_access_controls, PointList.deploy({"from": accounts[0]}), 0, {"from": accounts[0]})
+    list_factory.setMerkleListTemplate(MerkleList.deploy({"from": accounts[0]}), {"from": accounts[0]})
+    return list_factory
+
+
+@pytest.fixture(scope='module')
+def merkle_list(MerkleList, list_factory, allowlist):
+    tree, _ = allowlist
+    tx = list_factory.deployMerkleList(accounts[0], tree.root, {"from": accounts[0]})
+    assert "PointListDeployed" in tx.events
+    merkle_list = MerkleList.at(tx.return_value)
+    assert list_factory.isChild(merkle_list)
+    return merkle_list
+
+
+@pytest.fixture(scope='module')
+def dutch_auction_merkle(DutchAuction, FixedToken, merkle_list):
+    token = FixedToken.deploy({"from": accounts[0]})
+    token.initToken("Merkle Token", "MRK", accounts[0], AUCTION_TOKENS, {"from": accounts[0]})
+    auction = DutchAuction.deploy({"from": accounts[0]})
+    token.approve(auction, AUCTION_TOKENS, {"from": accounts[0]})
+    start_time = chain.time() + 10
+    auction.initAuction(accounts[0], token, AUCTION_TOKENS, start_time, start_time + AUCTION_TIME, ETH_ADDRESS,
+                        AUCTION_START_PRICE, AUCTION_RESERVE, accounts[0], merkle_list, accounts[1], {"from": accounts[0]})
+    chain.sleep(10)
+    return auction
+
+
+def test_proofs(allowlist):
+    tree, proofs = allowlist
+    assert len(tree) == len(_allowlist())
+    for account, points in _allowlist():
+        assert verify([bytes.fromhex(node[2:]) for node in proofs[str(account)]], tree.root, leaf_hash(account, points))
+    assert not verify([bytes.fromhex(node[2:]) for node in proofs[str(accounts[2])]], tree.root, leaf_hash(accounts[2], 1))
+
+
+def test_prove_points(merkle_list, allowlist):
+    _, proofs = allowlist
+    account, points = _allowlist()[3]
+    assert merkle_list.hasPoints(account, 1) == False
+
+    tx = merkle_list.provePoints(account, points, proofs[str(account)], {"from": accounts[9]})
+    assert "PointsUpdated" in tx.events
+    assert merkle_list.points(account) == points
+    assert merkle_list.totalPoints() == points
+    assert merkle_list.hasPoints(account, points) == True
+    assert merkle_list.isInList(account) == True
+
+    # Proven points are kept, the proof is not checked again
+    tx = merkle_list.provePoints(account, points, [], {"from": accounts[9]})
+    assert "PointsUpdated" not in tx.events
+
+    with reverts("MerkleList.provePoints: Invalid proof"):
+        merkle_list.provePoints(account, points + 1, proofs[str(account)], {"from": accounts[9]})
+    with reverts("MerkleList.provePoints: Invalid proof"):
+        merkle_list.provePoints(accounts[9], points, proofs[str(account)], {"from": accounts[9]})
+
+
+def test_set_merkle_root(merkle_list):
+    with reverts("MerkleList.setMerkleRoot: Sender must be operator"):
+        merkle_list.setMerkleRoot(leaf_hash(accounts[9], 5), {"from": accounts[9]})
+    # A tree of a single leaf has an empty proof
+    merkle_list.setMerkleRoot(leaf_hash(accounts[9], 5), {"from": accounts[0]})
+    merkle_list.provePoints(accounts[9], 5, [], {"from": accounts[9]})
+    assert merkle_list.points(accounts[9]) == 5
+
+    with reverts("MerkleList.setPoints: Sender must be operator"):
+        merkle_list.setPoints([accounts[9]], [0], {"from": accounts[9]})
+    merkle_list.setPoints([accounts[9]], [0], {"from": accounts[0]})
+    assert merkle_list.totalPoints() == 0
+
+
+def test_prove_after_set_points(merkle_list, allowlist):
+    _, proofs = allowlist
+    account, points = _allowlist()[1]
+    # Raised by an operator, a proof of the tree value does not lower it
+    merkle_list.setPoints([account], [points * 2], {"from": accounts[0]})
+    tx = merkle_list.provePoints(account, points, proofs[str(account)], {"from": accounts[9]})
+    assert "PointsUpdated" not in tx.events
+    assert merkle_list.points(account) == points * 2
+
+    # Lowered by an operator, the proof raises it back to the tree value
+    merkle_list.setPoints([account], [1], {"from": accounts[0]})
+    merkle_list.provePoints(account, points, proofs[str(account)], {"from": accounts[9]})
+    assert merkle_list.points(account) == points
+    assert merkle_list.totalPoints() == points
+
+
+def test_init_twice(merkle_list):
+    with reverts("Already initialised"):
+        merkle_list.initMerkleList(accounts[0], bytes(32), {"from": accounts[0]})
+
+
+def test_commit_eth_with_proof(dutch_auction_merkle, allowlist):
+    _, proofs = allowlist
+    account, points = _allowlist()[0]
+    commitment = points // 2
+
+    with reverts():
+        dutch_auction_merkle.commitEth(account, True, {"from": account, "value": commitment})
+    dutch_auction_merkle.commitEthWithProof(account, points, proofs[str(account)], True, {"from": account, "value": commitment})
+    assert dutch_auction_merkle.commitments(account) == commitment
+
+    # The second commit uses the proven points
+    dutch_auction_merkle.commitEth(account, True, {"from": account, "value": commitment})
+    assert dutch_auction_merkle.commitments(account) == points
+    with reverts():
+        dutch_auction_merkle.commitEth(account, True, {"from": account, "value": 1})
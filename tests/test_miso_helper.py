@@ -152,6 +152,56 @@ def test_getMarkets(miso_helper, auction_factory, dutch_auction_template, fixed_
     print("markets:", markets)
     
 
+def _create_dutch_market(auction_factory, dutch_auction_template, FixedToken, start_date):
+    token = FixedToken.deploy({'from': accounts[0]})
+    token.initToken("Helper Token", "HP", accounts[0], AUCTION_TOKENS, {'from': accounts[0]})
+    token.approve(auction_factory, AUCTION_TOKENS, {"from": accounts[0]})
+    _data = dutch_auction_template.getAuctionInitData(
+        auction_factory, token, AUCTION_TOKENS, start_date, start_date + AUCTION_TIME, ETH_ADDRESS,
+        AUCTION_START_PRICE, AUCTION_RESERVE, accounts[0], ZERO_ADDRESS, accounts[1], {"from": accounts[0]})
+    template_id = auction_factory.getTemplateId(dutch_auction_template)
+    return auction_factory.createMarket(template_id, token, AUCTION_TOKENS, accounts[1], _data, {"from": accounts[0]}).return_value
+
+
+def test_getMarketsByTemplate(miso_helper, auction_factory, dutch_auction_template, crowdsale_template, FixedToken):
+    markets = [_create_dutch_market(auction_factory, dutch_auction_template, FixedToken, chain.time() + 20) for _ in range(3)]
+    template_id = auction_factory.getTemplateId(dutch_auction_template)
+
+    assert [info[0] for info in miso_helper.getMarketsByTemplate(template_id, 10, 0, 0)] == markets
+    assert [info[0] for info in miso_helper.getMarketsByTemplate(template_id, 2, 1, 0)] == markets[2:]
+    assert miso_helper.getMarketsByTemplate(auction_factory.getTemplateId(crowdsale_template), 10, 0, 0) == []
+
+
+def test_getMarketsByLifecycle(miso_helper, auction_factory, dutch_auction_template, FixedToken, DutchAuction):
+    upcoming = _create_dutch_market(auction_factory, dutch_auction_template, FixedToken, chain.time() + 10 * AUCTION_TIME)
+    live = [_create_dutch_market(auction_factory, dutch_auction_template, FixedToken, chain.time() + 20) for _ in range(3)]
+    DutchAuction.at(live[1]).cancelAuction({"from": accounts[0]})
+    chain.sleep(30)
+    chain.mine()
+    template_id = auction_factory.getTemplateId(dutch_auction_template)
+    UPCOMING, LIVE, ENDED, FINALIZED = range(4)
+
+    infos, cursor = miso_helper.getMarketsByLifecycle(template_id, LIVE, 0, 10)
+    assert [info[0] for info in infos] == [live[0], live[2]]
+    assert cursor == 4
+    infos, cursor = miso_helper.getMarketsByLifecycle(template_id, UPCOMING, 0, 10)
+    assert [info[0] for info in infos] == [upcoming]
+    infos, cursor = miso_helper.getMarketsByLifecycle(template_id, FINALIZED, 0, 10)
+    assert [info[0] for info in infos] == [live[1]]
+
+    # Pages resume from the cursor and stop scanning once full
+    infos, cursor = miso_helper.getMarketsByLifecycle(template_id, LIVE, 0, 1)
+    assert [info[0] for info in infos] == [live[0]]
+    assert cursor == 2
+    infos, cursor = miso_helper.getMarketsByLifecycle(template_id, LIVE, cursor, 1)
+    assert [info[0] for info in infos] == [live[2]]
+
+    chain.sleep(AUCTION_TIME + 10)
+    chain.mine()
+    infos, cursor = miso_helper.getMarketsByLifecycle(0, ENDED, 0, 10)
+    assert [info[0] for info in infos] == [live[0], live[2]]
+
+
 def test_getDutchAuctionInfo(miso_helper, dutch_auction):
     dutch_auction_info = miso_helper.getDutchAuctionInfo(dutch_auction)
     print("dutch_auction_info:", dutch_auction_info)
@@ -166,11 +216,36 @@ def test_getHyperbolicAuctionInfo(miso_helper, hyperbolic_auction):
     hyperbolic_auction_info = miso_helper.getHyperbolicAuctionInfo(hyperbolic_auction)
     print("hyperbolic_auction_info:", hyperbolic_auction_info)
 
+def test_getMarketInfos(miso_helper, crowdsale, dutch_auction, batch_auction, hyperbolic_auction):
+    markets = [dutch_auction, crowdsale, hyperbolic_auction, batch_auction, dutch_auction]
+    templates, crowdsales, dutch_auctions, batch_auctions, hyperbolic_auctions = miso_helper.getMarketInfos(markets, True)
+
+    assert templates == [2, 1, 4, 3, 2]
+    assert crowdsales == [miso_helper.getCrowdsaleInfo(crowdsale)]
+    assert dutch_auctions == [miso_helper.getDutchAuctionInfo(dutch_auction)] * 2
+    assert batch_auctions == [miso_helper.getBatchAuctionInfo(batch_auction)]
+    assert hyperbolic_auctions == [miso_helper.getHyperbolicAuctionInfo(hyperbolic_auction)]
+
+    # Without documents only the documents are left out
+    templates, crowdsales, dutch_auctions, batch_auctions, hyperbolic_auctions = miso_helper.getMarketInfos(markets, False)
+    assert dutch_auctions[0][-1] == []
+    assert dutch_auctions[0][:-1] == miso_helper.getDutchAuctionInfo(dutch_auction)[:-1]
+
+    # Anything that is not a market reverts
+    with reverts():
+        miso_helper.getMarketInfos([miso_helper], False)
+
+
 def test_getFarms(miso_helper, create_farm):
     farms = miso_helper.getFarms()
 
     print("farms:", farms)
 
+def test_getFarmsByTemplate(miso_helper, create_farm):
+    farms = miso_helper.getFarmsByTemplate(1, 10, 0, 0)
+    assert [farm[0] for farm in farms] == [create_farm]
+    assert miso_helper.getFarmsByTemplate(2, 10, 0, 0) == []
+
 def test_getFarmDetail(miso_helper, create_farm):
     farm_info_user_0 = miso_helper.getFarmDetail(create_farm, accounts[0])
     farm_info_user_1 = miso_helper.getFarmDetail(create_farm, accounts[1])
@@ -178,10 +253,22 @@ def test_getFarmDetail(miso_helper, create_farm):
     print("farm_info_user_0:", farm_info_user_0)
     print("farm_info_user_1:", farm_info_user_1)
 
-def test_getUserPoolsInfos(miso_helper):
-    user_pool_infos = miso_helper.getUserPoolsInfos(accounts[0])
-
-    print("user_pools_infos:", user_pool_infos)
+def test_getUserPoolsInfos(miso_helper, create_farm, farm_factory):
+    # Only the farms and pools the user has staked in
+    assert miso_helper.getUserPoolsInfos(accounts[0]) == []
+    user_pool_infos = miso_helper.getUserPoolsInfos(accounts[1])
+    assert len(user_pool_infos) == 1
+    assert user_pool_infos[0][:3] == (create_farm, [0], [100*TENPOW18])
+    assert farm_factory.getUserFarms(accounts[2]) == [create_farm]
+
+    create_farm.withdraw(0, 100*TENPOW18, {'from': accounts[1]})
+    assert create_farm.getUserPids(accounts[1]) == []
+    assert miso_helper.getUserPoolsInfos(accounts[1]) == []
+    create_farm.emergencyWithdraw(0, {'from': accounts[2]})
+    assert farm_factory.getUserFarms(accounts[2]) == []
+
+    with reverts("MISOFarmFactory: Sender must be a farm"):
+        farm_factory.addUserFarm(accounts[1], {'from': accounts[1]})
 
 def test_getUserMarketInfo(miso_helper, crowdsale):
     crowdsale.commitEth(accounts[0], True, {"from": accounts[0], "value": 2*TENPOW18})
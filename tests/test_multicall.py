@@ -0,0 +1,72 @@
+from brownie import accounts, reverts, Contract
+import pytest
+from settings import *
+from scripts.multicall import MulticallClient
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+@pytest.fixture(scope='module')
+def multicall(Multicall):
+    return Multicall.deploy({'from': accounts[0]})
+
+
+def test_aggregate(multicall, fixed_token, dutch_auction):
+    calls = [(fixed_token, fixed_token.balanceOf.encode_input(dutch_auction)),
+             (dutch_auction, dutch_auction.marketInfo.encode_input())]
+    block_number, results = multicall.aggregate.call(calls)
+
+    assert block_number == multicall.getBlockNumber()
+    assert fixed_token.balanceOf.decode_output(results[0]) == fixed_token.balanceOf(dutch_auction)
+    assert dutch_auction.marketInfo.decode_output(results[1]) == dutch_auction.marketInfo()
+
+
+def test_try_aggregate(multicall, fixed_token, dutch_auction):
+    # finalize() reverts before the auction has ended
+    calls = [(dutch_auction, dutch_auction.finalize.encode_input()),
+             (fixed_token, fixed_token.totalSupply.encode_input())]
+    (failed, _), (success, data) = multicall.tryAggregate.call(False, calls)
+    assert failed == False
+    assert success == True
+    assert fixed_token.totalSupply.decode_output(data) == fixed_token.totalSupply()
+
+    with reverts("Multicall: call failed"):
+        multicall.tryAggregate.call(True, calls)
+    with reverts("Multicall: call failed"):
+        multicall.aggregate.call(calls)
+
+
+def test_client_read(multicall, fixed_token, dutch_auction, batch_auction, auction_factory, dutch_auction_template):
+    client = MulticallClient(multicall, batch_size=2)
+    calls = [
+        (dutch_auction.marketInfo, ()),
+        (batch_auction.marketInfo, ()),
+        (fixed_token.balanceOf, (dutch_auction,)),
+        (auction_factory.getTemplateId, (dutch_auction_template,)),
+        (dutch_auction.marketInfo, ()),
+    ]
+    expected = [fn(*args) for fn, args in calls]
+    assert client.read(calls) == expected
+    # Four distinct calls in batches of two
+    assert client.eth_calls == 2
+
+    # Nothing new is sent within the same block
+    assert client.read(calls[:2]) == expected[:2]
+    assert client.eth_calls == 2
+
+    # A new block invalidates the results
+    dutch_auction.commitEth(accounts[2], True, {'from': accounts[2], 'value': TENPOW18})
+    assert client.read(calls[:1]) == [dutch_auction.marketInfo()]
+    assert client.eth_calls == 3
+
+
+def test_client_read_failed_call(multicall, DutchAuction, fixed_token, dutch_auction):
+    client = MulticallClient(multicall)
+    not_an_auction = Contract.from_abi("NotAnAuction", fixed_token.address, DutchAuction.abi)
+    calls = [(not_an_auction.marketInfo, ()), (dutch_auction.marketInfo, ())]
+    assert client.read(calls, require_success=False) == [None, dutch_auction.marketInfo()]
+    with pytest.raises(ValueError):
+        client.read(calls)
@@ -0,0 +1,66 @@
+from brownie import accounts
+import json
+import pytest
+from settings import *
+from scripts.multicall import MulticallClient
+from scripts.point_list_loader import PointListLoader, checkpoint_path
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+@pytest.fixture(scope='module')
+def multicall(Multicall):
+    return Multicall.deploy({'from': accounts[0]})
+
+
+def _write_csv(path, rows):
+    with open(path, "w") as f:
+        f.write("account,points\n")
+        for account, points in rows:
+            f.write("{},{}\n".format(account, points))
+
+
+def _loader(point_list, path, multicall):
+    # Small chunks and reads so the list is loaded in several of each
+    return PointListLoader(point_list, str(path), accounts[0], client=MulticallClient(multicall),
+                           target_gas=250000, sample_size=2, read_batch_size=3, max_pending=2)
+
+
+def test_point_list_loader(point_list, multicall, tmp_path):
+    rows = [(accounts[i], i * 10) for i in range(1, 10)]
+    # Two rows are on chain already
+    point_list.setPoints([accounts[1], accounts[2]], [10, 20], {"from": accounts[0]})
+    path = tmp_path / "allowlist.csv"
+    _write_csv(path, rows)
+
+    loader = _loader(point_list, path, multicall)
+    assert loader.load() == 7
+    assert loader.unchanged == 2
+    assert len(loader.transactions) > 1
+    for account, points in rows:
+        assert point_list.points(account) == points
+    assert point_list.totalPoints() == sum(points for _, points in rows)
+    with open(checkpoint_path(str(path), point_list)) as f:
+        assert json.load(f)["rows_done"] == len(rows)
+
+    # Nothing is left to write
+    assert _loader(point_list, path, multicall).load() == 0
+
+
+def test_point_list_loader_resume(point_list, multicall, tmp_path):
+    rows = [(accounts[i], i * 10) for i in range(1, 10)]
+    path = tmp_path / "allowlist.csv"
+    _write_csv(path, rows)
+    # A previous run confirmed the first five rows
+    point_list.setPoints([account for account, _ in rows[:5]], [points for _, points in rows[:5]], {"from": accounts[0]})
+    with open(checkpoint_path(str(path), point_list), "w") as f:
+        json.dump({"rows_done": 5}, f)
+
+    loader = _loader(point_list, path, multicall)
+    assert loader.load() == 4
+    assert loader.unchanged == 0
+    for account, points in rows:
+        assert point_list.points(account) == points
@@ -0,0 +1,76 @@
+from brownie import accounts, chain
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import pytest
+from settings import *
+from scripts.read_cache import ReadCache
+
+# reset the chain after every test case
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+@pytest.fixture(scope='module')
+def miso_helper(MISOHelper, miso_access_controls, token_factory, auction_factory, launcher, farm_factory):
+    return MISOHelper.deploy(miso_access_controls, token_factory, auction_factory, launcher, farm_factory, {"from": accounts[0]})
+
+
+def test_read_cache(miso_helper, dutch_auction):
+    cache = ReadCache(block_poll_interval=0)
+    tokens = miso_helper.getTokens()
+    assert cache.call(miso_helper.getTokens) == tokens
+    assert cache.call(miso_helper.getTokens) == tokens
+    assert cache.call(dutch_auction.marketInfo) == dutch_auction.marketInfo()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # A new block invalidates the results
+    dutch_auction.commitEth(accounts[2], True, {'from': accounts[2], 'value': TENPOW18})
+    assert cache.call(dutch_auction.marketStatus) == dutch_auction.marketStatus()
+    assert cache.call(miso_helper.getTokens) == tokens
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    # Reads at an older block are kept apart from the latest
+    block = chain.height - 1
+    assert cache.call(dutch_auction.marketStatus, block_identifier=block) == \
+        dutch_auction.marketStatus(block_identifier=block)
+    assert cache.misses == 5
+
+
+def test_read_cache_lru(fixed_token, dutch_auction, batch_auction):
+    cache = ReadCache(max_size=2, block_poll_interval=0)
+    cache.call(fixed_token.balanceOf, dutch_auction)
+    cache.call(fixed_token.balanceOf, batch_auction)
+    cache.call(fixed_token.balanceOf, dutch_auction)
+    # Evicts the balance of the batch auction, the least recently used
+    cache.call(fixed_token.totalSupply)
+    assert (cache.hits, cache.misses) == (1, 3)
+    cache.call(fixed_token.balanceOf, dutch_auction)
+    cache.call(fixed_token.balanceOf, batch_auction)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_read_cache_coalesces_callers():
+    cache = ReadCache()
+    calls = []
+    release = threading.Event()
+
+    def slow_read(value, block_identifier=None):
+        calls.append(block_identifier)
+        release.wait()
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(cache.call, slow_read, 21) for _ in range(8)]
+        try:
+            # Wait for every caller to join the request in flight
+            deadline = time.monotonic() + 10
+            while cache.hits + cache.misses < 8 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert cache.hits + cache.misses == 8
+        finally:
+            release.set()
+        assert [future.result() for future in futures] == [42] * 8
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (7, 1)